@@ -0,0 +1,78 @@
+package li.rajeshgo.sm.data.remote
+
+import okhttp3.Interceptor
+import okhttp3.MediaType
+import okhttp3.Response
+import okhttp3.ResponseBody.Companion.toResponseBody
+
+/**
+ * Revalidates GETs of endpoints that send an ETag (the session lists) with
+ * If-None-Match, and turns a 304 back into the cached 200 for Retrofit.
+ */
+class ETagInterceptor(
+    private val cache: ETagCache = ETagCache.shared,
+) : Interceptor {
+    override fun intercept(chain: Interceptor.Chain): Response {
+        val request = chain.request()
+        if (request.method != "GET") {
+            return chain.proceed(request)
+        }
+        val key = "${request.header("Authorization").orEmpty()} ${request.url}"
+        val cached = cache.get(key)
+        val conditional = if (cached != null) {
+            request.newBuilder()
+                .header("If-None-Match", cached.etag)
+                .build()
+        } else {
+            request
+        }
+        val response = chain.proceed(conditional)
+        if (response.code == 304 && cached != null) {
+            response.close()
+            return response.newBuilder()
+                .code(200)
+                .message("OK")
+                .body(cached.body.toResponseBody(cached.contentType))
+                .build()
+        }
+        val etag = response.header("ETag")
+        val body = response.body
+        if (response.code != 200 || etag.isNullOrBlank() || body == null) {
+            return response
+        }
+        val contentType = body.contentType()
+        val bytes = body.bytes()
+        cache.put(key, ETagCache.Entry(etag, bytes, contentType))
+        return response.newBuilder()
+            .body(bytes.toResponseBody(contentType))
+            .build()
+    }
+}
+
+class ETagCache(
+    private val maxEntries: Int = 16,
+) {
+    class Entry(
+        val etag: String,
+        val body: ByteArray,
+        val contentType: MediaType?,
+    )
+
+    private val entries = object : LinkedHashMap<String, Entry>(16, 0.75f, true) {
+        override fun removeEldestEntry(eldest: MutableMap.MutableEntry<String, Entry>?): Boolean =
+            size > maxEntries
+    }
+
+    @Synchronized
+    fun get(key: String): Entry? = entries[key]
+
+    @Synchronized
+    fun put(key: String, entry: Entry) {
+        entries[key] = entry
+    }
+
+    companion object {
+        // Clients are built per call; the cache outlives them.
+        val shared = ETagCache()
+    }
+}
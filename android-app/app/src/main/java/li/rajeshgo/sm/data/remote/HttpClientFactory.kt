@@ -39,6 +39,7 @@ class HttpClientFactory(
             .connectTimeout(connectTimeoutSeconds, TimeUnit.SECONDS)
             .readTimeout(readTimeoutSeconds, TimeUnit.SECONDS)
             .addInterceptor(AuthInterceptor { token })
+            .addInterceptor(ETagInterceptor())
 
         if (includeLogging) {
             builder.addInterceptor(
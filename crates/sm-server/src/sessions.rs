@@ -8569,11 +8569,21 @@ impl SessionStore {
         }
         let content = fs::read_to_string(&state_file)
             .with_context(|| format!("failed to read session state {}", state_file.display()))?;
-        serde_json::from_str(&content)
-            .with_context(|| format!("failed to parse session state {}", state_file.display()))
+        let mut value: Value = serde_json::from_str(&content)
+            .with_context(|| format!("failed to parse session state {}", state_file.display()))?;
+        apply_state_journal(&state_file, &mut value);
+        Ok(value)
     }
 
     fn write_raw_json_value(&self, value: &Value) -> Result<()> {
+        // Values come from load_raw_json_value with the journal already folded
+        // in; write an unstamped checkpoint so the Python reader never replays
+        // that journal over it, then drop the now-redundant journal.
+        let mut value = value.clone();
+        if let Some(object) = value.as_object_mut() {
+            object.remove(STATE_JOURNAL_GENERATION_KEY);
+        }
+        let value = &value;
         if let Some(parent) = self.state_file.parent() {
             fs::create_dir_all(parent).with_context(|| {
                 format!("failed to create state directory {}", parent.display())
@@ -8592,6 +8602,7 @@ impl SessionStore {
                 self.state_file.display()
             )
         })?;
+        let _ = fs::remove_file(state_journal_path(&self.state_file));
         Ok(())
     }
 
@@ -10501,12 +10512,102 @@ pub enum SubagentStopOutcome {
 fn read_snapshot(path: &Path) -> Result<StateSnapshot> {
     let content = fs::read_to_string(path)
         .with_context(|| format!("failed to read session state {}", path.display()))?;
-    let raw: RawStateSnapshot = serde_json::from_str(&content)
+    let mut value: Value = serde_json::from_str(&content)
+        .with_context(|| format!("failed to parse session state {}", path.display()))?;
+    apply_state_journal(path, &mut value);
+    let raw: RawStateSnapshot = serde_json::from_value(value)
         .with_context(|| format!("failed to parse session state {}", path.display()))?;
     StateSnapshot::try_from(raw)
         .with_context(|| format!("failed to parse session records {}", path.display()))
 }
 
+const STATE_JOURNAL_GENERATION_KEY: &str = "journal_generation";
+
+fn state_journal_path(state_file: &Path) -> PathBuf {
+    let mut name = state_file
+        .file_name()
+        .map(|name| name.to_os_string())
+        .unwrap_or_default();
+    name.push(".journal");
+    state_file.with_file_name(name)
+}
+
+/// Replay the Python writer's append-only delta journal (`sessions.json.journal`)
+/// over a checkpoint payload, mirroring `session_state_journal.apply_journal_records`.
+/// Journals written for another checkpoint generation are ignored and malformed
+/// lines are skipped, so a missing or damaged journal degrades to the checkpoint.
+fn apply_state_journal(state_file: &Path, value: &mut Value) {
+    let Ok(content) = fs::read_to_string(state_journal_path(state_file)) else {
+        return;
+    };
+    let generation = value.get(STATE_JOURNAL_GENERATION_KEY).cloned();
+    let mut header_seen = false;
+    let mut records = Vec::new();
+    for line in content.lines() {
+        if line.trim().is_empty() {
+            continue;
+        }
+        let Ok(record) = serde_json::from_str::<Value>(line) else {
+            continue;
+        };
+        if !record.is_object() {
+            continue;
+        }
+        if !header_seen {
+            if record.get("op").and_then(Value::as_str) != Some("header")
+                || record.get("generation").cloned() != generation
+            {
+                return;
+            }
+            header_seen = true;
+            continue;
+        }
+        records.push(record);
+    }
+    if records.is_empty() {
+        return;
+    }
+    let Some(object) = value.as_object_mut() else {
+        return;
+    };
+    let mut sessions: Vec<Value> = match object.remove("sessions") {
+        Some(Value::Array(items)) => items,
+        _ => Vec::new(),
+    };
+    for record in records {
+        match record.get("op").and_then(Value::as_str) {
+            Some("upsert") => {
+                let Some(session) = record.get("session").filter(|item| item.is_object()) else {
+                    continue;
+                };
+                let Some(id) = session.get("id").filter(|id| !id.is_null()).cloned() else {
+                    continue;
+                };
+                match sessions.iter_mut().find(|item| item.get("id") == Some(&id)) {
+                    Some(existing) => *existing = session.clone(),
+                    None => sessions.push(session.clone()),
+                }
+            }
+            Some("delete") => {
+                if let Some(id) = record.get("session_id") {
+                    sessions.retain(|item| item.get("id") != Some(id));
+                }
+            }
+            Some("state") => {
+                let Some(state) = record.get("state").and_then(Value::as_object) else {
+                    continue;
+                };
+                object.retain(|key, _| key == STATE_JOURNAL_GENERATION_KEY || state.contains_key(key));
+                for (key, item) in state {
+                    object.insert(key.clone(), item.clone());
+                }
+            }
+            _ => {}
+        }
+    }
+    object.insert("sessions".to_owned(), Value::Array(sessions));
+}
+
 fn snapshot_from_raw_value(value: &Value) -> Result<StateSnapshot> {
     let raw = serde_json::from_value::<RawStateSnapshot>(value.clone())
         .context("failed to parse raw session state")?;
@@ -17065,6 +17166,48 @@ mod tests {
         time::Duration,
     };
 
+    #[test]
+    fn state_journal_deltas_are_replayed_over_checkpoint() {
+        let state_file = unique_temp_path("journal-checkpoint");
+        let mut checkpoint = json!({
+            "journal_generation": 3,
+            "em_topic": null,
+            "sessions": [
+                {"id": "keep", "friendly_name": "old"},
+                {"id": "gone", "friendly_name": "doomed"}
+            ]
+        });
+        let journal = [
+            json!({"op": "header", "generation": 3}).to_string(),
+            json!({"op": "upsert", "session": {"id": "keep", "friendly_name": "new"}}).to_string(),
+            "{\"op\":\"upsert\",\"sess".to_owned(),
+            json!({"op": "delete", "session_id": "gone"}).to_string(),
+            json!({"op": "upsert", "session": {"id": "added"}}).to_string(),
+            json!({"op": "state", "state": {"maintainer_session_id": "keep"}}).to_string(),
+        ]
+        .join("\n");
+        fs::write(state_journal_path(&state_file), format!("{journal}\n")).unwrap();
+
+        apply_state_journal(&state_file, &mut checkpoint);
+
+        assert_eq!(
+            checkpoint,
+            json!({
+                "journal_generation": 3,
+                "maintainer_session_id": "keep",
+                "sessions": [
+                    {"id": "keep", "friendly_name": "new"},
+                    {"id": "added"}
+                ]
+            })
+        );
+
+        let mut stale = json!({"journal_generation": 4, "sessions": []});
+        apply_state_journal(&state_file, &mut stale);
+        assert_eq!(stale, json!({"journal_generation": 4, "sessions": []}));
+        let _ = fs::remove_file(state_journal_path(&state_file));
+    }
+
     #[test]
     fn accepted_spawn_brief_is_private_immutable_and_records_launch_intent() {
         let state_file = unique_temp_path("spawn-brief");
@@ -70,14 +70,45 @@ def extract_thread_ids(log_path: str, session_id: str) -> list[tuple[int, int]]:
     return results
 
 
+def load_sessions(path: Path) -> list[dict]:
+    """Read sessions.json plus any deltas in its append-only sessions.json.journal.
+
+    Mirrors src/session_state_journal.py: journal records only apply when the
+    header generation matches the checkpoint, and malformed lines are skipped.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    sessions = {s.get("id"): s for s in data.get("sessions", []) if isinstance(s, dict)}
+    journal_path = path.with_name(f"{path.name}.journal")
+    try:
+        lines = journal_path.read_text().splitlines()
+    except FileNotFoundError:
+        lines = []
+    header_seen = False
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        if not header_seen:
+            if record.get("op") != "header" or record.get("generation") != data.get("journal_generation"):
+                break
+            header_seen = True
+        elif record.get("op") == "upsert" and isinstance(record.get("session"), dict):
+            sessions[record["session"].get("id")] = record["session"]
+        elif record.get("op") == "delete":
+            sessions.pop(record.get("session_id"), None)
+    return list(sessions.values())
+
+
 def get_current_topic(session_id: str, state_file: str) -> tuple[int, int] | None:
     """Read the currently-persisted (chat_id, thread_id) for a session."""
     path = Path(state_file)
     if not path.exists():
         return None
-    with open(path) as f:
-        data = json.load(f)
-    for s in data.get("sessions", []):
+    for s in load_sessions(path):
         if s.get("id") == session_id:
             chat_id = s.get("telegram_chat_id")
             thread_id = s.get("telegram_thread_id")
@@ -5,9 +5,9 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Set
 from pathlib import Path
-import json
 
 from .models import DeliveryResult
+from .transcript_index import read_transcript_tail
 
 logger = logging.getLogger(__name__)
 
@@ -188,27 +188,18 @@ class ChildMonitor:
             try:
                 transcript_file = Path(child_session.transcript_path)
                 if transcript_file.exists():
-                    # Read last few lines
-                    lines = transcript_file.read_text().strip().split('\n')
-                    # Get last assistant message
-                    for line in reversed(lines[-20:]):  # Check last 20 lines
-                        try:
-                            entry = json.loads(line)
-                            if entry.get("type") == "assistant":
-                                message = entry.get("message", {})
-                                content = message.get("content", [])
-                                texts = []
-                                for item in content:
-                                    if isinstance(item, dict) and item.get("type") == "text":
-                                        text = item.get("text", "")
-                                        # Extract first sentence as summary
-                                        if text:
-                                            first_sentence = text.split('.')[0]
-                                            if len(first_sentence) > 100:
-                                                first_sentence = first_sentence[:100] + "..."
-                                            return first_sentence
-                        except json.JSONDecodeError:
-                            continue
+                    tail = await asyncio.to_thread(
+                        read_transcript_tail,
+                        transcript_file,
+                        skip_empty_assistant=True,
+                    )
+                    text = tail.last_assistant_message
+                    if text:
+                        # Extract first sentence as summary
+                        first_sentence = text.split('.')[0]
+                        if len(first_sentence) > 100:
+                            first_sentence = first_sentence[:100] + "..."
+                        return first_sentence
             except Exception as e:
                 logger.error(f"Error reading transcript: {e}")
 
@@ -18,6 +18,7 @@ DEFAULT_API_TIMEOUT = 5.0  # seconds
 DEFAULT_SEND_API_TIMEOUT = 15.0  # seconds
 DEFAULT_MUTATION_API_TIMEOUT = 15.0  # seconds
 KILL_TIMEOUT = 30  # seconds (kill triggers cleanup that may involve network I/O)
+EVENT_STREAM_READ_TIMEOUT = 45.0  # seconds (server sends a keepalive every 15s)
 
 
 class ClientConfigError(ValueError):
@@ -266,6 +267,8 @@ class SessionManagerClient:
         self.default_node = resolve_default_node()
         self.local_node = resolve_local_node()
         self.session_id = os.environ.get("CLAUDE_SESSION_MANAGER_ID")
+        # path -> (ETag, last 200 body text) for conditional GETs
+        self._etag_cache: dict[str, tuple[str, str]] = {}
 
     def _request(self, method: str, path: str, data: Optional[dict] = None, timeout: Optional[int] = None) -> tuple[Optional[dict], bool, bool]:
         """
@@ -285,20 +288,32 @@ class SessionManagerClient:
         """
         url = f"{self.api_url}{path}"
         request_timeout = timeout if timeout is not None else API_TIMEOUT
+        # GETs of endpoints that send an ETag (session lists) revalidate with
+        # If-None-Match; a 304 re-decodes the cached body, so callers may
+        # still mutate what they get back.
+        cached = self._etag_cache.get(path) if method == "GET" else None
 
         try:
             headers = {"Content-Type": "application/json"}
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
             # Important: some endpoints require an explicit JSON body even when empty ({}).
             body = json.dumps(data).encode() if data is not None else None
 
             req = urllib.request.Request(url, data=body, headers=headers, method=method)
             with urllib.request.urlopen(req, timeout=request_timeout) as response:
                 if response.status in (200, 201):
-                    return json.loads(response.read().decode()), True, False
+                    payload = response.read().decode()
+                    etag = response.headers.get("ETag") if method == "GET" else None
+                    if isinstance(etag, str) and etag:
+                        self._etag_cache[path] = (etag, payload)
+                    return json.loads(payload), True, False
                 # API responded but with error status
                 return None, False, False
 
         except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return json.loads(cached[1]), True, False
             payload = e.read() if hasattr(e, "read") else b""
             if payload:
                 try:
@@ -372,6 +387,55 @@ class SessionManagerClient:
             return data.get("sessions", [])
         return None
 
+    def stream_events(
+        self,
+        last_event_id: Optional[str] = None,
+        timeout: float = EVENT_STREAM_READ_TIMEOUT,
+    ):
+        """
+        Yield server-sent events from ``GET /events`` until the stream ends.
+
+        Each item is ``{"event": <type>, "id": <sse id or None>, "data": <dict>}``.
+        Keepalive comments are skipped. Transport errors propagate so callers
+        can decide whether to reconnect or fall back to polling.
+
+        Args:
+            last_event_id: Resume cursor sent as ``Last-Event-ID``
+            timeout: Socket read timeout; must exceed the server keepalive period
+        """
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        req = urllib.request.Request(f"{self.api_url}/events", headers=headers, method="GET")
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            event_type = "message"
+            event_id: Optional[str] = None
+            data_lines: list[str] = []
+            for raw_line in response:
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                if line:
+                    if line.startswith(":"):
+                        continue
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event_type = value
+                    elif field == "id":
+                        event_id = value
+                    elif field == "data":
+                        data_lines.append(value)
+                    continue
+                if data_lines:
+                    try:
+                        payload = json.loads("\n".join(data_lines))
+                    except ValueError:
+                        payload = None
+                    if isinstance(payload, dict):
+                        yield {"event": event_type, "id": event_id, "data": payload}
+                event_type = "message"
+                event_id = None
+                data_lines = []
+
     def list_node_restore_sessions(
         self,
         node: str,
@@ -22,6 +22,10 @@ ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 # (title + column header + flash + footer)
 _RESERVED_SCREEN_ROWS = 4
 _RETIRE_CONFIRM_SECONDS = 5.0
+# Push mode: reconnect backoff, and the slow re-list that picks up fields
+# session deltas do not carry (tool calls, status text).
+_EVENT_STREAM_RETRY_SECONDS = 5.0
+_EVENT_STREAM_RELIST_SECONDS = 30.0
 
 # name, min_width, weight, align
 _COLUMN_SPECS = [
@@ -318,6 +322,122 @@ class DetailFetchWorker:
         return lines[-10:] if lines else ["-"]
 
 
+class SessionEventWorker:
+    """Background subscriber to the server's /events session deltas.
+
+    The watch loop drains deltas on its own thread. ``connected`` is only true
+    while a stream that publishes session deltas is open; otherwise the loop
+    keeps polling. Reconnects resume from the last seen event id.
+    """
+
+    def __init__(self, client, retry_seconds: float = _EVENT_STREAM_RETRY_SECONDS):
+        self.client = client
+        self.retry_seconds = retry_seconds
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._deltas: list[dict] = []
+        self._resync = False
+        self._connected = False
+        self._supported = True
+        self._last_event_id: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def connected(self) -> bool:
+        with self._lock:
+            return self._connected
+
+    def stop(self):
+        # The stream read blocks until the next keepalive; the thread is a
+        # daemon, so don't wait for it.
+        self._stop.set()
+        self._thread.join(timeout=0.1)
+
+    def drain(self) -> tuple[list[dict], bool]:
+        """Return (pending deltas, whether a full re-list is needed)."""
+        with self._lock:
+            deltas, resync = self._deltas, self._resync
+            self._deltas = []
+            self._resync = False
+        return deltas, resync
+
+    def _run(self):
+        while not self._stop.is_set() and self._supported:
+            try:
+                for item in self.client.stream_events(last_event_id=self._last_event_id):
+                    if self._stop.is_set():
+                        return
+                    self._handle(item)
+                    if not self._supported:
+                        break
+            except Exception:
+                pass
+            with self._lock:
+                self._connected = False
+            self._stop.wait(self.retry_seconds)
+
+    def _handle(self, item: dict):
+        event_type = item.get("event")
+        data = item.get("data") or {}
+        with self._lock:
+            if event_type == "hello":
+                if "session_event_id" not in data:
+                    # Server without session deltas: stay on polling.
+                    self._supported = False
+                    return
+                if self._last_event_id is None:
+                    self._last_event_id = data["session_event_id"]
+                    self._resync = True
+                self._connected = True
+                return
+            if item.get("id"):
+                self._last_event_id = item["id"]
+            if event_type == "session_snapshot":
+                self._deltas = []
+                self._resync = True
+            elif event_type == "session_delta":
+                self._deltas.append(data)
+
+
+def apply_session_deltas(sessions: list[dict], deltas: list[dict]) -> tuple[list[dict], set[str], bool]:
+    """Apply /events session deltas to a listed-sessions model.
+
+    Returns (sessions, changed session ids, needs full re-list). Patched
+    sessions are replaced with new dicts so row caches keyed on the session
+    object see the change. Creations and stops need fields the delta does not
+    carry, so they request a re-list instead.
+    """
+    by_id = {session.get("id"): session for session in sessions if session.get("id")}
+    changed: set[str] = set()
+    needs_refresh = False
+    removed: set[str] = set()
+    for delta in deltas:
+        session_id = delta.get("session_id")
+        change = delta.get("change")
+        if change == "removed":
+            if session_id in by_id:
+                removed.add(session_id)
+                changed.add(session_id)
+            continue
+        if change == "created" or session_id not in by_id or "killed" in (delta.get("kinds") or []):
+            needs_refresh = True
+            continue
+        fields = {key: value for key, value in (delta.get("fields") or {}).items() if key != "queue_length"}
+        if not fields:
+            continue
+        by_id[session_id] = {**by_id[session_id], **fields}
+        changed.add(session_id)
+    if not changed:
+        return sessions, changed, needs_refresh
+    patched = [
+        by_id.get(session.get("id"), session)
+        for session in sessions
+        if session.get("id") not in removed
+    ]
+    return patched, changed, needs_refresh
+
+
 def _session_name(session: dict) -> str:
     return session.get("friendly_name") or session.get("name") or session.get("id", "unknown")
 
@@ -641,11 +761,21 @@ def build_watch_rows(
     detail_cache: Optional[dict[str, DetailSnapshot]] = None,
     codex_projection_enabled: bool = True,
     reparent_requests: Optional[list[dict]] = None,
+    row_cache: Optional[dict[str, tuple]] = None,
+    clock: Optional[int] = None,
 ) -> tuple[list[WatchRow], list[str], int]:
-    """Build grouped rows and selectable session IDs."""
+    """Build grouped rows and selectable session IDs.
+
+    ``row_cache`` (owned by the caller, keyed by session id) reuses a
+    session's own rows when neither the session dict object nor anything
+    else its rows are drawn from changed since the last build. Age labels
+    tick with ``clock`` (whole seconds, default now).
+    """
     rows: list[WatchRow] = []
     selectable: list[str] = []
     expanded = expanded_session_ids or set()
+    clock = int(time.time()) if clock is None else clock
+    live_cache_ids: set[str] = set()
     sessions_by_id = {session["id"]: session for session in sessions if session.get("id")}
     groups: dict[str, list[dict]] = {}
     roots_by_repo: dict[str, list[dict]] = {}
@@ -705,7 +835,38 @@ def build_watch_rows(
     def render_session(session: dict, ancestors_last: list[bool], is_last: bool):
         tree_prefix = _tree_prefix(ancestors_last, is_last)
         status_prefix = _status_prefix(ancestors_last)
+        session_id = session.get("id")
+        if session_id:
+            selectable.append(session_id)
 
+        cache_key = None
+        if row_cache is not None and session_id:
+            detail = detail_cache.get(session_id) if detail_cache and session_id in expanded else None
+            cache_key = (
+                tree_prefix,
+                status_prefix,
+                _parent_label(session, sessions_by_id),
+                spinner_index % len(SPINNER_FRAMES) if session.get("activity_state") == "thinking" else None,
+                clock,
+                tuple(requests_by_source.get(session_id, [])),
+                session_id in expanded,
+                codex_projection_enabled,
+                (detail.fetched_at, detail.loading, detail.last_error) if detail is not None else None,
+            )
+            live_cache_ids.add(session_id)
+            cached = row_cache.get(session_id)
+            if cached is not None and cached[0] is session and cached[1] == cache_key:
+                rows.extend(cached[2])
+                render_children(session, ancestors_last, is_last)
+                return
+
+        first_row = len(rows)
+        render_session_rows(session, tree_prefix, status_prefix)
+        if cache_key is not None:
+            row_cache[session_id] = (session, cache_key, rows[first_row:])
+        render_children(session, ancestors_last, is_last)
+
+    def render_session_rows(session: dict, tree_prefix: str, status_prefix: str):
         role = session.get("role") or "-"
         provider = session.get("provider", "claude")
         activity_state = session.get("activity_state", "idle")
@@ -733,8 +894,6 @@ def build_watch_rows(
                 columns=columns,
             )
         )
-        if session_id:
-            selectable.append(session_id)
 
         status_line = _status_line(session)
         if status_line:
@@ -771,6 +930,7 @@ def build_watch_rows(
             for line in _detail_lines(session, detail, codex_projection_enabled):
                 rows.append(WatchRow(kind="detail", text=line, session_id=session_id))
 
+    def render_children(session: dict, ancestors_last: list[bool], is_last: bool):
         child_entries: list[tuple[str, object, str]] = []
         for child in same_repo_children.get(session.get("id", ""), []):
             child_entries.append(("session", child, _session_name(child).lower()))
@@ -819,6 +979,9 @@ def build_watch_rows(
         for idx, root in enumerate(top_level_roots):
             render_session(root, [], idx == len(top_level_roots) - 1)
 
+    if row_cache is not None:
+        for stale_id in row_cache.keys() - live_cache_ids:
+            del row_cache[stale_id]
     return rows, selectable, len(groups)
 
 
@@ -1562,6 +1725,11 @@ def run_watch_tui(
         codex_projection_enabled = _codex_projection_enabled(rollout_flags)
 
         detail_worker = None if restore_mode else DetailFetchWorker(client=client, codex_projection_enabled=codex_projection_enabled)
+        event_worker = (
+            SessionEventWorker(client)
+            if not restore_mode and callable(getattr(client, "stream_events", None))
+            else None
+        )
 
         try:
             selected_session_id: Optional[str] = None
@@ -1589,13 +1757,40 @@ def run_watch_tui(
             total_sessions = 0
             spinner_index = 0
             scroll_offset = 0
+            # next_refresh re-lists from the server; next_rebuild only redraws
+            # the local model (ages, spinner). While /events is connected the
+            # model is kept current by session deltas and re-lists are rare.
             next_refresh = 0.0
+            next_rebuild = 0.0
+            listed_sessions: Optional[list[dict]] = None
+            reparent_requests: list[dict] = []
+            row_cache: dict[str, tuple] = {}
+            was_streaming = False
+            needs_render = True
             retire_confirmation: Optional[RetireConfirmation] = None
 
             while True:
                 now = time.monotonic()
-                if now >= next_refresh:
-                    if restore_mode and effective_restore_node and effective_restore_node != "primary":
+                if event_worker is not None:
+                    streaming = event_worker.connected
+                    if was_streaming and not streaming:
+                        # Stream dropped: resume polling right away.
+                        next_refresh = 0.0
+                    was_streaming = streaming
+                    deltas, resync = event_worker.drain()
+                    if resync:
+                        next_refresh = 0.0
+                    if deltas and listed_sessions is not None:
+                        listed_sessions, changed_ids, needs_relist = apply_session_deltas(listed_sessions, deltas)
+                        if needs_relist:
+                            next_refresh = 0.0
+                        if changed_ids:
+                            next_rebuild = 0.0
+                fetch = now >= next_refresh
+                if fetch or now >= next_rebuild:
+                    if not fetch:
+                        listed = listed_sessions
+                    elif restore_mode and effective_restore_node and effective_restore_node != "primary":
                         listed = client.list_node_restore_sessions(effective_restore_node)
                     else:
                         listed = client.list_sessions(include_stopped=restore_mode)
@@ -1605,21 +1800,24 @@ def run_watch_tui(
                                 effective_restore_node,
                             )
                     if listed is None:
-                        flash_message = "Session manager unavailable"
-                        flash_until = now + 2.5
-                    else:
-                        reparent_result = (
-                            client.list_reparent_requests() if not restore_mode else {"ok": True, "requests": []}
-                        )
-                        if reparent_result.get("unavailable"):
-                            flash_message = "Reparent requests unavailable"
+                        if fetch:
+                            flash_message = "Session manager unavailable"
                             flash_until = now + 2.5
-                        reparent_requests = reparent_result.get("requests") or []
-                        latest_reparent_by_id = {
-                            request.get("id", ""): request
-                            for request in reparent_requests
-                            if request.get("id")
-                        }
+                    else:
+                        if fetch:
+                            listed_sessions = listed
+                            reparent_result = (
+                                client.list_reparent_requests() if not restore_mode else {"ok": True, "requests": []}
+                            )
+                            if reparent_result.get("unavailable"):
+                                flash_message = "Reparent requests unavailable"
+                                flash_until = now + 2.5
+                            reparent_requests = reparent_result.get("requests") or []
+                            latest_reparent_by_id = {
+                                request.get("id", ""): request
+                                for request in reparent_requests
+                                if request.get("id")
+                            }
                         filtered = filter_sessions(
                             listed,
                             repo_filter=repo_filter,
@@ -1660,6 +1858,7 @@ def run_watch_tui(
                                 detail_cache=detail_cache,
                                 codex_projection_enabled=codex_projection_enabled,
                                 reparent_requests=reparent_requests,
+                                row_cache=row_cache,
                             )
                             spinner_index += 1
                             # Prune stale expanded IDs and enqueue refresh for active details.
@@ -1676,12 +1875,19 @@ def run_watch_tui(
                         if selected_request_id not in visible_request_ids:
                             selected_request_id = None
 
-                    next_refresh = now + max(0.2, interval)
+                    if fetch:
+                        next_refresh = now + (
+                            max(_EVENT_STREAM_RELIST_SECONDS, interval) if was_streaming else max(0.2, interval)
+                        )
+                    next_rebuild = now + max(0.2, interval)
+                    needs_render = True
 
                 if flash_message and now >= flash_until:
                     flash_message = None
+                    needs_render = True
                 if retire_confirmation and now > retire_confirmation.expires_at:
                     retire_confirmation = None
+                    needs_render = True
 
                 max_rows = max(0, stdscr.getmaxyx()[0] - _RESERVED_SCREEN_ROWS)
                 selected_row_idx = None
@@ -1710,27 +1916,30 @@ def run_watch_tui(
                 else:
                     scroll_offset = 0
 
-                _render(
-                    stdscr,
-                    rows=rows,
-                    selected_session_id=selected_session_id,
-                    selected_repo_key=selected_repo_key,
-                    selected_request_id=selected_request_id,
-                    scroll_offset=scroll_offset,
-                    total_sessions=total_sessions,
-                    repo_count=repo_count,
-                    filter_text=text_filter,
-                    flash_message=flash_message,
-                    palette=palette,
-                    restore_mode=restore_mode,
-                    restore_sort=restore_sort_mode,
-                    restore_node=effective_restore_node,
-                )
+                if needs_render:
+                    _render(
+                        stdscr,
+                        rows=rows,
+                        selected_session_id=selected_session_id,
+                        selected_repo_key=selected_repo_key,
+                        selected_request_id=selected_request_id,
+                        scroll_offset=scroll_offset,
+                        total_sessions=total_sessions,
+                        repo_count=repo_count,
+                        filter_text=text_filter,
+                        flash_message=flash_message,
+                        palette=palette,
+                        restore_mode=restore_mode,
+                        restore_sort=restore_sort_mode,
+                        restore_node=effective_restore_node,
+                    )
+                    needs_render = False
 
                 key = stdscr.getch()
                 if key == -1:
                     time.sleep(0.05)
                     continue
+                needs_render = True
 
                 if key in (ord("q"), 27):
                     break
@@ -2129,6 +2338,8 @@ def run_watch_tui(
         finally:
             if detail_worker:
                 detail_worker.stop()
+            if event_worker:
+                event_worker.stop()
 
     def _handle_terminal_signal(signum, _frame):
         # An ssh drop delivers SIGHUP; SIGTERM may arrive from tooling. Neither
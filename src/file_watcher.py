@@ -0,0 +1,225 @@
+"""Optional inotify-backed change notifications for locally tailed files.
+
+Consumers that tail files (tmux pipe-pane logs, codex-fork event streams)
+register a callback per path and keep a slow safety-net poll. Where inotify is
+unavailable (non-Linux, restricted containers, exhausted watch limits) every
+call degrades to a no-op and callers keep polling at their normal rate.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+# Directory watches report changes to every child, so sessions that share a log
+# directory share one kernel watch.
+_DIRECTORY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Safety-net poll for watched files, in case an event is ever missed.
+WATCHED_FALLBACK_POLL_SECONDS = 5.0
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Dispatch inotify events for watched files to callbacks on the event loop."""
+
+    def __init__(self):
+        self._libc = _load_libc()
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._disabled = self._libc is None
+        self._next_token = 0
+        # directory -> watch descriptor, and the reverse mapping for events
+        self._dir_wds: dict[str, int] = {}
+        self._wd_dirs: dict[int, str] = {}
+        # directory -> file name -> token -> callback
+        self._callbacks: dict[str, dict[str, dict[int, Callable[[], None]]]] = {}
+        self._tokens: dict[int, tuple[str, str]] = {}
+        self.events_dispatched = 0
+
+    @property
+    def available(self) -> bool:
+        return not self._disabled
+
+    def _ensure_started(self) -> bool:
+        if self._disabled:
+            return False
+        loop = asyncio.get_running_loop()
+        if self._fd is not None and self._loop is loop and not loop.is_closed():
+            return True
+        # A new event loop (tests, restarts) cannot reuse readers registered
+        # on the old one; start from a clean inotify instance.
+        self._reset()
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            logger.info("inotify unavailable (%s); falling back to polling", os.strerror(err))
+            self._disabled = True
+            return False
+        try:
+            loop.add_reader(fd, self._on_readable)
+        except (NotImplementedError, RuntimeError) as exc:
+            os.close(fd)
+            logger.info("Event loop cannot watch inotify fd (%s); falling back to polling", exc)
+            self._disabled = True
+            return False
+        self._fd = fd
+        self._loop = loop
+        return True
+
+    def _reset(self) -> None:
+        if self._fd is not None:
+            if self._loop is not None and not self._loop.is_closed():
+                try:
+                    self._loop.remove_reader(self._fd)
+                except (RuntimeError, ValueError):
+                    pass
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._loop = None
+        self._dir_wds.clear()
+        self._wd_dirs.clear()
+        self._callbacks.clear()
+        self._tokens.clear()
+
+    def watch(self, path: str | Path, callback: Callable[[], None]) -> Optional[int]:
+        """Call ``callback`` on the running loop whenever ``path`` changes.
+
+        The file does not need to exist yet. Returns a token for ``unwatch``,
+        or None when inotify is unavailable and the caller should poll.
+        """
+        if not self._ensure_started():
+            return None
+        target = Path(path).expanduser()
+        directory = str(target.parent)
+        wd = self._dir_wds.get(directory)
+        if wd is None:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _DIRECTORY_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    logger.warning("inotify watch limit reached; polling %s", directory)
+                else:
+                    logger.debug("Cannot watch %s: %s", directory, os.strerror(err))
+                return None
+            self._dir_wds[directory] = wd
+            self._wd_dirs[wd] = directory
+        self._next_token += 1
+        token = self._next_token
+        self._callbacks.setdefault(directory, {}).setdefault(target.name, {})[token] = callback
+        self._tokens[token] = (directory, target.name)
+        return token
+
+    def unwatch(self, token: Optional[int]) -> None:
+        """Drop one registration; the kernel watch goes when its directory is unused."""
+        if token is None:
+            return
+        entry = self._tokens.pop(token, None)
+        if entry is None:
+            return
+        directory, name = entry
+        by_name = self._callbacks.get(directory, {})
+        callbacks = by_name.get(name, {})
+        callbacks.pop(token, None)
+        if not callbacks:
+            by_name.pop(name, None)
+        if by_name:
+            return
+        self._callbacks.pop(directory, None)
+        wd = self._dir_wds.pop(directory, None)
+        if wd is not None:
+            self._wd_dirs.pop(wd, None)
+            if self._fd is not None:
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            logger.warning("inotify read failed (%s); falling back to polling", exc)
+            self._reset()
+            self._disabled = True
+            return
+        pending: list[Callable[[], None]] = []
+        seen: set[int] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + name_len].split(b"\0", 1)[0]
+            offset += name_len
+            directory = self._wd_dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                # The directory went away; wake everyone so they re-check.
+                for callbacks in self._callbacks.get(directory, {}).values():
+                    pending.extend(cb for token, cb in callbacks.items() if token not in seen)
+                    seen.update(callbacks)
+                continue
+            callbacks = self._callbacks.get(directory, {}).get(os.fsdecode(name), {})
+            for token, callback in callbacks.items():
+                if token not in seen:
+                    seen.add(token)
+                    pending.append(callback)
+        for callback in pending:
+            self.events_dispatched += 1
+            try:
+                callback()
+            except Exception as exc:
+                logger.error(f"File watch callback failed: {exc}")
+
+    def stats(self) -> dict[str, int | bool]:
+        return {
+            "available": self.available,
+            "directories": len(self._dir_wds),
+            "watches": len(self._tokens),
+            "events_dispatched": self.events_dispatched,
+        }
+
+
+_shared_watcher: Optional[FileWatcher] = None
+
+
+def get_file_watcher() -> FileWatcher:
+    """Return the process-wide watcher (one inotify fd for every consumer)."""
+    global _shared_watcher
+    if _shared_watcher is None:
+        _shared_watcher = FileWatcher()
+    return _shared_watcher
@@ -11,6 +11,7 @@ import subprocess
 import threading
 import uuid
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -33,9 +34,28 @@ from .github_reviews import (
     post_pr_review_comment,
     validate_open_pr,
 )
+from .pending_message_index import PendingMessageIndex
 
 logger = logging.getLogger(__name__)
 
+# Prepared statements kept per connection; the queue reuses a few dozen.
+DB_STATEMENT_CACHE_SIZE = 256
+
+_PENDING_MESSAGE_COLUMNS = """
+    id, target_session_id, sender_session_id, sender_name, text,
+    delivery_mode, from_sm_send, queued_at, timeout_at, notify_on_delivery,
+    notify_after_seconds, notify_on_stop, delivered_at,
+    remind_soft_threshold, remind_hard_threshold,
+    remind_cancel_on_reply_session_id, parent_session_id, message_category,
+    response_relay_source
+"""
+
+# Writes that bypass the pending index (ad-hoc SQL) force it to reload.
+_MESSAGE_QUEUE_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT|UPDATE|DELETE|REPLACE)\b.*?\bmessage_queue\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class CodexReviewRequestConflict(ValueError):
     """An active request belongs to another caller and cannot be replaced."""
@@ -151,6 +171,15 @@ class MessageQueueManager:
         # Persistent database connection with thread-safety
         self._db_conn: Optional[sqlite3.Connection] = None
         self._db_lock = threading.Lock()
+        # Async callers run DB work on one dedicated thread so a slow fsync
+        # never stalls the event loop; queued async writes share a commit.
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_db_writes: list[tuple[str, tuple, asyncio.Future]] = []
+        self._db_write_batch_lock = threading.Lock()
+        self._db_write_flush_scheduled = False
+        # Undelivered messages per target session; updated with every write
+        # so delivery and the monitor loop never re-query for them.
+        self._pending_index = PendingMessageIndex()
 
         # Initialize database
         self._init_db()
@@ -168,10 +197,16 @@ class MessageQueueManager:
     def _init_db(self):
         """Initialize SQLite database schema with persistent connection."""
         # Create persistent connection with thread-safety enabled
-        self._db_conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db_conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
 
-        # Enable WAL mode for better concurrency
+        # Enable WAL mode for better concurrency; NORMAL sync is durable
+        # across application crashes and skips the per-commit WAL fsync.
         self._db_conn.execute("PRAGMA journal_mode=WAL")
+        self._db_conn.execute("PRAGMA synchronous=NORMAL")
 
         # Create schema
         cursor = self._db_conn.cursor()
@@ -1559,13 +1594,21 @@ class MessageQueueManager:
                     registration.pr_number,
                 )
 
-    def _execute(self, query: str, params=()) -> sqlite3.Cursor:
+    def _execute(
+        self,
+        query: str,
+        params=(),
+        update_index: Optional[Callable[[PendingMessageIndex], None]] = None,
+    ) -> sqlite3.Cursor:
         """
         Execute a database query with thread-safety.
 
         Args:
             query: SQL query string
             params: Query parameters tuple
+            update_index: Applies a message_queue write to the pending index
+                under the DB lock, right after the commit. Other writes to
+                message_queue make the index reload on its next lookup.
 
         Returns:
             Cursor object
@@ -1574,7 +1617,34 @@ class MessageQueueManager:
             cursor = self._db_conn.cursor()
             cursor.execute(query, params)
             self._db_conn.commit()
-            return cursor
+            if update_index is not None:
+                update_index(self._pending_index)
+            elif _MESSAGE_QUEUE_WRITE_RE.match(query):
+                self._pending_index.invalidate()
+            else:
+                return cursor
+        self._notify_session_change()
+        return cursor
+
+    def _notify_session_change(self) -> None:
+        """Let the session manager publish queue-length and idle deltas."""
+        notify = getattr(self.session_manager, "notify_session_change", None)
+        if callable(notify):
+            notify()
+
+    def _ensure_pending_index(self) -> PendingMessageIndex:
+        """Return the pending index, loading it from the database if needed."""
+        index = self._pending_index
+        while not index.loaded:
+            generation = index.generation
+            rows = self._execute_query(f"""
+                SELECT {_PENDING_MESSAGE_COLUMNS}
+                FROM message_queue
+                WHERE delivered_at IS NULL
+                ORDER BY queued_at ASC
+            """)
+            index.load((self._row_to_queued_message(row) for row in rows), generation)
+        return index
 
     def _execute_query(self, query: str, params=()) -> List:
         """
@@ -1592,6 +1662,101 @@ class MessageQueueManager:
             cursor.execute(query, params)
             return cursor.fetchall()
 
+    async def _run_db(self, func: Callable, *args):
+        """Run a synchronous DB helper on the dedicated DB thread.
+
+        Jobs run in submission order, so a read submitted after an async write
+        observes that write.
+        """
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="message-queue-db")
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func, *args)
+
+    async def _execute_query_async(self, query: str, params=()) -> List:
+        """Awaitable variant of _execute_query."""
+        return await self._run_db(self._execute_query, query, params)
+
+    async def _execute_async(
+        self,
+        query: str,
+        params=(),
+        update_index: Optional[Callable[[PendingMessageIndex], None]] = None,
+    ) -> int:
+        """
+        Execute a write on the DB thread, grouped with other pending writes.
+
+        Writes queued before the DB thread picks up the batch commit together
+        in one transaction; each statement runs in its own savepoint, so a
+        failing statement raises to its caller without discarding the rest.
+        ``update_index`` is applied once the statement has committed.
+
+        Returns:
+            Number of rows changed by this statement
+        """
+        future = asyncio.get_running_loop().create_future()
+        with self._db_write_batch_lock:
+            self._pending_db_writes.append((query, tuple(params), update_index, future))
+            schedule = not self._db_write_flush_scheduled
+            self._db_write_flush_scheduled = True
+        if schedule:
+            # Scheduled, not awaited: the callers await their own futures.
+            asyncio.ensure_future(self._run_db(self._flush_db_write_batch))
+        return await future
+
+    def _flush_db_write_batch(self) -> None:
+        """Commit every queued async write in one transaction (DB thread)."""
+        with self._db_write_batch_lock:
+            batch = self._pending_db_writes
+            self._pending_db_writes = []
+            self._db_write_flush_scheduled = False
+        if not batch:
+            return
+        outcomes: list[tuple[asyncio.Future, object]] = []
+        index_updates: list[Optional[Callable[[PendingMessageIndex], None]]] = []
+        with self._db_lock:
+            try:
+                if self._db_conn is None:
+                    raise sqlite3.ProgrammingError("message queue database is closed")
+                cursor = self._db_conn.cursor()
+                cursor.execute("BEGIN")
+                for query, params, update_index, future in batch:
+                    cursor.execute("SAVEPOINT mq_write")
+                    try:
+                        cursor.execute(query, params)
+                        outcomes.append((future, cursor.rowcount))
+                        cursor.execute("RELEASE mq_write")
+                    except sqlite3.Error as exc:
+                        cursor.execute("ROLLBACK TO mq_write")
+                        cursor.execute("RELEASE mq_write")
+                        outcomes.append((future, exc))
+                        continue
+                    if update_index is not None or _MESSAGE_QUEUE_WRITE_RE.match(query):
+                        index_updates.append(update_index)
+                self._db_conn.commit()
+            except sqlite3.Error as exc:
+                if self._db_conn is not None and self._db_conn.in_transaction:
+                    self._db_conn.rollback()
+                outcomes = [(future, exc) for _, _, _, future in batch]
+                index_updates = []
+            for update_index in index_updates:
+                if update_index is None:
+                    self._pending_index.invalidate()
+                else:
+                    update_index(self._pending_index)
+        if index_updates:
+            self._notify_session_change()
+        for future, outcome in outcomes:
+            future.get_loop().call_soon_threadsafe(self._resolve_db_future, future, outcome)
+
+    @staticmethod
+    def _resolve_db_future(future: asyncio.Future, outcome: object) -> None:
+        if future.done():
+            return
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
     def set_notify_callback(self, callback: Callable):
         """Set callback for delivery notifications."""
         self._notify_callback = callback
@@ -1689,6 +1854,9 @@ class MessageQueueManager:
         After a server restart, in-memory idle state is lost. This ensures
         messages queued before the restart get delivered promptly.
         """
+        # Rebuild the pending index from the database; it is authoritative
+        # from here on and kept current by the write helpers.
+        self._pending_index.invalidate()
         sessions_with_pending = self._get_sessions_with_pending()
         for session_id in sessions_with_pending:
             # Check if session still exists
@@ -1747,10 +1915,15 @@ class MessageQueueManager:
         for task in self._remind_tasks.values():
             task.cancel()
         self._remind_tasks.clear()
-        # Close database connection
-        if self._db_conn:
-            self._db_conn.close()
-            self._db_conn = None
+        # Finish queued DB work before closing the connection
+        if self._db_executor is not None or self._pending_db_writes:
+            await self._run_db(self._flush_db_write_batch)
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
+        with self._db_lock:
+            if self._db_conn:
+                self._db_conn.close()
+                self._db_conn = None
         logger.info("Message queue manager stopped")
 
     # =========================================================================
@@ -1834,6 +2007,7 @@ class MessageQueueManager:
         # Now safe to mark idle — skip check did not absorb this Stop hook
         state.is_idle = True
         state.last_idle_at = datetime.now()
+        self._notify_session_change()
 
         # Suppress redundant stop notification if agent recently sm-sent to the
         # same target that would receive the notification (#182)
@@ -1913,6 +2087,7 @@ class MessageQueueManager:
         session = self.session_manager.get_session(session_id)
         if session and session.status != SessionStatus.STOPPED:
             session.status = SessionStatus.RUNNING
+        self._notify_session_change()
         logger.debug(f"Session {session_id} marked active")
 
     def _cancel_codex_idle_reconcile(self, session_id: str) -> None:
@@ -2130,7 +2305,7 @@ class MessageQueueManager:
             msg.parent_session_id,
             msg.message_category,
             msg.response_relay_source,
-        ))
+        ), update_index=lambda index: index.add(msg))
 
         queue_len = self.get_queue_length(target_session_id)
         logger.info(f"Queued message {msg.id} for {target_session_id} (mode={delivery_mode}, queue={queue_len})")
@@ -2211,60 +2386,82 @@ class MessageQueueManager:
         )
         return self.was_message_delivered(message_id)
 
-    def get_pending_messages(self, session_id: str) -> List[QueuedMessage]:
-        """Get all pending (undelivered) messages for a session."""
-        rows = self._execute_query("""
-            SELECT id, target_session_id, sender_session_id, sender_name, text,
-                   delivery_mode, from_sm_send, queued_at, timeout_at, notify_on_delivery,
-                   notify_after_seconds, notify_on_stop, delivered_at,
-                   remind_soft_threshold, remind_hard_threshold,
-                   remind_cancel_on_reply_session_id, parent_session_id, message_category,
-                   response_relay_source
-            FROM message_queue
-            WHERE target_session_id = ? AND delivered_at IS NULL
-            ORDER BY queued_at ASC
-        """, (session_id,))
-
+    def get_pending_messages(
+        self,
+        session_id: str,
+        delivery_mode: Optional[str] = None,
+    ) -> List[QueuedMessage]:
+        """Get pending (undelivered) messages for a session, oldest first."""
         messages = []
-        for row in rows:
-            msg = QueuedMessage(
-                id=row[0],
-                target_session_id=row[1],
-                sender_session_id=row[2],
-                sender_name=row[3],
-                text=row[4],
-                delivery_mode=row[5],
-                from_sm_send=bool(row[6]),
-                queued_at=datetime.fromisoformat(row[7]),
-                timeout_at=datetime.fromisoformat(row[8]) if row[8] else None,
-                notify_on_delivery=bool(row[9]),
-                notify_after_seconds=row[10],
-                notify_on_stop=bool(row[11]),
-                delivered_at=datetime.fromisoformat(row[12]) if row[12] else None,
-                remind_soft_threshold=row[13],
-                remind_hard_threshold=row[14],
-                remind_cancel_on_reply_session_id=row[15],
-                parent_session_id=row[16],
-                message_category=row[17],
-                response_relay_source=row[18],
-            )
+        now = datetime.now()
+        for msg in self._ensure_pending_index().pending(session_id, delivery_mode):
             # Skip expired messages
-            if msg.timeout_at and datetime.now() > msg.timeout_at:
+            if msg.timeout_at and now > msg.timeout_at:
                 self._mark_expired(msg.id)
                 continue
             messages.append(msg)
         return messages
 
+    @staticmethod
+    def _row_to_queued_message(row) -> QueuedMessage:
+        """Build a QueuedMessage from a row selected with _PENDING_MESSAGE_COLUMNS."""
+        return QueuedMessage(
+            id=row[0],
+            target_session_id=row[1],
+            sender_session_id=row[2],
+            sender_name=row[3],
+            text=row[4],
+            delivery_mode=row[5],
+            from_sm_send=bool(row[6]),
+            queued_at=datetime.fromisoformat(row[7]),
+            timeout_at=datetime.fromisoformat(row[8]) if row[8] else None,
+            notify_on_delivery=bool(row[9]),
+            notify_after_seconds=row[10],
+            notify_on_stop=bool(row[11]),
+            delivered_at=datetime.fromisoformat(row[12]) if row[12] else None,
+            remind_soft_threshold=row[13],
+            remind_hard_threshold=row[14],
+            remind_cancel_on_reply_session_id=row[15],
+            parent_session_id=row[16],
+            message_category=row[17],
+            response_relay_source=row[18],
+        )
+
+    async def get_pending_messages_async(self, session_id: str) -> List[QueuedMessage]:
+        """Awaitable variant of get_pending_messages (runs on the DB thread)."""
+        return await self._run_db(self.get_pending_messages, session_id)
+
     def get_queue_length(self, session_id: str) -> int:
         """Get the number of pending messages for a session."""
         return len(self.get_pending_messages(session_id))
 
+    async def get_queue_length_async(self, session_id: str) -> int:
+        """Awaitable variant of get_queue_length."""
+        return len(await self.get_pending_messages_async(session_id))
+
     def _mark_delivered(self, message_id: str) -> datetime:
         """Mark a message as delivered in the database."""
         delivered_at = datetime.now(timezone.utc)
-        self._execute("""
+        self._execute(
+            """
             UPDATE message_queue SET delivered_at = ? WHERE id = ?
-        """, (delivered_at.isoformat(), message_id))
+            """,
+            (delivered_at.isoformat(), message_id),
+            update_index=lambda index: index.discard([message_id]),
+        )
+        return delivered_at
+
+    async def _mark_delivered_async(self, message_ids: List[str]) -> datetime:
+        """Mark a delivered batch in one grouped commit, off the event loop."""
+        delivered_at = datetime.now(timezone.utc)
+        await asyncio.gather(*(
+            self._execute_async(
+                "UPDATE message_queue SET delivered_at = ? WHERE id = ?",
+                (delivered_at.isoformat(), message_id),
+                update_index=lambda index, message_id=message_id: index.discard([message_id]),
+            )
+            for message_id in message_ids
+        ))
         return delivered_at
 
     def _record_response_relay_inbound(self, msg: QueuedMessage, delivered_at: datetime) -> None:
@@ -2306,7 +2503,11 @@ class MessageQueueManager:
 
     def _mark_expired(self, message_id: str):
         """Mark a message as expired (delete it)."""
-        self._execute("DELETE FROM message_queue WHERE id = ?", (message_id,))
+        self._execute(
+            "DELETE FROM message_queue WHERE id = ?",
+            (message_id,),
+            update_index=lambda index: index.discard([message_id]),
+        )
         logger.info(f"Message {message_id} expired and deleted")
 
     def _cleanup_messages_for_session(self, session_id: str):
@@ -2321,7 +2522,8 @@ class MessageQueueManager:
         # Delete all pending messages for this session
         self._execute(
             "DELETE FROM message_queue WHERE target_session_id = ? AND delivered_at IS NULL",
-            (session_id,)
+            (session_id,),
+            update_index=lambda index: index.discard_where(lambda m: True, target_session_id=session_id),
         )
         logger.info(f"Cleaned up {count} pending message(s) for non-existent session {session_id}")
 
@@ -2335,6 +2537,7 @@ class MessageQueueManager:
         self._execute(
             "DELETE FROM message_queue WHERE target_session_id = ? AND delivered_at IS NULL",
             (session_id,),
+            update_index=lambda index: index.discard_where(lambda m: True, target_session_id=session_id),
         )
         self.cancel_remind(session_id)
         self.cancel_parent_wake(session_id)
@@ -2366,7 +2569,11 @@ class MessageQueueManager:
             self._execute(
                 "DELETE FROM message_queue "
                 "WHERE sender_session_id = ? AND message_category = 'context_monitor' AND delivered_at IS NULL",
-                (sender_session_id,)
+                (sender_session_id,),
+                update_index=lambda index: index.discard_where(
+                    lambda m: m.sender_session_id == sender_session_id
+                    and m.message_category == "context_monitor"
+                ),
             )
             logger.info(
                 f"Cancelled {count} stale context-monitor message(s) from cleared session {sender_session_id}"
@@ -2386,6 +2593,10 @@ class MessageQueueManager:
                 "DELETE FROM message_queue "
                 "WHERE target_session_id = ? AND message_category = ? AND delivered_at IS NULL",
                 (target_session_id, message_category),
+                update_index=lambda index: index.discard_where(
+                    lambda m: m.message_category == message_category,
+                    target_session_id=target_session_id,
+                ),
             )
             logger.info(
                 "Cancelled %s queued %s message(s) for target=%s",
@@ -2513,12 +2724,7 @@ class MessageQueueManager:
 
     def _get_sessions_with_pending(self) -> List[str]:
         """Get list of session IDs with pending messages."""
-        rows = self._execute_query("""
-            SELECT DISTINCT target_session_id
-            FROM message_queue
-            WHERE delivered_at IS NULL
-        """)
-        return [row[0] for row in rows]
+        return self._ensure_pending_index().sessions()
 
     async def _check_stale_input(self, session_id: str):
         """Check if user input has become stale and trigger delivery."""
@@ -2583,16 +2789,13 @@ class MessageQueueManager:
                 logger.warning(f"Session {session_id} not found, cannot deliver")
                 return
 
-            # Get pending messages
-            messages = self.get_pending_messages(session_id)
+            # Get pending messages (only important ones if requested)
+            messages = self.get_pending_messages(
+                session_id,
+                delivery_mode="important" if important_only else None,
+            )
             if not messages:
                 return
-
-            # Filter by mode if needed
-            if important_only:
-                messages = [m for m in messages if m.delivery_mode == "important"]
-                if not messages:
-                    return
             # No idle gate for sequential or important: tty buffer handles ordering (sm#244)
 
             # Check for user input (final gate)
@@ -2649,9 +2852,10 @@ class MessageQueueManager:
                     state.stop_notify_sender_name = None
                     state.stop_notify_delay_seconds = 0
 
-                # Mark messages as delivered
+                # Mark messages as delivered (one commit for the batch; the
+                # per-session delivery lock is still held)
+                delivered_at = await self._mark_delivered_async([msg.id for msg in batch])
                 for msg in batch:
-                    delivered_at = self._mark_delivered(msg.id)
                     self._record_response_relay_inbound(msg, delivered_at)
                     logger.info(f"Delivered message {msg.id}")
 
@@ -3504,6 +3708,11 @@ class MessageQueueManager:
                 "WHERE target_session_id = ? AND sender_session_id = ? "
                 "AND message_category = 'track_remind' AND delivered_at IS NULL",
                 (owner_session_id, tracked_session_id),
+                update_index=lambda index: index.discard_where(
+                    lambda m: m.sender_session_id == tracked_session_id
+                    and m.message_category == "track_remind",
+                    target_session_id=owner_session_id,
+                ),
             )
             logger.info(
                 "Cancelled %s queued track reminder(s) for owner=%s tracked=%s",
@@ -3528,6 +3737,10 @@ class MessageQueueManager:
                 "WHERE target_session_id = ? "
                 "AND message_category = 'track_status_nudge' AND delivered_at IS NULL",
                 (target_session_id,),
+                update_index=lambda index: index.discard_where(
+                    lambda m: m.message_category == "track_status_nudge",
+                    target_session_id=target_session_id,
+                ),
             )
             logger.info(
                 "Cancelled %s queued track status nudge(s) for target=%s",
@@ -4720,6 +4933,7 @@ class MessageQueueManager:
             "session_id": session_id,
             "is_idle": state.is_idle,
             "pending_count": len(messages),
+            "oldest_pending_seconds": self._pending_index.oldest_pending_age(session_id),
             "pending_messages": [
                 {
                     "id": m.id,
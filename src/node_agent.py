@@ -19,6 +19,8 @@ from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse, urlunparse
 
+from .session_state_journal import load_state_with_journal
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_NODE_STATE_FILE = "~/.local/share/claude-sessions/sessions.json"
@@ -478,8 +480,7 @@ class CodexForkNodeAgent:
         """Return stopped node-local SM session records from the configured state file."""
         state_path = state_file or self._restore_inventory_state_file()
         try:
-            with state_path.open("r", encoding="utf-8") as state_handle:
-                payload = json.load(state_handle)
+            payload = load_state_with_journal(state_path)
         except FileNotFoundError:
             return []
         if not isinstance(payload, dict):
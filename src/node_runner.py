@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import shlex
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
 
+logger = logging.getLogger(__name__)
 
 PRIMARY_NODE = "primary"
+DEFAULT_CONTROL_DIR = "~/.local/share/claude-sessions/ssh"
+DEFAULT_CONTROL_PERSIST_SECONDS = 600
+DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+# ssh exits 255 for its own (transport) failures, never for remote commands.
+SSH_TRANSPORT_FAILURE = 255
+# Weight of the newest sample in the per-node RTT moving average.
+RTT_EWMA_ALPHA = 0.2
 
 
 @dataclass(frozen=True)
@@ -37,10 +48,16 @@ class NodeConfig:
 class NodeRegistry:
     """Validated node registry loaded from config.yaml."""
 
-    def __init__(self, nodes: dict[str, NodeConfig], default_node: str = PRIMARY_NODE):
+    def __init__(
+        self,
+        nodes: dict[str, NodeConfig],
+        default_node: str = PRIMARY_NODE,
+        control_dir: Optional[str] = None,
+    ):
         self._nodes = dict(nodes)
         self._nodes.setdefault(PRIMARY_NODE, NodeConfig(id=PRIMARY_NODE))
         self.default_node = default_node if default_node in self._nodes else PRIMARY_NODE
+        self.control_dir = os.path.expanduser(control_dir or DEFAULT_CONTROL_DIR)
 
     @classmethod
     def from_config(cls, config: Optional[dict]) -> "NodeRegistry":
@@ -72,7 +89,11 @@ class NodeRegistry:
             )
 
         default_node = _clean_optional(raw_nodes.get("default")) or PRIMARY_NODE
-        return cls(nodes=nodes, default_node=default_node)
+        return cls(
+            nodes=nodes,
+            default_node=default_node,
+            control_dir=_clean_optional(raw_nodes.get("control_dir")),
+        )
 
     def get(self, node_id: Optional[str]) -> Optional[NodeConfig]:
         normalized = normalize_node_id(node_id)
@@ -106,11 +127,126 @@ class NodeRegistry:
         ]
 
 
+@dataclass
+class _NodeConnection:
+    """Health and latency bookkeeping for one node's multiplexed ssh transport."""
+
+    lock: threading.Lock
+    healthy_until: float = 0.0
+    masters_started: int = 0
+    master_failures: int = 0
+    commands: int = 0
+    transport_failures: int = 0
+    last_rtt_ms: Optional[float] = None
+    avg_rtt_ms: Optional[float] = None
+
+
+class NodeConnectionPool:
+    """Keep one OpenSSH ControlMaster connection alive per remote node.
+
+    Commands for a node share its control socket, so a remote call costs one
+    round trip over an established session instead of a fresh handshake. The
+    master is health-checked with ``ssh -O check`` at most once per interval
+    and restarted (clearing any stale socket) when it has gone away.
+    """
+
+    def __init__(
+        self,
+        *,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS,
+        connect_timeout: float = 10.0,
+    ):
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self._connections: dict[str, _NodeConnection] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self, node_id: str) -> _NodeConnection:
+        with self._lock:
+            connection = self._connections.get(node_id)
+            if connection is None:
+                connection = _NodeConnection(lock=threading.Lock())
+                self._connections[node_id] = connection
+            return connection
+
+    def needs_check(self, node_id: str) -> bool:
+        return time.monotonic() >= self._connection(node_id).healthy_until
+
+    def ensure(self, node: NodeConfig, control_path: str, ssh_options: list[str]) -> bool:
+        """Make sure the node's control master is up; returns False if it could not start."""
+        connection = self._connection(node.id)
+        with connection.lock:
+            if time.monotonic() < connection.healthy_until:
+                return True
+            check = subprocess.run(
+                ["ssh", "-S", control_path, "-O", "check", node.ssh],
+                capture_output=True,
+                text=True,
+                timeout=self.connect_timeout,
+                check=False,
+            )
+            if check.returncode != 0:
+                socket_path = Path(control_path)
+                socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                # A socket left by a dead master makes ssh silently skip
+                # multiplexing; remove it so the new master can bind.
+                if socket_path.exists():
+                    try:
+                        socket_path.unlink()
+                    except OSError:
+                        pass
+                started = subprocess.run(
+                    ["ssh", "-M", "-N", "-f", *ssh_options, node.ssh],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.connect_timeout,
+                    check=False,
+                )
+                if started.returncode != 0:
+                    connection.master_failures += 1
+                    logger.warning(
+                        "Could not start ssh control master for node %s: %s",
+                        node.id,
+                        (started.stderr or "").strip() or f"exit {started.returncode}",
+                    )
+                    return False
+                connection.masters_started += 1
+            connection.healthy_until = time.monotonic() + self.health_check_interval
+            return True
+
+    def record(self, node_id: str, elapsed_seconds: float, returncode: Optional[int]) -> None:
+        """Record one remote command's round trip; transport failures force a re-check."""
+        connection = self._connection(node_id)
+        rtt_ms = elapsed_seconds * 1000.0
+        connection.commands += 1
+        connection.last_rtt_ms = rtt_ms
+        if connection.avg_rtt_ms is None:
+            connection.avg_rtt_ms = rtt_ms
+        else:
+            connection.avg_rtt_ms += RTT_EWMA_ALPHA * (rtt_ms - connection.avg_rtt_ms)
+        if returncode is None or returncode == SSH_TRANSPORT_FAILURE:
+            connection.transport_failures += 1
+            connection.healthy_until = 0.0
+
+    def stats(self, node_id: str) -> dict[str, object]:
+        connection = self._connection(node_id)
+        return {
+            "healthy": time.monotonic() < connection.healthy_until,
+            "masters_started": connection.masters_started,
+            "master_failures": connection.master_failures,
+            "commands": connection.commands,
+            "transport_failures": connection.transport_failures,
+            "last_rtt_ms": round(connection.last_rtt_ms, 1) if connection.last_rtt_ms is not None else None,
+            "avg_rtt_ms": round(connection.avg_rtt_ms, 1) if connection.avg_rtt_ms is not None else None,
+        }
+
+
 class NodeRunner:
     """Run commands on the primary host or on a registered SSH node."""
 
-    def __init__(self, registry: NodeRegistry):
+    def __init__(self, registry: NodeRegistry, pool: Optional[NodeConnectionPool] = None):
         self.registry = registry
+        self.pool = pool or NodeConnectionPool()
 
     def is_primary(self, node_id: Optional[str]) -> bool:
         return normalize_node_id(node_id) == PRIMARY_NODE
@@ -168,9 +304,24 @@ class NodeRunner:
             "capture_output": capture_output,
             "text": text,
         }
-        if self.is_primary(node_id) and cwd:
-            run_kwargs["cwd"] = cwd
-        return subprocess.run(cmd, **run_kwargs)
+        if self.is_primary(node_id):
+            if cwd:
+                run_kwargs["cwd"] = cwd
+            return subprocess.run(cmd, **run_kwargs)
+
+        node = self.registry.require(node_id)
+        self._ensure_connection(node)
+        started = time.monotonic()
+        returncode: Optional[int] = None
+        try:
+            result = subprocess.run(cmd, **run_kwargs)
+            returncode = result.returncode
+            return result
+        except subprocess.CalledProcessError as exc:
+            returncode = exc.returncode
+            raise
+        finally:
+            self.pool.record(node.id, time.monotonic() - started, returncode)
 
     async def run_async(
         self,
@@ -182,6 +333,10 @@ class NodeRunner:
         timeout: Optional[float] = None,
     ) -> subprocess.CompletedProcess:
         cmd = self.command(node_id, argv, cwd=cwd)
+        remote_node = None if self.is_primary(node_id) else self.registry.require(node_id)
+        if remote_node is not None and self.pool.needs_check(remote_node.id):
+            await asyncio.to_thread(self._ensure_connection, remote_node)
+        started = time.monotonic()
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=cwd if self.is_primary(node_id) and cwd else None,
@@ -193,7 +348,11 @@ class NodeRunner:
         except asyncio.TimeoutError:
             proc.kill()
             await proc.wait()
+            if remote_node is not None:
+                self.pool.record(remote_node.id, time.monotonic() - started, None)
             raise
+        if remote_node is not None:
+            self.pool.record(remote_node.id, time.monotonic() - started, proc.returncode)
         result = subprocess.CompletedProcess(
             cmd,
             proc.returncode,
@@ -327,22 +486,128 @@ test -f "$path" && test -x "$path"
             return None
         return result.stdout
 
+    def connection_stats(self, node_id: Optional[str]) -> Optional[dict[str, object]]:
+        """Return ssh transport health and RTT metrics for a remote node."""
+        if self.is_primary(node_id):
+            return None
+        return self.pool.stats(normalize_node_id(node_id))
+
+    def control_path(self, node: NodeConfig) -> str:
+        """Return the node's ControlMaster socket: configured, or managed per node."""
+        return node.control_path or os.path.join(self.registry.control_dir, node.id)
+
+    def _ensure_connection(self, node: NodeConfig) -> None:
+        try:
+            self.pool.ensure(node, self.control_path(node), self._ssh_options(node))
+        except (OSError, subprocess.SubprocessError) as exc:
+            # The command itself still runs (ControlMaster=auto); it just may
+            # pay for its own handshake this time.
+            logger.debug("ssh control master check failed for node %s: %s", node.id, exc)
+
+    def read_tails(
+        self,
+        node_id: Optional[str],
+        requests: list[tuple[str, int]],
+        timeout: float = 5.0,
+    ) -> list[tuple[Optional[int], bytes]]:
+        """Return ``(size, bytes after offset)`` for several files in one round trip.
+
+        Missing files report ``(None, b"")``. Remote output is framed per file
+        as a header line, the raw bytes, and an end marker; a frame that does
+        not line up (for example a file truncated mid-read) raises for that
+        file and every file after it, so callers simply retry next poll.
+        """
+        if not requests:
+            return []
+        if self.is_primary(node_id):
+            return [_read_local_tail(path, offset) for path, offset in requests]
+
+        args: list[str] = []
+        for path, offset in requests:
+            args.extend([str(path), str(max(0, int(offset or 0)))])
+        result = self.run(
+            node_id,
+            ["/bin/sh", "-c", _READ_TAILS_SCRIPT, "sh", *args],
+            check=False,
+            timeout=timeout,
+            text=False,
+        )
+        if result.returncode != 0:
+            stderr = (result.stderr or b"").decode(errors="replace").strip()
+            raise RuntimeError(stderr or f"failed to read {len(requests)} log tails")
+        return _parse_tail_frames(result.stdout or b"", len(requests))
+
     def _ssh_options(self, node: NodeConfig) -> list[str]:
         opts = [
             "-o",
             "ControlMaster=auto",
             "-o",
-            "ControlPersist=600",
+            f"ControlPersist={DEFAULT_CONTROL_PERSIST_SECONDS}",
             "-o",
             "ConnectTimeout=5",
+            "-S",
+            self.control_path(node),
         ]
-        if node.control_path:
-            opts.extend(["-S", node.control_path])
         if node.ssh_proxy_command:
             opts.extend(["-o", f"ProxyCommand={node.ssh_proxy_command}"])
         return opts
 
 
+_TAIL_HEADER = b"__SM_TAIL__"
+_TAIL_END = b"\n__SM_TAIL_END__\n"
+_READ_TAILS_SCRIPT = """
+while [ "$#" -ge 2 ]; do
+  file=$1; offset=$2; shift 2
+  if [ ! -f "$file" ]; then
+    printf '__SM_TAIL__ missing 0\\n\\n__SM_TAIL_END__\\n'
+    continue
+  fi
+  size=$(wc -c < "$file" | tr -d '[:space:]')
+  count=0
+  if [ "$size" -gt "$offset" ]; then count=$((size - offset)); fi
+  printf '__SM_TAIL__ %s %s\\n' "$size" "$count"
+  if [ "$count" -gt 0 ]; then tail -c +$((offset + 1)) "$file" | head -c "$count"; fi
+  printf '\\n__SM_TAIL_END__\\n'
+done
+"""
+
+
+def _read_local_tail(path: str, offset: int) -> tuple[Optional[int], bytes]:
+    local_path = Path(path).expanduser()
+    if not local_path.is_file():
+        return None, b""
+    size = local_path.stat().st_size
+    if size <= offset:
+        return size, b""
+    with open(local_path, "rb") as handle:
+        handle.seek(offset)
+        return size, handle.read(size - offset)
+
+
+def _parse_tail_frames(stdout: bytes, expected: int) -> list[tuple[Optional[int], bytes]]:
+    results: list[tuple[Optional[int], bytes]] = []
+    # Login shells may print banners before the first frame.
+    pos = max(0, stdout.find(_TAIL_HEADER))
+    for index in range(expected):
+        header_end = stdout.find(b"\n", pos)
+        header = stdout[pos:header_end].split() if header_end >= 0 else []
+        if len(header) != 3 or header[0] != _TAIL_HEADER or not header[2].isdigit():
+            raise RuntimeError(f"malformed log tail frame {index}")
+        count = int(header[2])
+        content_start = header_end + 1
+        content_end = content_start + count
+        if stdout[content_end:content_end + len(_TAIL_END)] != _TAIL_END:
+            raise RuntimeError(f"log tail frame {index} length mismatch")
+        pos = content_end + len(_TAIL_END)
+        if header[1] == b"missing":
+            results.append((None, b""))
+        elif header[1].isdigit():
+            results.append((int(header[1]), stdout[content_start:content_end]))
+        else:
+            raise RuntimeError(f"malformed log tail frame {index}")
+    return results
+
+
 def normalize_node_id(value: Optional[str]) -> str:
     normalized = str(value or "").strip()
     return normalized or PRIMARY_NODE
@@ -2,14 +2,18 @@
 
 import asyncio
 import inspect
+import math
 import re
 import logging
 import shlex
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Awaitable, Optional
 
+from .file_watcher import WATCHED_FALLBACK_POLL_SECONDS, get_file_watcher
 from .models import MonitorState, NotificationEvent, Session, SessionStatus
+from .session_state_journal import request_state_save_if_supported
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,36 @@ _crash_re = re.compile('|'.join(CRASH_PATTERNS))
 CRASH_DEBOUNCE_SUCCESS = timedelta(seconds=30)
 CRASH_DEBOUNCE_FAILURE = timedelta(seconds=5)
 
+# Idle sessions back off to this multiple of poll_interval unless configured.
+DEFAULT_IDLE_POLL_MULTIPLIER = 5
+# Liveness (tmux has-session) runs this many poll intervals apart per session.
+DEFAULT_LIVENESS_POLL_MULTIPLIER = 30
+# Back-off after a failed remote read, matching the per-loop error back-off.
+REMOTE_READ_BACKOFF_SECONDS = 5.0
+
+
+@dataclass
+class _PollTick:
+    """Work handed from the shared scheduler to one session's monitor task."""
+
+    last_pos: int
+    check_liveness: bool = False
+    read_result: Optional[tuple[Optional[int], str]] = None
+    read_error: Optional[Exception] = None
+
+
+@dataclass
+class _PollSlot:
+    """Per-session scheduling state for the shared output-monitor scheduler."""
+
+    session: Session
+    interval: float
+    next_poll_at: float
+    next_liveness_at: float
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=1))
+    busy: bool = False
+    watch_token: Optional[int] = None
+
 
 class OutputMonitor:
     """Monitors Claude session output for patterns that require notification."""
@@ -96,6 +130,9 @@ class OutputMonitor:
         self._crash_recovery_callback: Optional[Callable[[Session], Awaitable[None]]] = None
         self._running = False
         self._tasks: dict[str, asyncio.Task] = {}
+        self._poll_slots: dict[str, _PollSlot] = {}
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._scheduler_wake: Optional[asyncio.Event] = None
         self._file_positions: dict[str, int] = {}
         self._last_activity: dict[str, datetime] = {}
         self._notified_permissions: dict[str, datetime] = {}  # Debounce
@@ -116,6 +153,25 @@ class OutputMonitor:
         self._permission_debounce = monitor_timeouts.get("permission_debounce_seconds", 30)
         self._cleanup_notify_timeout = monitor_timeouts.get("cleanup_notify_timeout_seconds", 2)
         self._native_title_refresh_interval = monitor_timeouts.get("native_title_refresh_interval_seconds", 5)
+        self._idle_poll_interval = max(
+            self.poll_interval,
+            monitor_timeouts.get(
+                "idle_poll_interval_seconds",
+                self.poll_interval * DEFAULT_IDLE_POLL_MULTIPLIER,
+            ),
+        )
+        self._liveness_interval = monitor_timeouts.get(
+            "liveness_check_interval_seconds",
+            self.poll_interval * DEFAULT_LIVENESS_POLL_MULTIPLIER,
+        )
+        # Local logs watched via inotify are woken on write, so idle polling
+        # only needs to be a slow safety net.
+        self._watched_idle_poll_interval = max(
+            self._idle_poll_interval,
+            monitor_timeouts.get("watched_idle_poll_interval_seconds", WATCHED_FALLBACK_POLL_SECONDS),
+        )
+        file_watch_enabled = self.config.get("monitor", {}).get("file_watch", True)
+        self._file_watcher = get_file_watcher() if file_watch_enabled else None
 
     def set_event_callback(self, callback: Callable[[NotificationEvent], Awaitable[None]]):
         """Set the callback for notification events."""
@@ -211,8 +267,22 @@ class OutputMonitor:
         if initial_size is not None:
             self._file_positions[session.id] = initial_size
 
+        now = asyncio.get_running_loop().time()
+        slot = _PollSlot(
+            session=session,
+            interval=self.poll_interval,
+            next_poll_at=now + self.poll_interval,
+            next_liveness_at=now + self._liveness_interval,
+        )
+        self._poll_slots[session.id] = slot
+        if self._file_watcher is not None and not self._is_remote_session(session) and session.log_file:
+            slot.watch_token = self._file_watcher.watch(
+                session.log_file,
+                lambda session_id=session.id: self._on_log_changed(session_id),
+            )
         task = asyncio.create_task(self._monitor_loop(session))
         self._tasks[session.id] = task
+        self._ensure_scheduler()
         logger.info(f"Started monitoring session {session.id}")
 
     async def stop_monitoring(self, session_id: str):
@@ -227,6 +297,7 @@ class OutputMonitor:
             logger.info(f"Stopped monitoring session {session_id}")
 
         # Clean up state
+        self._drop_poll_slot(session_id)
         self._file_positions.pop(session_id, None)
         self._last_activity.pop(session_id, None)
         self._notified_permissions.pop(session_id, None)
@@ -243,6 +314,14 @@ class OutputMonitor:
         self._running = False
         for session_id in list(self._tasks.keys()):
             await self.stop_monitoring(session_id)
+        scheduler = self._scheduler_task
+        self._scheduler_task = None
+        if scheduler and not scheduler.done():
+            scheduler.cancel()
+            try:
+                await scheduler
+            except asyncio.CancelledError:
+                pass
 
     async def _refresh_claude_native_title_if_due(self, session: Session):
         """Refresh cached Claude native titles without adding live work to read APIs."""
@@ -259,147 +338,346 @@ class OutputMonitor:
         if callable(sync_title):
             await asyncio.to_thread(sync_title, session, True)
 
+    def _ensure_scheduler(self) -> None:
+        """Start the shared poll scheduler if it is not already running."""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_wake = asyncio.Event()
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+
+    def _drop_poll_slot(self, session_id: str) -> None:
+        slot = self._poll_slots.pop(session_id, None)
+        if slot is not None and slot.watch_token is not None and self._file_watcher is not None:
+            self._file_watcher.unwatch(slot.watch_token)
+
+    def _on_log_changed(self, session_id: str) -> None:
+        """inotify callback: poll this session on the next scheduler pass."""
+        slot = self._poll_slots.get(session_id)
+        if slot is None:
+            return
+        slot.interval = self.poll_interval
+        slot.next_poll_at = 0.0
+        if self._scheduler_wake is not None:
+            self._scheduler_wake.set()
+
+    async def _wait_for_next_tick(self) -> None:
+        """Sleep one poll interval, or until the next due slot when file watching is live."""
+        wake = self._scheduler_wake
+        if wake is None or self._file_watcher is None or not self._file_watcher.available:
+            await asyncio.sleep(self.poll_interval)
+            return
+        wake.clear()
+        now = asyncio.get_running_loop().time()
+        delay = self._watched_idle_poll_interval
+        for slot in self._poll_slots.values():
+            # A busy slot becomes due again once its task finishes.
+            due_at = now + self.poll_interval if slot.busy else slot.next_poll_at
+            delay = min(delay, due_at - now)
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        try:
+            await asyncio.wait_for(wake.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _scheduler_loop(self):
+        """Drive every monitored session from one timer.
+
+        Each tick stats and reads all due local logs in a single thread hop,
+        hands the results to the per-session monitor tasks, and spreads tmux
+        liveness probes across ticks instead of firing them all at once.
+        """
+        while True:
+            try:
+                await self._wait_for_next_tick()
+                if not self._poll_slots:
+                    if not self._tasks:
+                        break
+                    continue
+                await self._run_scheduler_tick()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Output monitor scheduler error: {e}")
+                await asyncio.sleep(5)  # Back off on error
+
+    async def _run_scheduler_tick(self):
+        """Dispatch one round of due polls."""
+        now = asyncio.get_running_loop().time()
+        due = [
+            slot for slot in self._poll_slots.values()
+            if not slot.busy and slot.next_poll_at <= now
+        ]
+        if not due:
+            return
+
+        ticks = {
+            slot.session.id: _PollTick(last_pos=self._file_positions.get(slot.session.id, 0))
+            for slot in due
+        }
+
+        # Budget liveness probes so the whole fleet is covered once per
+        # liveness interval without a subprocess burst on any single tick.
+        liveness_due = sorted(
+            (slot for slot in due if slot.next_liveness_at <= now),
+            key=lambda slot: slot.next_liveness_at,
+        )
+        ticks_per_interval = max(1, int(self._liveness_interval / self.poll_interval))
+        budget = max(1, math.ceil(len(self._poll_slots) / ticks_per_interval))
+        for slot in liveness_due[:budget]:
+            ticks[slot.session.id].check_liveness = True
+            slot.next_liveness_at = now + self._liveness_interval
+
+        # Liveness ticks read after the probe, like the per-session loop did.
+        local: list[_PollSlot] = []
+        remote_by_node: dict[str, list[_PollSlot]] = {}
+        for slot in due:
+            if ticks[slot.session.id].check_liveness:
+                continue
+            if self._is_remote_session(slot.session):
+                remote_by_node.setdefault(self._session_node(slot.session), []).append(slot)
+            else:
+                local.append(slot)
+
+        reads = []
+        if local:
+            requests = [
+                (Path(slot.session.log_file), ticks[slot.session.id].last_pos)
+                for slot in local
+            ]
+            reads.append((local, asyncio.to_thread(self._read_new_log_contents, requests)))
+        runner = getattr(self._session_manager, "node_runner", None) if self._session_manager else None
+        if runner is not None:
+            # One framed round trip per node instead of one ssh call per session.
+            for node_id, slots in remote_by_node.items():
+                requests = [(slot.session.log_file, ticks[slot.session.id].last_pos) for slot in slots]
+                reads.append((slots, asyncio.to_thread(self._read_remote_log_tails, runner, node_id, requests)))
+        if reads:
+            outcomes = await asyncio.gather(*(read for _, read in reads), return_exceptions=True)
+            for (slots, _), outcome in zip(reads, outcomes):
+                for index, slot in enumerate(slots):
+                    tick = ticks[slot.session.id]
+                    result = outcome if isinstance(outcome, Exception) else outcome[index]
+                    if isinstance(result, Exception):
+                        tick.read_error = result
+                    else:
+                        tick.read_result = result
+
+        for slot in due:
+            if self._poll_slots.get(slot.session.id) is not slot:
+                continue
+            slot.busy = True
+            slot.next_poll_at = now + slot.interval
+            slot.queue.put_nowait(ticks[slot.session.id])
+
+    def _note_poll_activity(self, session_id: str, had_output: bool) -> None:
+        """Adapt a session's poll rate: fast while output flows, slower when idle."""
+        slot = self._poll_slots.get(session_id)
+        if slot is None:
+            return
+        if had_output:
+            slot.interval = self.poll_interval
+        else:
+            idle_cap = self._watched_idle_poll_interval if slot.watch_token is not None else self._idle_poll_interval
+            slot.interval = min(idle_cap, slot.interval * 2)
+
+    def _wake_session_poll(self, session_id: str) -> None:
+        """Return a session to the fast poll rate, e.g. after input was sent."""
+        slot = self._poll_slots.get(session_id)
+        if slot is None:
+            return
+        slot.interval = self.poll_interval
+        try:
+            now = asyncio.get_running_loop().time()
+        except RuntimeError:
+            return
+        slot.next_poll_at = min(slot.next_poll_at, now + self.poll_interval)
+        if self._scheduler_wake is not None:
+            self._scheduler_wake.set()
+
     async def _monitor_loop(self, session: Session):
-        """Main monitoring loop for a session."""
-        check_counter = 0
+        """Per-session monitor: handles the polls dispatched by the scheduler."""
+        slot = self._poll_slots.get(session.id)
+        if slot is None:
+            return
 
         while True:
             try:
-                await asyncio.sleep(self.poll_interval)
-                check_counter += 1
-
-                # Every ~30 polls (~30 seconds with default 1s interval), verify tmux still exists
-                if check_counter % 30 == 0:
-                    session_exists = True
-                    exit_diagnostics = None
-                    if self._session_manager:
-                        try:
-                            session_exists = await asyncio.to_thread(
-                                self._session_manager.tmux.session_exists,
-                                session.tmux_session,
-                            )
-                            self._mark_node_unreachable(session, False)
-                        except Exception as exc:
-                            if self._is_remote_session(session):
-                                logger.warning(
-                                    "Node %s unreachable while checking tmux session %s: %s",
-                                    self._session_node(session),
-                                    session.tmux_session,
-                                    exc,
-                                )
-                                self._mark_node_unreachable(session, True)
-                                continue
-                            raise
-                        tmux_controller = self._session_manager.tmux
-                        get_exit_diagnostics = getattr(
-                            tmux_controller,
-                            "get_session_exit_diagnostics",
-                            None,
-                        )
-                        has_real_diagnostics = callable(get_exit_diagnostics) and (
-                            "get_session_exit_diagnostics" in vars(tmux_controller)
-                            or getattr(type(tmux_controller), "get_session_exit_diagnostics", None)
-                            is not None
-                        )
-                        if has_real_diagnostics:
-                            try:
-                                exit_diagnostics = await asyncio.to_thread(
-                                    get_exit_diagnostics,
-                                    session.tmux_session,
-                                )
-                                self._mark_node_unreachable(session, False)
-                            except Exception as exc:
-                                if self._is_remote_session(session):
-                                    logger.warning(
-                                        "Node %s unreachable while collecting exit diagnostics for %s: %s",
-                                        self._session_node(session),
-                                        session.tmux_session,
-                                        exc,
-                                    )
-                                    self._mark_node_unreachable(session, True)
-                                    continue
-                                raise
-                            if exit_diagnostics.get("pane_dead"):
-                                logger.info(
-                                    "Tmux session %s has a dead pane, cleaning up",
-                                    session.tmux_session,
-                                )
-                                await self._handle_session_died(session, exit_diagnostics)
-                                break
-                    if not session_exists:
-                        logger.info(f"Tmux session {session.tmux_session} no longer exists, cleaning up")
-                        await self._handle_session_died(session, exit_diagnostics)
+                tick = await slot.queue.get()
+                try:
+                    if not await self._process_poll_tick(session, slot, tick):
                         break
+                finally:
+                    slot.busy = False
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Monitor error for session {session.id}: {e}")
+                await asyncio.sleep(5)  # Back off on error
 
-                last_pos = self._file_positions.get(session.id, 0)
+    async def _process_poll_tick(self, session: Session, slot: _PollSlot, tick: _PollTick) -> bool:
+        """Apply one scheduled poll. Returns False once the session has died."""
+        if tick.check_liveness:
+            session_exists = True
+            exit_diagnostics = None
+            if self._session_manager:
                 try:
-                    current_size, new_content = await asyncio.to_thread(
-                        self._read_new_log_content_for_session,
-                        session,
-                        last_pos,
+                    session_exists = await asyncio.to_thread(
+                        self._session_manager.tmux.session_exists,
+                        session.tmux_session,
                     )
                     self._mark_node_unreachable(session, False)
                 except Exception as exc:
                     if self._is_remote_session(session):
                         logger.warning(
-                            "Node %s unreachable while reading log for %s: %s",
+                            "Node %s unreachable while checking tmux session %s: %s",
                             self._session_node(session),
-                            session.id,
+                            session.tmux_session,
                             exc,
                         )
                         self._mark_node_unreachable(session, True)
-                        await asyncio.sleep(5)
-                        continue
+                        return True
                     raise
-                if current_size is None:
-                    continue
+                tmux_controller = self._session_manager.tmux
+                get_exit_diagnostics = getattr(
+                    tmux_controller,
+                    "get_session_exit_diagnostics",
+                    None,
+                )
+                has_real_diagnostics = callable(get_exit_diagnostics) and (
+                    "get_session_exit_diagnostics" in vars(tmux_controller)
+                    or getattr(type(tmux_controller), "get_session_exit_diagnostics", None)
+                    is not None
+                )
+                if has_real_diagnostics:
+                    try:
+                        exit_diagnostics = await asyncio.to_thread(
+                            get_exit_diagnostics,
+                            session.tmux_session,
+                        )
+                        self._mark_node_unreachable(session, False)
+                    except Exception as exc:
+                        if self._is_remote_session(session):
+                            logger.warning(
+                                "Node %s unreachable while collecting exit diagnostics for %s: %s",
+                                self._session_node(session),
+                                session.tmux_session,
+                                exc,
+                            )
+                            self._mark_node_unreachable(session, True)
+                            return True
+                        raise
+                    if exit_diagnostics.get("pane_dead"):
+                        logger.info(
+                            "Tmux session %s has a dead pane, cleaning up",
+                            session.tmux_session,
+                        )
+                        await self._handle_session_died(session, exit_diagnostics)
+                        return False
+            if not session_exists:
+                logger.info(f"Tmux session {session.tmux_session} no longer exists, cleaning up")
+                await self._handle_session_died(session, exit_diagnostics)
+                return False
 
-                if current_size > last_pos:
-                    self._file_positions[session.id] = current_size
-                    now = datetime.now()
-                    self._last_activity[session.id] = now
-                    monitor_state = self._monitor_states.setdefault(session.id, MonitorState())
-                    monitor_state.last_output_at = now
-                    monitor_state.is_output_flowing = True
-                    self._no_output_cycles[session.id] = 0
-                    self._record_output_bytes(session.id, len(new_content.encode("utf-8", errors="ignore")), now)
-                    # Also update the Session model's last_activity
-                    session.last_activity = now
-                    # Save state to persist the update
-                    if self._session_manager:
-                        await self._save_session_manager_state()
-                    elif self._save_state_callback:
-                        self._save_state_callback()
-                    # Clear idle notification flag on new activity
-                    self._notified_permissions.pop(f"{session.id}_idle", None)
-
-                    # Analyze the new content
-                    await self._analyze_content(session, new_content)
-
-                else:
-                    self._refresh_output_bytes_window(session.id, datetime.now())
-                    state = self._monitor_states.setdefault(session.id, MonitorState())
-                    self._no_output_cycles[session.id] = self._no_output_cycles.get(session.id, 0) + 1
-                    if self._no_output_cycles[session.id] >= 2:
-                        state.is_output_flowing = False
-                    # No new content - check for idle
-                    await self._check_idle(session)
-
-                # Retry deferred crash recovery for sessions that failed on first attempt
-                if session.id in self._pending_crash_recovery:
-                    recovery_state = self._last_crash_recovery.get(session.id)
-                    if recovery_state:
-                        last_time, last_succeeded = recovery_state
-                        if not last_succeeded and datetime.now() - last_time > CRASH_DEBOUNCE_FAILURE:
-                            await self._flush_pending_crash_recovery(session)
-
-                await self._refresh_claude_native_title_if_due(session)
+        last_pos = tick.last_pos
+        try:
+            if tick.read_error is not None:
+                raise tick.read_error
+            if tick.read_result is not None:
+                current_size, new_content = tick.read_result
+            else:
+                current_size, new_content = await asyncio.to_thread(
+                    self._read_new_log_content_for_session,
+                    session,
+                    last_pos,
+                )
+            self._mark_node_unreachable(session, False)
+        except Exception as exc:
+            if self._is_remote_session(session):
+                logger.warning(
+                    "Node %s unreachable while reading log for %s: %s",
+                    self._session_node(session),
+                    session.id,
+                    exc,
+                )
+                self._mark_node_unreachable(session, True)
+                slot.next_poll_at = asyncio.get_running_loop().time() + REMOTE_READ_BACKOFF_SECONDS
+                return True
+            raise
+        if current_size is None:
+            return True
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Monitor error for session {session.id}: {e}")
-                await asyncio.sleep(5)  # Back off on error
+        if current_size > last_pos:
+            self._note_poll_activity(session.id, had_output=True)
+            self._file_positions[session.id] = current_size
+            now = datetime.now()
+            self._last_activity[session.id] = now
+            monitor_state = self._monitor_states.setdefault(session.id, MonitorState())
+            monitor_state.last_output_at = now
+            monitor_state.is_output_flowing = True
+            self._no_output_cycles[session.id] = 0
+            self._record_output_bytes(session.id, len(new_content.encode("utf-8", errors="ignore")), now)
+            # Also update the Session model's last_activity
+            session.last_activity = now
+            # Save state to persist the update; output bursts coalesce
+            # into one write-behind flush.
+            if self._session_manager:
+                if not request_state_save_if_supported(self._session_manager):
+                    await self._save_session_manager_state()
+            elif self._save_state_callback:
+                self._save_state_callback()
+            # Clear idle notification flag on new activity
+            self._notified_permissions.pop(f"{session.id}_idle", None)
+
+            # Analyze the new content
+            await self._analyze_content(session, new_content)
+
+        else:
+            self._note_poll_activity(session.id, had_output=False)
+            self._refresh_output_bytes_window(session.id, datetime.now())
+            state = self._monitor_states.setdefault(session.id, MonitorState())
+            self._no_output_cycles[session.id] = self._no_output_cycles.get(session.id, 0) + 1
+            if self._no_output_cycles[session.id] >= 2:
+                state.is_output_flowing = False
+            # No new content - check for idle
+            await self._check_idle(session)
+
+        # Retry deferred crash recovery for sessions that failed on first attempt
+        if session.id in self._pending_crash_recovery:
+            recovery_state = self._last_crash_recovery.get(session.id)
+            if recovery_state:
+                last_time, last_succeeded = recovery_state
+                if not last_succeeded and datetime.now() - last_time > CRASH_DEBOUNCE_FAILURE:
+                    await self._flush_pending_crash_recovery(session)
+
+        await self._refresh_claude_native_title_if_due(session)
+        return True
+
+    @classmethod
+    def _read_new_log_contents(
+        cls,
+        requests: list[tuple[Path, int]],
+    ) -> list[tuple[Optional[int], str] | Exception]:
+        """Read several local logs in one worker-thread hop; errors are returned per log."""
+        results: list[tuple[Optional[int], str] | Exception] = []
+        for log_path, last_pos in requests:
+            try:
+                results.append(cls._read_new_log_content(log_path, last_pos))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    @staticmethod
+    def _read_remote_log_tails(
+        runner,
+        node_id: str,
+        requests: list[tuple[str, int]],
+    ) -> list[tuple[Optional[int], str]]:
+        """Read every due log on one node in a single round trip."""
+        return [
+            (size, content.decode("utf-8", errors="ignore"))
+            for size, content in runner.read_tails(node_id, requests)
+        ]
 
     @staticmethod
     def _read_new_log_content(log_path: Path, last_pos: int) -> tuple[Optional[int], str]:
@@ -457,36 +735,11 @@ class OutputMonitor:
         if runner is None:
             return None, ""
 
-        marker = "__SM_LOG_CONTENT__"
-        log_file = shlex.quote(session.log_file)
-        safe_last_pos = max(0, int(last_pos or 0))
-        script = (
-            f"file={log_file}; "
-            "if [ ! -f \"$file\" ]; then exit 3; fi; "
-            "size=$(wc -c < \"$file\" | tr -d '[:space:]'); "
-            f"printf '%s\\n{marker}\\n' \"$size\"; "
-            f"if [ \"$size\" -gt {safe_last_pos} ]; then "
-            f"tail -c +$(({safe_last_pos} + 1)) \"$file\"; "
-            "fi"
-        )
-        result = runner.run(
+        return self._read_remote_log_tails(
+            runner,
             self._session_node(session),
-            ["/bin/sh", "-lc", script],
-            check=False,
-            timeout=5,
-        )
-        if result.returncode == 3:
-            return None, ""
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr or f"failed to read {session.log_file}")
-        stdout = result.stdout or ""
-        if f"\n{marker}\n" not in stdout:
-            return None, ""
-        size_text, content = stdout.split(f"\n{marker}\n", 1)
-        size_text = size_text.strip()
-        if not size_text.isdigit():
-            return None, ""
-        return int(size_text), content
+            [(session.log_file, max(0, int(last_pos or 0)))],
+        )[0]
 
     async def _analyze_content(self, session: Session, content: str):
         """Analyze new content for patterns."""
@@ -899,6 +1152,7 @@ class OutputMonitor:
         self._monitor_states.pop(session_id, None)
         self._no_output_cycles.pop(session_id, None)
         self._output_history.pop(session_id, None)
+        self._drop_poll_slot(session_id)
         self._tasks.pop(session_id, None)
         logger.info(f"Completed cleanup for session {session_id}")
 
@@ -1039,6 +1293,8 @@ class OutputMonitor:
         """Manually update last activity time (e.g., when input is sent)."""
         now = datetime.now()
         self._last_activity[session_id] = now
+        # Input usually means output is about to flow; poll at the fast rate.
+        self._wake_session_poll(session_id)
         # Also update Session model if we have access to it
         if self._session_manager:
             session = self._session_manager.get_session(session_id)
@@ -1050,7 +1306,8 @@ class OutputMonitor:
                     except RuntimeError:
                         self._session_manager._save_state()
                     else:
-                        loop.create_task(self._session_manager._save_state_async())
+                        if not request_state_save_if_supported(self._session_manager):
+                            loop.create_task(self._session_manager._save_state_async())
                 elif self._save_state_callback:
                     try:
                         loop = asyncio.get_running_loop()
@@ -0,0 +1,69 @@
+"""Background sampling of tmux pane titles for read paths.
+
+Activity projection and native-title discovery both read pane titles. Asking
+tmux per session from a request handler forks one ``display-message`` per
+session per render and blocks the event loop while it runs. The sampler
+instead refreshes every managed pane title with one ``list-panes -a`` per
+node (plus the legacy default socket when a session is not on the configured
+one) and serves reads from that snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 2.0
+
+
+class PaneTitleSampler:
+    """Hold the latest pane title for each ``(node, tmux_session)`` target."""
+
+    def __init__(self, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS):
+        self.interval_seconds = max(0.1, float(interval_seconds))
+        self._titles: dict[tuple[str, str], str] = {}
+        self.sampled_at: Optional[float] = None
+        self.samples = 0
+
+    @property
+    def active(self) -> bool:
+        """True once a sample has completed; reads are cache-only from then on."""
+        return self.sampled_at is not None
+
+    def title(self, node: str, tmux_session: str) -> Optional[str]:
+        return self._titles.get((node, tmux_session)) or None
+
+    def sample(self, tmux: Any, targets: Iterable[tuple[str, str]]) -> bool:
+        """Refresh titles for ``targets``; return True when any title changed.
+
+        Runs blocking tmux calls, so callers on the event loop should use
+        ``asyncio.to_thread``. A node whose query fails keeps its previous
+        titles rather than reading as "no title" for one interval.
+        """
+        by_node: dict[str, set[str]] = {}
+        for node, tmux_session in targets:
+            by_node.setdefault(node, set()).add(tmux_session)
+
+        previous = self._titles
+        titles: dict[tuple[str, str], str] = {}
+        for node, names in by_node.items():
+            sampled = tmux.list_pane_titles(node=node)
+            if sampled is None:
+                titles.update({key: value for key, value in previous.items() if key[0] == node})
+                continue
+            if getattr(tmux, "socket_name", None) and not names <= sampled.keys():
+                legacy = tmux.list_pane_titles(socket_name=None, node=node)
+                if legacy:
+                    sampled = {**legacy, **sampled}
+            for name in names:
+                if name in sampled:
+                    titles[(node, name)] = sampled[name]
+
+        changed = titles != previous
+        self._titles = titles
+        self.sampled_at = time.monotonic()
+        self.samples += 1
+        return changed
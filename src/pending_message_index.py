@@ -0,0 +1,161 @@
+"""In-memory index of undelivered queued messages.
+
+MessageQueueManager is the only writer of the ``message_queue`` table, so the
+set of pending messages can be kept in memory and updated alongside each
+write. The monitor loop and delivery path then answer "who has pending
+messages" and "what is pending for this session" with dictionary lookups
+instead of re-querying SQLite on every tick.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .models import QueuedMessage
+
+
+class PendingMessageIndex:
+    """Pending messages per target session, kept in queued order."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # target_session_id -> message id -> message, ordered by queued_at
+        self._by_session: Dict[str, Dict[str, QueuedMessage]] = {}
+        self._session_of: Dict[str, str] = {}
+        self._loaded = False
+        # Bumped on every change so a load racing a write is not trusted.
+        self._generation = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def load(self, messages: Iterable[QueuedMessage], generation: int) -> bool:
+        """Replace the index with ``messages`` read from the database.
+
+        ``generation`` is the value read before the query started; if a write
+        landed since then the snapshot may be stale and the index stays
+        unloaded so the next lookup reloads.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._by_session.clear()
+            self._session_of.clear()
+            for msg in sorted(messages, key=lambda m: m.queued_at):
+                self._by_session.setdefault(msg.target_session_id, {})[msg.id] = msg
+                self._session_of[msg.id] = msg.target_session_id
+            self._loaded = True
+            self.loads += 1
+            return True
+
+    def invalidate(self) -> None:
+        """Drop the index after a write it cannot account for."""
+        with self._lock:
+            self._generation += 1
+            if self._loaded:
+                self._loaded = False
+                self.invalidations += 1
+            self._by_session.clear()
+            self._session_of.clear()
+
+    def add(self, msg: QueuedMessage) -> None:
+        with self._lock:
+            self._generation += 1
+            if not self._loaded:
+                return
+            messages = self._by_session.setdefault(msg.target_session_id, {})
+            out_of_order = bool(messages) and next(reversed(messages.values())).queued_at > msg.queued_at
+            messages[msg.id] = msg
+            self._session_of[msg.id] = msg.target_session_id
+            if out_of_order:
+                ordered = sorted(messages.values(), key=lambda m: m.queued_at)
+                self._by_session[msg.target_session_id] = {m.id: m for m in ordered}
+
+    def discard(self, message_ids: Iterable[str]) -> None:
+        """Remove delivered, expired, or deleted messages."""
+        with self._lock:
+            self._generation += 1
+            if not self._loaded:
+                return
+            for message_id in message_ids:
+                session_id = self._session_of.pop(message_id, None)
+                if session_id is None:
+                    continue
+                messages = self._by_session.get(session_id)
+                if messages is None:
+                    continue
+                messages.pop(message_id, None)
+                if not messages:
+                    del self._by_session[session_id]
+
+    def discard_where(
+        self,
+        predicate: Callable[[QueuedMessage], bool],
+        target_session_id: Optional[str] = None,
+    ) -> None:
+        """Remove every pending message matching ``predicate``."""
+        with self._lock:
+            if not self._loaded:
+                self._generation += 1
+                return
+            if target_session_id is not None:
+                candidates = list(self._by_session.get(target_session_id, {}).values())
+            else:
+                candidates = [m for messages in self._by_session.values() for m in messages.values()]
+            self.discard([m.id for m in candidates if predicate(m)])
+
+    def sessions(self) -> List[str]:
+        with self._lock:
+            return list(self._by_session)
+
+    def pending(self, session_id: str, delivery_mode: Optional[str] = None) -> List[QueuedMessage]:
+        """Pending messages for ``session_id`` in queued order, optionally one mode only."""
+        with self._lock:
+            messages = self._by_session.get(session_id)
+            if not messages:
+                return []
+            if delivery_mode is None:
+                return list(messages.values())
+            return [m for m in messages.values() if m.delivery_mode == delivery_mode]
+
+    def count(self, session_id: str) -> int:
+        with self._lock:
+            return len(self._by_session.get(session_id, {}))
+
+    def oldest_pending_age(self, session_id: str, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds the oldest pending message for ``session_id`` has waited."""
+        with self._lock:
+            messages = self._by_session.get(session_id)
+            if not messages:
+                return None
+            oldest = next(iter(messages.values()))
+        return max(0.0, ((now or datetime.now()) - oldest.queued_at).total_seconds())
+
+    def stats(self, now: Optional[datetime] = None) -> dict:
+        now = now or datetime.now()
+        with self._lock:
+            modes = Counter(
+                m.delivery_mode for messages in self._by_session.values() for m in messages.values()
+            )
+            ages = {
+                session_id: self.oldest_pending_age(session_id, now)
+                for session_id in self._by_session
+            }
+            return {
+                "loaded": self._loaded,
+                "sessions": len(self._by_session),
+                "messages": len(self._session_of),
+                "by_mode": dict(modes),
+                "oldest_pending_seconds": max(ages.values(), default=None),
+                "oldest_pending_seconds_by_session": ages,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import sqlite3
@@ -12,6 +11,12 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+from .transcript_index import (
+    extract_visible_message_text as _extract_visible_message_text,
+    get_transcript_index,
+    hash_transcript_text as _hash_text,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,10 +43,6 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     return _coerce_utc(parsed)
 
 
-def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 @dataclass(frozen=True)
 class InboundTurn:
     """A user/operator input delivered to one managed session."""
@@ -442,23 +443,6 @@ class ResponseRelayLedger:
             self._conn.commit()
 
 
-def _extract_visible_message_text(entry: dict) -> str:
-    message = entry.get("message") if isinstance(entry.get("message"), dict) else {}
-    content = message.get("content", entry.get("content", []))
-    if isinstance(content, str):
-        return content.strip()
-    texts: list[str] = []
-    if isinstance(content, list):
-        for item in content:
-            if isinstance(item, str):
-                texts.append(item)
-            elif isinstance(item, dict) and item.get("type") == "text":
-                text = item.get("text")
-                if isinstance(text, str):
-                    texts.append(text)
-    return "\n".join(texts).strip()
-
-
 def _extract_visible_assistant_text(entry: dict) -> str:
     return _extract_visible_message_text(entry)
 
@@ -489,29 +473,16 @@ def find_claude_inbound_turn_boundary_offset(
         return None
 
     try:
-        data = path.read_bytes()
+        return get_transcript_index().user_text_end_offset(str(path), turn.text_hash)
     except OSError as exc:
         logger.warning("Could not read Claude transcript for inbound boundary %s: %s", transcript_path, exc)
         return None
 
-    offset = 0
-    matched_offset: Optional[int] = None
-    for raw_line in data.splitlines(keepends=True):
-        offset += len(raw_line)
-        if not raw_line.strip():
-            continue
-        try:
-            entry = json.loads(raw_line.decode("utf-8").strip())
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            logger.debug("Skipping malformed Claude transcript line for inbound boundary: %s", exc)
-            continue
-        if not isinstance(entry, dict) or entry.get("type") != "user":
-            continue
-        text = _extract_visible_message_text(entry)
-        if text and _hash_text(text) == turn.text_hash:
-            matched_offset = offset
 
-    return matched_offset
+def _read_transcript_from(path: Path, offset: int) -> bytes:
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        return handle.read()
 
 
 def collect_claude_assistant_outputs_after_turn(
@@ -523,27 +494,30 @@ def collect_claude_assistant_outputs_after_turn(
     if not path.exists():
         return []
 
+    start_offset = turn.transcript_offset
     try:
-        data = path.read_bytes()
+        if start_offset is not None:
+            if start_offset > path.stat().st_size:
+                return []
+            base_offset = start_offset
+            first_line_number = 1
+            require_timestamp = False
+        else:
+            # Skip the prefix the index proves holds no assistant line at or
+            # after delivery, instead of re-reading the whole transcript.
+            base_offset, first_line_number = get_transcript_index().assistant_scan_start(
+                str(path),
+                _coerce_utc(turn.delivered_at),
+            )
+            require_timestamp = True
+        scan_data = _read_transcript_from(path, base_offset)
     except OSError as exc:
         logger.warning("Could not read Claude transcript for relay %s: %s", transcript_path, exc)
         return []
 
-    start_offset = turn.transcript_offset
-    if start_offset is not None:
-        if start_offset > len(data):
-            return []
-        scan_data = data[start_offset:]
-        base_offset = start_offset
-        require_timestamp = False
-    else:
-        scan_data = data
-        base_offset = 0
-        require_timestamp = True
-
     outputs: list[ClaudeAssistantOutput] = []
     line_start = 0
-    for line_number, raw_line in enumerate(scan_data.splitlines(), start=1):
+    for line_number, raw_line in enumerate(scan_data.splitlines(), start=first_line_number):
         absolute_offset = base_offset + line_start
         line_start += len(raw_line) + 1
         if not raw_line.strip():
@@ -102,8 +102,11 @@ class RustShadowMiddleware:
 
             await send(message)
 
-            if message["type"] == "http.response.body" and not message.get(
-                "more_body", False
+            # A 304 revalidation carries no body to compare against Rust.
+            if (
+                message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+                and response_status != 304
             ):
                 envelope = self._build_envelope(
                     method=method,
@@ -36,6 +36,7 @@ from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
 from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.oauth2 import id_token as google_id_token
 from fastapi import FastAPI, HTTPException, Body, Request, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
@@ -52,6 +53,7 @@ from .codex_provider_policy import (
 from .codex_fork_remote import NodeAgentConnection
 from .models import (
     AdoptionProposal,
+    AdoptionProposalStatus,
     CompletionStatus,
     Session,
     SessionStatus,
@@ -67,12 +69,21 @@ from .cli.dispatch import get_auto_remind_config
 from .bug_report_store import BugReportStore
 from .human_recipients import HumanRecipient, HumanRecipientConfigError
 from .mobile_analytics import MobileAnalyticsBuilder
+from .pending_message_index import PendingMessageIndex
+from .session_events import SessionEventLog
 from .response_relay import (
     ResponseRelayLedger,
     collect_claude_assistant_outputs_after_turn,
     find_claude_inbound_turn_boundary_offset,
 )
 from .rust_shadow import RustShadowMiddleware
+from .transcript_index import get_transcript_index, read_transcript_tail
+from .session_state_journal import (
+    SessionStateJournal,
+    StateSaveScheduler,
+    load_state_with_journal,
+    request_state_save_if_supported,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +111,9 @@ MOBILE_TERMINAL_MIN_COLS = 10
 MOBILE_TERMINAL_DEFAULT_ROWS = 24
 MOBILE_TERMINAL_DEFAULT_COLS = 80
 MOBILE_TERMINAL_INITIAL_RESIZE_WAIT_SECONDS = 2.0
+# Rendered /sessions and /client/sessions snapshots are rebuilt at least this
+# often even when their change key is unchanged.
+SESSION_LIST_SNAPSHOT_MAX_AGE_SECONDS = 30.0
 DEFAULT_APP_ARTIFACTS_ROOT = Path(__file__).resolve().parents[1] / "data" / "apps"
 DEFAULT_BUG_REPORTS_DB = Path(__file__).resolve().parents[1] / "data" / "bug_reports.db"
 DEFAULT_EMAIL_INBOUND_WEBHOOK_PATH = "/api/email-inbound"
@@ -158,6 +172,10 @@ async def _decode_json_request(
 
 async def _save_session_manager_state(session_manager: object) -> bool:
     """Persist manager state when the implementation is async, sync, or mocked."""
+    # Hook handlers should not wait on disk; the write-behind flush persists
+    # this within the scheduler's latency bound.
+    if request_state_save_if_supported(session_manager):
+        return True
     save_state = getattr(session_manager, "_save_state_async", None)
     if callable(save_state):
         result = save_state()
@@ -1469,19 +1487,62 @@ def create_app(
     app.state.mobile_terminal_runtime_disabled = False
     app.state.mobile_terminal_revoked_keys: set[tuple[str, str]] = set()
     app.state.event_stream_subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+    # (endpoint, variant) -> (change key, rendered body, ETag, built_at)
+    app.state.session_list_snapshots: dict[tuple, tuple[tuple, bytes, str, float]] = {}
+    app.state.session_delta_reconcile_task: Optional[asyncio.Task] = None
+    events_config = app.state.config.get("events", {}) if isinstance(app.state.config, dict) else {}
+    session_delta_reconcile_interval = float(events_config.get("reconcile_interval_seconds", 1.0))
 
-    async def _broadcast_event_stream_event(event: dict[str, Any]) -> None:
+    def _publish_event_stream_event(event: dict[str, Any]) -> None:
         subscribers = list(app.state.event_stream_subscribers)
         for queue in subscribers:
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
+                # The stream notices it was dropped and closes; the client
+                # reconnects with Last-Event-ID and replays what it missed.
                 with contextlib.suppress(KeyError):
                     app.state.event_stream_subscribers.remove(queue)
 
-    def _event_stream_payload(event_type: str, data: dict[str, Any]) -> str:
+    async def _broadcast_event_stream_event(event: dict[str, Any]) -> None:
+        _publish_event_stream_event(event)
+
+    def _event_stream_payload(
+        event_type: str,
+        data: dict[str, Any],
+        event_id: Optional[str] = None,
+    ) -> str:
         rendered_data = json.dumps(data, separators=(",", ":"))
-        return f"event: {event_type}\ndata: {rendered_data}\n\n"
+        id_line = f"id: {event_id}\n" if event_id else ""
+        return f"{id_line}event: {event_type}\ndata: {rendered_data}\n\n"
+
+    def _session_event_log() -> Optional[SessionEventLog]:
+        log = getattr(app.state.session_manager, "session_events", None)
+        return log if isinstance(log, SessionEventLog) else None
+
+    def _refresh_session_deltas() -> None:
+        refresh = getattr(app.state.session_manager, "refresh_session_deltas", None)
+        if callable(refresh):
+            try:
+                refresh()
+            except Exception as exc:
+                logger.warning("Session delta refresh failed: %s", exc)
+
+    async def _session_delta_reconcile_loop() -> None:
+        # Mutations publish deltas immediately; this catches state that only
+        # changes with time (thinking -> idle) while anyone is listening.
+        while app.state.event_stream_subscribers:
+            await asyncio.sleep(session_delta_reconcile_interval)
+            _refresh_session_deltas()
+        app.state.session_delta_reconcile_task = None
+
+    def _ensure_session_delta_reconcile() -> None:
+        task = app.state.session_delta_reconcile_task
+        if task is None or task.done():
+            app.state.session_delta_reconcile_task = asyncio.create_task(_session_delta_reconcile_loop())
+
+    if session_manager is not None and isinstance(getattr(session_manager, "session_events", None), SessionEventLog):
+        session_manager.session_events.add_listener(_publish_event_stream_event)
 
     # Wire _app back-reference so _execute_handoff can clear server-side caches (#196)
     if session_manager:
@@ -2308,7 +2369,10 @@ def create_app(
 
         proposal_getter = getattr(app.state.session_manager, "list_adoption_proposals", None)
         if callable(proposal_getter):
-            for proposal in proposal_getter(target_session_id=session.id, status=None):
+            for proposal in proposal_getter(
+                target_session_id=session.id,
+                status=AdoptionProposalStatus.PENDING,
+            ):
                 if proposal.status.value != "pending":
                     continue
                 pending_adoption_proposals.append(_proposal_to_response(proposal))
@@ -3413,6 +3477,94 @@ def create_app(
         base["primary_action"] = _mobile_primary_action(mobile_terminal, termux_attach, descriptor)
         return base
 
+    def _session_list_change_key(sessions: list[Session], *, attach_metadata: bool = False) -> Optional[tuple]:
+        """Cheap key that changes whenever a rendered session list could.
+
+        Persisted mutations bump ``state_version``; fields that hooks and the
+        output monitor update in place without a save are compared directly.
+        Returns None (never cache) when the manager exposes no version.
+        """
+        sm = app.state.session_manager
+        version = getattr(sm, "state_version", None)
+        if not isinstance(version, int) or isinstance(version, bool):
+            return None
+        projection_enabled = _codex_rollout_enabled("enable_observability_projection")
+        latest_action_getter = getattr(sm, "get_codex_latest_activity_action", None)
+        lifecycle_getter = getattr(sm, "get_codex_fork_lifecycle_state", None)
+        rows = []
+        for session in sessions:
+            provider = getattr(session, "provider", "claude")
+            runtime = None
+            if provider == "codex-app" and projection_enabled and callable(latest_action_getter):
+                action = latest_action_getter(session.id) or {}
+                runtime = (action.get("summary_text"), action.get("started_at"), action.get("ended_at"))
+            elif provider == "codex-fork" and attach_metadata and callable(lifecycle_getter):
+                lifecycle = lifecycle_getter(session.id) or {}
+                runtime = (lifecycle.get("state"), lifecycle.get("cause_event_type"))
+            rows.append(
+                (
+                    session.id,
+                    session.status,
+                    session.last_activity,
+                    session.last_tool_call,
+                    getattr(session, "last_tool_name", None),
+                    getattr(session, "tokens_used", 0),
+                    session.agent_status_text,
+                    session.agent_status_at,
+                    session.agent_task_completed_at,
+                    session.current_task,
+                    session.friendly_name,
+                    session.native_title,
+                    session.tmux_socket_name,
+                    _get_activity_state(session),
+                    runtime,
+                )
+            )
+        return version, projection_enabled, tuple(rows)
+
+    def _if_none_match(request: Request, etag: str) -> bool:
+        header = request.headers.get("if-none-match")
+        if not header:
+            return False
+        candidates = {candidate.strip() for candidate in header.split(",")}
+        return "*" in candidates or etag in candidates
+
+    def _session_list_response(
+        request: Request,
+        cache_variant: tuple,
+        change_key: Optional[tuple],
+        render,
+    ) -> Response:
+        """Serve a session list from its rendered snapshot, with ETag/304.
+
+        ``render`` builds the payload only when ``change_key`` differs from the
+        cached snapshot's (or the snapshot outlived its max age).
+        """
+        snapshots = app.state.session_list_snapshots
+        cached = snapshots.get(cache_variant)
+        now = time.monotonic()
+        if (
+            change_key is not None
+            and cached is not None
+            and cached[0] == change_key
+            and now - cached[3] < SESSION_LIST_SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            body, etag = cached[1], cached[2]
+        else:
+            body = json.dumps(
+                jsonable_encoder(render()),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if change_key is not None:
+                snapshots[cache_variant] = (change_key, body, etag, now)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _if_none_match(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
     async def _sync_session_display_identity(
         session: Session,
         display_name: Optional[str] = None,
@@ -3716,17 +3868,55 @@ def create_app(
         }
 
     @app.get("/events")
-    async def event_stream(request: Request):
-        """Server-sent event stream for low-latency desktop UI invalidations."""
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=32)
+    async def event_stream(
+        request: Request,
+        last_event_id: Optional[str] = Query(default=None),
+    ):
+        """Server-sent event stream for low-latency UI invalidations.
+
+        Session changes arrive as ``session_delta`` events carrying an SSE id.
+        Reconnecting with ``Last-Event-ID`` (or ``?last_event_id=``) replays
+        the deltas missed since that id; when the replay ring no longer covers
+        the gap, a ``session_snapshot`` event is sent first instead.
+        """
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=256)
         app.state.event_stream_subscribers.add(queue)
+        log = _session_event_log()
+        cursor_header = request.headers.get("last-event-id") or last_event_id
 
         async def stream():
             try:
-                yield _event_stream_payload("hello", await event_state())
+                hello = await event_state()
+                sent_version = 0
+                if log is not None:
+                    # Pick up anything that changed while nobody was listening.
+                    _refresh_session_deltas()
+                    _ensure_session_delta_reconcile()
+                    hello["session_event_version"] = log.version
+                    hello["session_event_id"] = log.event_id(log.version)
+                yield _event_stream_payload("hello", hello)
+                if log is not None:
+                    cursor = log.parse_event_id(cursor_header) if cursor_header else None
+                    replay = log.since(cursor) if cursor is not None else None
+                    if cursor_header and replay is None:
+                        snapshot = log.snapshot()
+                        yield _event_stream_payload(
+                            "session_snapshot",
+                            snapshot,
+                            log.event_id(snapshot["version"]),
+                        )
+                    for event in replay or []:
+                        yield _event_stream_payload(
+                            "session_delta",
+                            event,
+                            log.event_id(event["version"]),
+                        )
+                    sent_version = log.version
                 while True:
                     if await request.is_disconnected():
                         break
+                    if queue not in app.state.event_stream_subscribers:
+                        break
                     try:
                         event = await asyncio.wait_for(queue.get(), timeout=15.0)
                     except asyncio.TimeoutError:
@@ -3734,6 +3924,12 @@ def create_app(
                         continue
 
                     event_type = str(event.get("type") or "message")
+                    if event_type == "session_delta" and log is not None:
+                        if int(event.get("version") or 0) <= sent_version:
+                            continue
+                        sent_version = int(event["version"])
+                        yield _event_stream_payload(event_type, event, log.event_id(sent_version))
+                        continue
                     yield _event_stream_payload(event_type, event)
             finally:
                 with contextlib.suppress(KeyError):
@@ -4248,8 +4444,7 @@ def create_app(
                     details={"exists": False},
                 )
 
-            with open(state_file) as f:
-                data = json.load(f)
+            data = load_state_with_journal(state_file)
 
             # Validate required structure
             if not isinstance(data, dict):
@@ -4265,14 +4460,21 @@ def create_app(
                     message="State file sessions field is not a list",
                 )
 
+            details = {
+                "exists": True,
+                "sessions_in_file": len(sessions),
+                "file_size_bytes": state_file.stat().st_size,
+            }
+            state_journal = getattr(app.state.session_manager, "_state_journal", None)
+            if isinstance(state_journal, SessionStateJournal):
+                details["journal"] = state_journal.stats()
+            state_save_scheduler = getattr(app.state.session_manager, "_state_save_scheduler", None)
+            if isinstance(state_save_scheduler, StateSaveScheduler):
+                details["saves"] = state_save_scheduler.stats()
             return HealthCheckResult(
                 status="ok",
                 message="State file valid",
-                details={
-                    "exists": True,
-                    "sessions_in_file": len(sessions),
-                    "file_size_bytes": state_file.stat().st_size,
-                },
+                details=details,
             )
 
         except json.JSONDecodeError as e:
@@ -4412,27 +4614,27 @@ def create_app(
 
             conn.close()
 
+            details = {
+                "db_exists": True,
+                "pending": pending_count,
+                "stuck": stuck_count,
+                "expired": expired_count,
+            }
+            pending_index = getattr(mq, "_pending_index", None)
+            if isinstance(pending_index, PendingMessageIndex):
+                details["pending_index"] = pending_index.stats()
+
             if stuck_count > 0 or expired_count > 0:
                 return HealthCheckResult(
                     status="warning",
                     message=f"Found {stuck_count} stuck and {expired_count} expired messages",
-                    details={
-                        "db_exists": True,
-                        "pending": pending_count,
-                        "stuck": stuck_count,
-                        "expired": expired_count,
-                    },
+                    details=details,
                 )
 
             return HealthCheckResult(
                 status="ok",
                 message="Message queue healthy",
-                details={
-                    "db_exists": True,
-                    "pending": pending_count,
-                    "stuck": 0,
-                    "expired": 0,
-                },
+                details=details,
             )
 
         except Exception as e:
@@ -4722,19 +4924,27 @@ def create_app(
         return session.to_dict()
 
     @app.get("/sessions")
-    async def list_sessions(include_stopped: bool = Query(default=False)):
-        """List all active sessions."""
+    async def list_sessions(request: Request, include_stopped: bool = Query(default=False)):
+        """List all active sessions.
+
+        Responses carry a strong ETag; a matching If-None-Match gets 304.
+        """
         if not app.state.session_manager:
             raise HTTPException(status_code=503, detail="Session manager not configured")
 
         sessions = app.state.session_manager.list_sessions(include_stopped=include_stopped)
 
-        return {
-            "sessions": [
-                _session_to_response(s, sync_display_name=False)
-                for s in sessions
-            ]
-        }
+        return _session_list_response(
+            request,
+            ("sessions", include_stopped),
+            _session_list_change_key(sessions),
+            lambda: {
+                "sessions": [
+                    _session_to_response(s, sync_display_name=False)
+                    for s in sessions
+                ]
+            },
+        )
 
     @app.get("/nodes")
     async def list_nodes():
@@ -4863,17 +5073,31 @@ def create_app(
         actor_email = _request_actor_email(request)
         path_prefix = _request_path_prefix(request, "/client/sessions") or None
         sessions = app.state.session_manager.list_sessions()
-        return {
-            "sessions": [
-                _mobile_session_payload(
-                    session,
-                    sync_display_name=False,
-                    actor_email=actor_email,
-                    path_prefix=path_prefix,
-                )
-                for session in sessions
-            ]
-        }
+        change_key = _session_list_change_key(sessions, attach_metadata=True)
+        if change_key is not None:
+            # Attach metadata also depends on access config and sshd listeners.
+            change_key += (
+                _mobile_terminal_enabled(),
+                json.dumps(_mobile_terminal_config(), sort_keys=True, default=str),
+                json.dumps(_external_access_config(), sort_keys=True, default=str),
+                _termux_lan_ssh_target(),
+            )
+        return _session_list_response(
+            request,
+            ("client_sessions", actor_email, path_prefix),
+            change_key,
+            lambda: {
+                "sessions": [
+                    _mobile_session_payload(
+                        session,
+                        sync_display_name=False,
+                        actor_email=actor_email,
+                        path_prefix=path_prefix,
+                    )
+                    for session in sessions
+                ]
+            },
+        )
 
     @app.post("/client/request-status", response_model=ClientRequestStatusResponse)
     async def request_client_status():
@@ -6765,11 +6989,35 @@ def create_app(
     async def get_last_message(session_id: str):
         """Get the last Claude message from hooks (structured output)."""
         output = app.state.last_claude_output.get(session_id)
+        if not output:
+            output = await _read_last_transcript_message(session_id)
         if not output:
             # Try "latest" as fallback
             output = app.state.last_claude_output.get("latest")
         return {"session_id": session_id, "message": output}
 
+    async def _read_last_transcript_message(session_id: str) -> Optional[str]:
+        """Read the newest assistant text from a local Claude transcript, newest-first."""
+        session_manager = app.state.session_manager
+        session = session_manager.get_session(session_id) if session_manager else None
+        if (
+            not isinstance(session, Session)
+            or session.provider != "claude"
+            or not session.transcript_path
+            or _node_id_for_session(session) != "primary"
+        ):
+            return None
+        try:
+            tail = await asyncio.to_thread(
+                read_transcript_tail,
+                session.transcript_path,
+                skip_empty_assistant=True,
+            )
+        except OSError as e:
+            logger.debug(f"Could not read transcript for last message {session_id}: {e}")
+            return None
+        return tail.last_assistant_message
+
     @app.get("/sessions/{session_id}/summary")
     async def get_summary(session_id: str, lines: int = 100):
         """
@@ -7378,48 +7626,19 @@ Provide ONLY the summary, no preamble or questions."""
                     if not transcript_file.exists():
                         logger.warning(f"Transcript file does not exist: {transcript_path}")
                         return (False, None, None, None)
-                    transcript_stat = transcript_file.stat()
-                    # JSONL file - read last lines and find last assistant message
-                    lines = transcript_file.read_text().strip().split('\n')
-                    latest_native_title = None
-                    latest_assistant_message = None
-                    for line in reversed(lines):
-                        try:
-                            entry = json.loads(line)
-                            if latest_native_title is None:
-                                if entry.get("type") == "custom-title":
-                                    candidate = str(entry.get("customTitle") or "").strip()
-                                    if candidate:
-                                        latest_native_title = candidate
-                                elif entry.get("type") == "agent-name":
-                                    candidate = str(entry.get("agentName") or "").strip()
-                                    if candidate:
-                                        latest_native_title = candidate
-                            if latest_assistant_message is None and entry.get("type") == "assistant":
-                                # Extract text from message content
-                                message = entry.get("message", {})
-                                content = message.get("content", [])
-                                texts = []
-                                for item in content:
-                                    if isinstance(item, dict) and item.get("type") == "text":
-                                        texts.append(item.get("text", ""))
-                                full_text = "\n".join(texts).strip()
-                                if full_text:
-                                    latest_assistant_message = full_text
-                                else:
-                                    # Newest assistant message exists but has no
-                                    # visible text (whitespace-only / not flushed).
-                                    # Stop here — do NOT fall back to older entries
-                                    # which would surface a stale message.
-                                    latest_assistant_message = None
-                            if latest_native_title is not None and (
-                                latest_assistant_message is not None or entry.get("type") == "assistant"
-                            ):
-                                break
-                        except json.JSONDecodeError as e:
-                            logger.debug(f"Skipping malformed JSON line in transcript: {e}")
-                            continue
-                    return (True, latest_assistant_message, latest_native_title, transcript_stat.st_mtime_ns)
+                    # An already-indexed transcript parses only lines appended
+                    # since the previous read; otherwise read newest-first from
+                    # EOF so cost tracks the last message, not the file size.
+                    # An empty newest assistant entry reports None rather than
+                    # surfacing an older, stale message.
+                    snapshot = get_transcript_index().peek(str(transcript_file))
+                    if snapshot is not None:
+                        return (True, snapshot.last_assistant_message, snapshot.native_title, snapshot.mtime_ns)
+                    tail = read_transcript_tail(transcript_file)
+                    # A title older than the message was not read; report no
+                    # mtime so the stored native title is left untouched.
+                    title_mtime_ns = tail.mtime_ns if tail.title_found else None
+                    return (True, tail.last_assistant_message, tail.native_title, title_mtime_ns)
                 except Exception as e:
                     logger.error(f"CRITICAL: Error reading transcript {transcript_path}: {e}")
                     logger.error(f"Claude output will not be available for this hook event")
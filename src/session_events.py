@@ -0,0 +1,156 @@
+"""Versioned session deltas for the ``/events`` stream.
+
+Each observable session change (status, activity state, rename, queue length,
+completion, create/remove) becomes one event with a monotonically increasing
+version. A bounded replay ring lets a reconnecting client resume from its
+``Last-Event-ID``; a client whose cursor fell out of the ring, or that was
+connected to a previous server process, gets a snapshot instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import secrets
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPLAY_SIZE = 1024
+
+# View field -> delta kind reported to clients.
+_FIELD_KINDS = {
+    "status": "status",
+    "activity_state": "activity",
+    "friendly_name": "renamed",
+    "queue_length": "queue",
+    "completion_status": "completion",
+}
+
+
+class SessionEventLog:
+    """Diff per-session views into versioned deltas and keep a replay ring.
+
+    Event ids on the wire are ``<epoch>-<version>``; the epoch changes on every
+    server start so cursors from an earlier process are never replayed
+    against a new version sequence.
+    """
+
+    def __init__(self, replay_size: int = DEFAULT_REPLAY_SIZE):
+        self.epoch = secrets.token_hex(4)
+        self._ring: deque[dict[str, Any]] = deque(maxlen=max(1, int(replay_size)))
+        self._version = 0
+        self._views: dict[str, dict[str, Any]] = {}
+        self._primed = False
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+        self.events_published = 0
+        self.refreshes = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def event_id(self, version: int) -> str:
+        return f"{self.epoch}-{version}"
+
+    def parse_event_id(self, raw: Optional[str]) -> Optional[int]:
+        """Return the version in a ``Last-Event-ID`` from this epoch, else None."""
+        epoch, sep, version = str(raw or "").strip().rpartition("-")
+        if not sep or epoch != self.epoch:
+            return None
+        try:
+            return int(version)
+        except ValueError:
+            return None
+
+    def add_listener(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def update(self, views: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Publish deltas between the previous views and ``views``.
+
+        The first call only records a baseline so a server start does not
+        replay every existing session as newly created.
+        """
+        self.refreshes += 1
+        if not self._primed:
+            self._views = {session_id: dict(view) for session_id, view in views.items()}
+            self._primed = True
+            return []
+        events: list[dict[str, Any]] = []
+        for session_id, view in views.items():
+            previous = self._views.get(session_id)
+            if previous is None:
+                events.append(self._publish(session_id, "created", ["created"], dict(view)))
+                continue
+            changes = {key: value for key, value in view.items() if previous.get(key) != value}
+            if not changes:
+                continue
+            kinds = sorted({_FIELD_KINDS.get(key, "updated") for key in changes})
+            if changes.get("status") == "stopped":
+                kinds.append("killed")
+            events.append(self._publish(session_id, "updated", kinds, changes))
+        for session_id in self._views.keys() - views.keys():
+            events.append(self._publish(session_id, "removed", ["removed"], {}))
+        self._views = {session_id: dict(view) for session_id, view in views.items()}
+        return events
+
+    def _publish(
+        self,
+        session_id: str,
+        change: str,
+        kinds: list[str],
+        fields: dict[str, Any],
+    ) -> dict[str, Any]:
+        self._version += 1
+        event = {
+            "type": "session_delta",
+            "version": self._version,
+            "session_id": session_id,
+            "change": change,
+            "kinds": kinds,
+            "fields": fields,
+            "emitted_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._ring.append(event)
+        self.events_published += 1
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as exc:
+                logger.warning("Session event listener failed: %s", exc)
+        return event
+
+    def since(self, version: int) -> Optional[list[dict[str, Any]]]:
+        """Events after ``version``, or None when the ring no longer covers the gap."""
+        if version > self._version:
+            return None
+        if version == self._version:
+            return []
+        oldest = self._ring[0]["version"] if self._ring else self._version + 1
+        if version < oldest - 1:
+            return None
+        return [event for event in self._ring if event["version"] > version]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "type": "session_snapshot",
+            "version": self._version,
+            "sessions": {session_id: dict(view) for session_id, view in self._views.items()},
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self._version,
+            "sessions": len(self._views),
+            "replay_events": len(self._ring),
+            "replay_capacity": self._ring.maxlen,
+            "events_published": self.events_published,
+            "refreshes": self.refreshes,
+            "listeners": len(self._listeners),
+        }
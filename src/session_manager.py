@@ -53,6 +53,21 @@ from .codex_provider_policy import (
     normalize_provider_mapping_phase,
 )
 from .codex_request_ledger import CodexRequestLedger
+from .session_state_journal import (
+    DEFAULT_JOURNAL_COMPACT_RECORDS,
+    DEFAULT_JOURNAL_MIN_SESSIONS,
+    DEFAULT_SAVE_MAX_LATENCY_SECONDS,
+    SessionStateJournal,
+    StateSaveScheduler,
+    apply_journal_records,
+    journal_path_for,
+    quarantine_journal,
+    read_journal_records,
+)
+from .transcript_index import get_transcript_index
+from .session_events import DEFAULT_REPLAY_SIZE, SessionEventLog
+from .pane_title_sampler import DEFAULT_SAMPLE_INTERVAL_SECONDS, PaneTitleSampler
+from .file_watcher import WATCHED_FALLBACK_POLL_SECONDS, get_file_watcher
 from .github_reviews import post_pr_review_comment, poll_for_codex_review, get_pr_repo_from_git
 from .queue_runner import QueueRunner
 
@@ -164,6 +179,23 @@ class SessionManager:
         self.config = config or {}
         self.process_generation = uuid.uuid4().hex[:12]
         self._state_save_lock = threading.Lock()
+        state_persistence_config = self.config.get("state_persistence", {})
+        self._state_journal = SessionStateJournal(
+            self.state_file,
+            min_sessions=state_persistence_config.get(
+                "journal_min_sessions", DEFAULT_JOURNAL_MIN_SESSIONS
+            ),
+            compact_every_records=state_persistence_config.get(
+                "journal_compact_records", DEFAULT_JOURNAL_COMPACT_RECORDS
+            ),
+        )
+        self._state_save_scheduler = StateSaveScheduler(
+            lambda: self._build_state_snapshot(),
+            lambda data: self._write_state_snapshot(data),
+            max_latency_seconds=state_persistence_config.get(
+                "save_max_latency_seconds", DEFAULT_SAVE_MAX_LATENCY_SECONDS
+            ),
+        )
         mq_timeouts = self.config.get("timeouts", {}).get("message_queue", {})
         self.input_delivery_wait_seconds = float(
             mq_timeouts.get("input_delivery_wait_seconds", 1.0)
@@ -182,6 +214,15 @@ class SessionManager:
         self._tmux_client_event_lock = threading.Lock()
         self._tmux_client_event_version = 0
         self._last_tmux_client_event: Optional[dict[str, Any]] = None
+        # Versioned per-session deltas for the /events stream. Mutations
+        # schedule one coalesced diff per loop iteration.
+        self.session_events = SessionEventLog(
+            replay_size=self.config.get("events", {}).get("replay_size", DEFAULT_REPLAY_SIZE)
+        )
+        self._session_delta_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_delta_refresh_scheduled = False
+        # Bumped on every persisted mutation; keys server-side list snapshots.
+        self.state_version = 0
         self.last_create_error: Optional[str] = None
         self.tmux = TmuxController(
             log_dir=log_dir,
@@ -221,6 +262,13 @@ class SessionManager:
         self.adoption_proposals: dict[str, AdoptionProposal] = {}
         self.agent_registrations: dict[str, AgentRegistration] = {}
         self.agent_role_last_session_ids: dict[str, str] = {}
+        # Reverse indexes for per-session reads (session list rendering).
+        # Rebuilt lazily after registry/proposal writes or when the backing
+        # dict is replaced (state load).
+        self._alias_index: Optional[dict[str, list[str]]] = None
+        self._alias_index_source: Optional[dict[str, AgentRegistration]] = None
+        self._pending_proposal_index: Optional[dict[str, list[AdoptionProposal]]] = None
+        self._pending_proposal_index_source: Optional[dict[str, AdoptionProposal]] = None
         self._maintainer_bootstrap_lock = asyncio.Lock()
         self._service_role_bootstrap_locks: dict[str, asyncio.Lock] = {}
 
@@ -269,6 +317,15 @@ class SessionManager:
             service_role_maintenance_config.get("poll_interval_seconds", 60.0)
         )
         self._service_role_maintenance_task: Optional[asyncio.Task[Any]] = None
+        # Read paths (activity state, native titles) use sampled pane titles
+        # once the sampler runs instead of forking tmux per session.
+        self.pane_title_sampler = PaneTitleSampler(
+            interval_seconds=self.config.get("tmux", {}).get(
+                "pane_title_sample_interval_seconds",
+                DEFAULT_SAMPLE_INTERVAL_SECONDS,
+            )
+        )
+        self._pane_title_sampler_task: Optional[asyncio.Task[Any]] = None
 
         codex_config = self.config.get("codex", {})
         codex_app_config = self.config.get("codex_app_server", codex_config)
@@ -323,6 +380,9 @@ class SessionManager:
         self.codex_fork_event_poll_interval_seconds = float(
             codex_fork_config.get("event_poll_interval_seconds", 0.5)
         )
+        self._file_watcher = (
+            get_file_watcher() if self.config.get("monitor", {}).get("file_watch", True) else None
+        )
         self.codex_fork_control_timeout_seconds = float(
             codex_fork_config.get("control_timeout_seconds", 5.0)
         )
@@ -486,6 +546,57 @@ class SessionManager:
                 "last_event": dict(self._last_tmux_client_event) if self._last_tmux_client_event else None,
             }
 
+    def _session_delta_view(self, session: Session) -> dict[str, Any]:
+        """Fields whose changes are published as session deltas."""
+        queue_length = 0
+        queue_mgr = self.message_queue_manager
+        if queue_mgr is not None:
+            try:
+                queue_length = int(queue_mgr.get_queue_length(session.id))
+            except Exception:
+                queue_length = 0
+        return {
+            "status": session.status.value,
+            "activity_state": self.get_activity_state(session),
+            "friendly_name": session.friendly_name,
+            "queue_length": queue_length,
+            "completion_status": (
+                session.completion_status.value if session.completion_status else None
+            ),
+        }
+
+    def refresh_session_deltas(self) -> list[dict[str, Any]]:
+        """Diff every session against its last published view and emit deltas."""
+        self._session_delta_refresh_scheduled = False
+        views: dict[str, dict[str, Any]] = {}
+        for session in list(self.sessions.values()):
+            try:
+                views[session.id] = self._session_delta_view(session)
+            except Exception as exc:
+                logger.debug("Skipping session delta for %s: %s", session.id, exc)
+        return self.session_events.update(views)
+
+    def notify_session_change(self) -> None:
+        """Schedule a coalesced delta refresh; safe to call from any thread."""
+        self.state_version += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            owner = self._session_delta_loop
+            if owner is not None and not owner.is_closed():
+                owner.call_soon_threadsafe(self._schedule_session_delta_refresh)
+            return
+        self._session_delta_loop = loop
+        self._schedule_session_delta_refresh()
+
+    def _schedule_session_delta_refresh(self) -> None:
+        if self._session_delta_refresh_scheduled:
+            return
+        self._session_delta_refresh_scheduled = True
+        asyncio.get_running_loop().call_soon(self.refresh_session_deltas)
+
     def _revive_stopped_tmux_session(self, tmux_session: str) -> Optional[str]:
         """Mark a stopped tmux-backed record active again when tmux reports a live client."""
         normalized_tmux_session = str(tmux_session or "").strip()
@@ -606,6 +717,7 @@ class SessionManager:
         for node in nodes:
             node_id = str(node.get("id") or PRIMARY_NODE)
             node["codex_fork_node_agent"] = self.codex_fork_node_agents.is_connected(node_id)
+            node["connection"] = self.node_runner.connection_stats(node_id)
         return nodes
 
     def ping_node(self, node: str) -> dict[str, object]:
@@ -1056,6 +1168,8 @@ class SessionManager:
         status: Optional[AdoptionProposalStatus] = None,
     ) -> list[AdoptionProposal]:
         """Return adoption proposals filtered by target and/or status."""
+        if target_session_id is not None and status == AdoptionProposalStatus.PENDING:
+            return list(self._pending_proposals_by_target().get(target_session_id, ()))
         proposals = list(self.adoption_proposals.values())
         if target_session_id is not None:
             proposals = [proposal for proposal in proposals if proposal.target_session_id == target_session_id]
@@ -1063,6 +1177,22 @@ class SessionManager:
             proposals = [proposal for proposal in proposals if proposal.status == status]
         return sorted(proposals, key=lambda proposal: (proposal.created_at, proposal.id))
 
+    def _pending_proposals_by_target(self) -> dict[str, list[AdoptionProposal]]:
+        """target_session_id -> pending proposals in (created_at, id) order."""
+        proposals = self.adoption_proposals
+        index = getattr(self, "_pending_proposal_index", None)
+        if index is None or getattr(self, "_pending_proposal_index_source", None) is not proposals:
+            index = {}
+            for proposal in sorted(proposals.values(), key=lambda proposal: (proposal.created_at, proposal.id)):
+                if proposal.status == AdoptionProposalStatus.PENDING:
+                    index.setdefault(proposal.target_session_id, []).append(proposal)
+            self._pending_proposal_index = index
+            self._pending_proposal_index_source = proposals
+        return index
+
+    def _invalidate_pending_proposal_index(self) -> None:
+        self._pending_proposal_index = None
+
     def create_adoption_proposal(
         self,
         proposer_session_id: str,
@@ -1105,6 +1235,7 @@ class SessionManager:
             target_session_id=target_session_id,
         )
         self.adoption_proposals[proposal.id] = proposal
+        self._invalidate_pending_proposal_index()
         self._save_state()
         return proposal
 
@@ -1153,6 +1284,7 @@ class SessionManager:
                     other.status = AdoptionProposalStatus.REJECTED
                     other.decided_at = proposal.decided_at
 
+        self._invalidate_pending_proposal_index()
         self._save_state()
         return proposal
 
@@ -1206,8 +1338,39 @@ class SessionManager:
                     logger.error(f"Session state may be lost! Please check {state_path}")
                     return False
 
+            journal_damaged = False
+            if state_path == self.state_file:
+                journal_path = journal_path_for(self.state_file)
+                try:
+                    records, journal_damaged = read_journal_records(
+                        journal_path,
+                        data.get("journal_generation"),
+                    )
+                except Exception as e:
+                    logger.error(f"CRITICAL: Failed to replay state journal for {self.state_file}: {e}")
+                    records, journal_damaged = [], True
+                data = apply_journal_records(data, records)
+                with self._state_save_lock:
+                    self._state_journal.prime(data)
+                    self._state_journal.journal_records = len(records)
+                    if journal_damaged:
+                        # Never append to (or truncate) a damaged journal: keep it
+                        # for inspection and fold what was replayed into a fresh
+                        # checkpoint once hydration succeeds.
+                        try:
+                            quarantined = quarantine_journal(journal_path)
+                        except OSError as e:
+                            logger.error(f"CRITICAL: Failed to move damaged state journal {journal_path} aside: {e}")
+                        else:
+                            if quarantined is not None:
+                                logger.error("Damaged session state journal moved to %s", quarantined)
+                if records:
+                    logger.info("Replayed %d session state journal record(s)", len(records))
+
             try:
                 self._hydrate_state_from_data(data)
+                if journal_damaged:
+                    self._write_state_snapshot(self._build_state_snapshot(), force_checkpoint=True)
                 return True
             except Exception as e:
                 logger.error(f"CRITICAL: Failed to load state from {state_path}: {e}")
@@ -1401,13 +1564,16 @@ class SessionManager:
             data = {"sessions": sessions_data}
             if extra_state:
                 data.update(extra_state)
-            state_path = Path(self.state_file)
-            temp_file = state_path.with_suffix(".tmp")
+            with self._state_save_lock:
+                data = self._state_journal.next_checkpoint(data)
+                state_path = Path(self.state_file)
+                temp_file = state_path.with_suffix(".tmp")
 
-            with open(temp_file, "w") as f:
-                json.dump(data, f, indent=2)
+                with open(temp_file, "w") as f:
+                    json.dump(data, f, indent=2)
 
-            temp_file.rename(state_path)
+                temp_file.rename(state_path)
+                self._state_journal.mark_checkpointed(data)
             logger.info("State file rewritten to drop legacy codex app sessions.")
             return True
         except Exception as e:
@@ -1440,20 +1606,33 @@ class SessionManager:
             ],
         }
 
-    def _write_state_snapshot(self, data: dict) -> bool:
+    def _write_state_snapshot(self, data: dict, force_checkpoint: bool = False) -> bool:
+        """Persist a state snapshot as journal deltas, or as a full checkpoint when due."""
         temp_file: Optional[Path] = None
         with self._state_save_lock:
+            records = self._state_journal.diff(data)
+            if not force_checkpoint and not self._state_journal.should_checkpoint(data, records):
+                try:
+                    self._state_journal.append(records)
+                    return True
+                except Exception as e:
+                    logger.error(f"CRITICAL: Failed to save state to {self._state_journal.journal_path}: {e}")
+                    logger.error(f"Session state NOT persisted! Data may be lost on restart.")
+                    return False
+
             try:
+                checkpoint = self._state_journal.next_checkpoint(data)
                 state_path = Path(self.state_file)
                 temp_file = state_path.with_name(
                     f"{state_path.name}.tmp.{os.getpid()}.{threading.get_ident()}"
                 )
 
                 with open(temp_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                    json.dump(checkpoint, f, indent=2)
 
                 # Atomic replace (POSIX guarantees atomicity).
                 temp_file.replace(state_path)
+                self._state_journal.mark_checkpointed(checkpoint)
                 return True
 
             except Exception as e:
@@ -1468,20 +1647,43 @@ class SessionManager:
 
     def _save_state(self) -> bool:
         """
-        Save session state to disk using atomic file operations.
+        Save session state to disk.
 
-        Uses temp file + rename to ensure atomic writes and prevent race conditions
-        when multiple async tasks call this method concurrently.
+        Sessions whose serialized form changed since the last save are appended
+        to the state journal; small fleets and periodic compactions rewrite the
+        full checkpoint using temp file + rename so concurrent callers never
+        observe a partial sessions.json.
+
+        This is the immediate path, reserved for critical transitions whose
+        loss on a crash cannot be recovered: session create/fork/restore,
+        kill, adoption proposal create/decide, recording a just-created
+        Telegram topic, and startup migrations. Every other mutation calls
+        request_state_save(). A direct save also satisfies any coalesced save
+        still waiting on its timer.
 
         Returns:
             True if state saved successfully, False if an error occurred.
         """
-        return self._write_state_snapshot(self._build_state_snapshot())
+        generation = self._state_save_scheduler.generation()
+        saved = self._write_state_snapshot(self._build_state_snapshot())
+        if saved:
+            self._state_save_scheduler.mark_clean(generation)
+        self.notify_session_change()
+        return saved
 
     async def _save_state_async(self) -> bool:
-        """Snapshot mutable manager state on the event loop, then write it off-loop."""
-        data = self._build_state_snapshot()
-        return await asyncio.to_thread(self._write_state_snapshot, data)
+        """Request a coalesced save and wait for the flush that covers it.
+
+        The snapshot is taken on the event loop when the flush timer fires, and
+        written off-loop; concurrent callers share one write.
+        """
+        self.notify_session_change()
+        return await self._state_save_scheduler.save()
+
+    def request_state_save(self) -> None:
+        """Mark state dirty without waiting; the write-behind flush persists it."""
+        self._state_save_scheduler.request()
+        self.notify_session_change()
 
     def add_event_handler(self, handler: Callable[[NotificationEvent], Awaitable[None]]):
         """Register a handler for session events."""
@@ -1923,7 +2125,7 @@ done
                     )
 
             if session.status != status_before:
-                self._save_state()
+                self.request_state_save()
 
         return snapshot
 
@@ -2375,7 +2577,7 @@ done
             changed = True
 
         if changed and persist:
-            self._save_state()
+            self.request_state_save()
         return changed
 
     def sync_codex_native_titles_from_index(self, *, persist: bool = True) -> bool:
@@ -2407,7 +2609,7 @@ done
             )
 
         if changed and persist:
-            self._save_state()
+            self.request_state_save()
         return changed
 
     def _ingest_codex_fork_tool_use_event(
@@ -2588,7 +2790,7 @@ done
 
         session.last_activity = datetime.now()
         session.status = SessionStatus.IDLE
-        self._save_state()
+        self.request_state_save()
 
         if self.message_queue_manager:
             self.message_queue_manager.mark_session_idle(
@@ -2949,7 +3151,7 @@ done
                     session.provider_resume_id = provider_session_id
                     changed = True
                 if changed:
-                    self._save_state()
+                    self.request_state_save()
         seq_raw = event.get("seq")
         seq = int(seq_raw) if isinstance(seq_raw, int) or (isinstance(seq_raw, str) and seq_raw.isdigit()) else None
         session_epoch = event.get("session_epoch")
@@ -3152,14 +3354,14 @@ done
     def get_session_resume_id(self, session: Session) -> Optional[str]:
         """Return the provider-native identifier needed to resume a stopped session."""
         if self._sync_session_resume_id(session):
-            self._save_state()
+            self.request_state_save()
         if session.provider_resume_id:
             return session.provider_resume_id
         if session.provider == "codex-fork":
             recovered = self._get_codex_resume_id_from_events(session.id)
             if recovered:
                 session.provider_resume_id = recovered
-                self._save_state()
+                self.request_state_save()
                 return recovered
         return None
 
@@ -3324,6 +3526,11 @@ done
     async def _monitor_codex_fork_event_stream(self, session_id: str):
         """Tail codex-fork event-stream file and feed reducer."""
         buffer = self.codex_fork_event_buffers.get(session_id, "")
+        # With inotify the loop sleeps until the stream is written; the event
+        # is cleared before each read so an append during the read is not lost.
+        stream_changed = asyncio.Event()
+        watch_token: Optional[int] = None
+        watched_path: Optional[Path] = None
         try:
             while True:
                 session = self.sessions.get(session_id)
@@ -3334,6 +3541,11 @@ done
                     return
 
                 stream_path = self._codex_fork_event_stream_path(session)
+                if self._file_watcher is not None and watched_path != stream_path:
+                    self._file_watcher.unwatch(watch_token)
+                    watch_token = self._file_watcher.watch(stream_path, stream_changed.set)
+                    watched_path = stream_path
+                stream_changed.clear()
                 offset = self.codex_fork_event_offsets.get(session_id, 0)
                 if stream_path.exists():
                     with open(stream_path, "r", encoding="utf-8", errors="ignore") as handle:
@@ -3354,7 +3566,16 @@ done
                         for line in lines:
                             await self._process_codex_fork_event_line(session_id, line)
 
-                await asyncio.sleep(self.codex_fork_event_poll_interval_seconds)
+                if watch_token is None:
+                    await asyncio.sleep(self.codex_fork_event_poll_interval_seconds)
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        stream_changed.wait(),
+                        max(self.codex_fork_event_poll_interval_seconds, WATCHED_FALLBACK_POLL_SECONDS),
+                    )
+                except asyncio.TimeoutError:
+                    pass
         except asyncio.CancelledError:
             raise
         except Exception as exc:
@@ -3365,6 +3586,8 @@ done
                 cause_event_type="event_stream_monitor_error",
             )
         finally:
+            if self._file_watcher is not None:
+                self._file_watcher.unwatch(watch_token)
             self.codex_fork_event_monitors.pop(session_id, None)
             self.codex_fork_event_buffers.pop(session_id, None)
 
@@ -3799,7 +4022,7 @@ done
                     logger.warning(f"Failed to auto-create topic for session {session.id}: {e}")
 
             if changed:
-                self._save_state()
+                self.request_state_save()
 
     async def create_session(
         self,
@@ -3990,7 +4213,7 @@ done
                             event_timestamp_ns=self._timestamp_to_epoch_ns(event.get("ts")),
                         )
                         fork_session.provider_resume_id = thread_id
-                        self._save_state()
+                        self.request_state_save()
                         return True, thread_id, None
 
             await asyncio.sleep(poll_interval)
@@ -4093,7 +4316,7 @@ done
         if not session:
             return False
         session.role = role
-        self._save_state()
+        self.request_state_save()
         return True
 
     def clear_role(self, session_id: str) -> bool:
@@ -4102,7 +4325,7 @@ done
         if not session:
             return False
         session.role = None
-        self._save_state()
+        self.request_state_save()
         return True
 
     @staticmethod
@@ -4123,9 +4346,27 @@ done
         return registrations
 
     def _synchronize_maintainer_alias(self) -> None:
-        """Keep the legacy maintainer compatibility field in sync with the registry."""
+        """Keep the legacy maintainer compatibility field in sync with the registry.
+
+        Every registry write ends here, so this also drops the alias index.
+        """
         registration = self._get_agent_registration_map().get("maintainer")
         self.maintainer_session_id = registration.session_id if registration else None
+        self._alias_index = None
+
+    def _session_alias_index(self) -> dict[str, list[str]]:
+        """session_id -> sorted registry roles it owns (including dead owners)."""
+        registration_map = self._get_agent_registration_map()
+        index = getattr(self, "_alias_index", None)
+        if index is None or getattr(self, "_alias_index_source", None) is not registration_map:
+            index = {}
+            for role, registration in registration_map.items():
+                index.setdefault(registration.session_id, []).append(role)
+            for roles in index.values():
+                roles.sort()
+            self._alias_index = index
+            self._alias_index_source = registration_map
+        return index
 
     def _get_live_registered_session(self, session_id: str) -> Optional[Session]:
         """Return the owning session when it is still live for registry purposes."""
@@ -4182,7 +4423,7 @@ done
         if removed:
             self._synchronize_maintainer_alias()
             if persist:
-                self._save_state()
+                self.request_state_save()
         return removed
 
     def _reparent_live_children(self, old_parent_session_id: Optional[str], new_parent_session_id: str) -> int:
@@ -4256,7 +4497,7 @@ done
         self.agent_role_last_session_ids[normalized_role] = session_id
         self._reparent_live_children(prior_holder_session_id, session_id)
         self._synchronize_maintainer_alias()
-        self._save_state()
+        self.request_state_save()
         return registration
 
     def unregister_agent_role(self, session_id: str, role: str) -> bool:
@@ -4271,7 +4512,7 @@ done
         registration_map.pop(normalized_role, None)
         self.agent_role_last_session_ids.pop(normalized_role, None)
         self._synchronize_maintainer_alias()
-        self._save_state()
+        self.request_state_save()
         return True
 
     def unregister_session_roles(self, session_id: str, persist: bool = True) -> list[str]:
@@ -4291,7 +4532,7 @@ done
             registration_map.pop(role, None)
         self._synchronize_maintainer_alias()
         if persist:
-            self._save_state()
+            self.request_state_save()
         return sorted(removed_roles)
 
     def lookup_agent_registration(self, role: str) -> Optional[AgentRegistration]:
@@ -4307,7 +4548,7 @@ done
         if not self._get_live_registered_session(registration.session_id):
             registration_map.pop(normalized_role, None)
             self._synchronize_maintainer_alias()
-            self._save_state()
+            self.request_state_save()
             return None
         return registration
 
@@ -4636,7 +4877,7 @@ done
 
                 session.role = normalized_role
                 session.auto_bootstrapped_role = normalized_role
-                self._save_state()
+                self.request_state_save()
 
                 try:
                     self.register_agent_role(session.id, normalized_role)
@@ -4681,15 +4922,14 @@ done
         return self._get_live_registered_session(registration.session_id)
 
     def get_session_aliases(self, session_id: str) -> list[str]:
-        """Return durable aliases that should resolve to this session."""
-        registration_map = self._get_agent_registration_map()
-        self._prune_agent_registrations(persist=True)
-        aliases = [
-            role
-            for role, registration in registration_map.items()
-            if registration.session_id == session_id
-        ]
-        return sorted(aliases)
+        """Return durable aliases that should resolve to this session.
+
+        Read-only: a dead owner's registrations are hidden here and removed by
+        the background maintenance prune, never written from this path.
+        """
+        if not self._get_live_registered_session(session_id):
+            return []
+        return list(self._session_alias_index().get(session_id, ()))
 
     def get_primary_session_alias(self, session_id: str) -> Optional[str]:
         """Return the canonical registry alias for one session, if any."""
@@ -4733,7 +4973,11 @@ done
         return int(value.timestamp() * 1_000_000_000)
 
     def _read_claude_transcript_metadata(self, transcript_path: str) -> dict[str, Any]:
-        """Read one Claude transcript and return title plus binding metadata."""
+        """Read one Claude transcript and return title plus binding metadata.
+
+        Backed by the shared transcript index, so repeat calls parse only the
+        bytes appended since the previous call.
+        """
         transcript_file = Path(transcript_path).expanduser()
         if not transcript_file.exists():
             return {
@@ -4743,39 +4987,16 @@ done
                 "started_at": None,
             }
 
-        stat = transcript_file.stat()
-        latest_custom_title: Optional[str] = None
-        latest_agent_name: Optional[str] = None
+        snapshot = get_transcript_index().snapshot(str(transcript_file))
         first_user_cwd: Optional[str] = None
-        first_user_timestamp: Optional[datetime] = None
-
-        with transcript_file.open() as handle:
-            for line in handle:
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(entry, dict):
-                    continue
-                if entry.get("type") == "user" and first_user_cwd is None:
-                    candidate_cwd = str(entry.get("cwd") or "").strip()
-                    if candidate_cwd:
-                        first_user_cwd = str(Path(candidate_cwd).expanduser().resolve())
-                    first_user_timestamp = self._parse_claude_timestamp(entry.get("timestamp"))
-                if entry.get("type") == "custom-title":
-                    candidate = str(entry.get("customTitle") or "").strip()
-                    if candidate:
-                        latest_custom_title = candidate
-                elif entry.get("type") == "agent-name":
-                    candidate = str(entry.get("agentName") or "").strip()
-                    if candidate:
-                        latest_agent_name = candidate
+        if snapshot.first_user_cwd:
+            first_user_cwd = str(Path(snapshot.first_user_cwd).expanduser().resolve())
 
         return {
-            "title": latest_custom_title or latest_agent_name,
-            "mtime_ns": stat.st_mtime_ns,
+            "title": snapshot.title,
+            "mtime_ns": snapshot.mtime_ns,
             "cwd": first_user_cwd,
-            "started_at": first_user_timestamp,
+            "started_at": self._parse_claude_timestamp(snapshot.first_user_timestamp),
         }
 
     def _extract_claude_live_title(self, session: Session) -> Optional[str]:
@@ -4783,11 +5004,10 @@ done
         if session.provider != "claude" or not session.tmux_session:
             return None
 
-        tmux_controller = getattr(self, "tmux", None)
-        if tmux_controller is None or not hasattr(tmux_controller, "get_pane_title"):
+        if getattr(self, "tmux", None) is None:
             return None
 
-        raw_title = tmux_controller.get_pane_title(session.tmux_session)
+        raw_title = self._read_pane_title(session)
         if not isinstance(raw_title, str) or not raw_title:
             return None
 
@@ -4906,7 +5126,7 @@ done
                 session.native_title_updated_at_ns = time.time_ns()
                 state_changed = True
             if state_changed and persist:
-                self._save_state()
+                self.request_state_save()
             return session.native_title
 
         transcript_file = Path(session.transcript_path).expanduser()
@@ -4916,7 +5136,7 @@ done
                 session.native_title_updated_at_ns = time.time_ns()
                 state_changed = True
             if state_changed and persist:
-                self._save_state()
+                self.request_state_save()
             return session.native_title
 
         try:
@@ -4927,7 +5147,7 @@ done
                 session.native_title_updated_at_ns = time.time_ns()
                 state_changed = True
             if state_changed and persist:
-                self._save_state()
+                self.request_state_save()
             return session.native_title
 
         if session.native_title_source_mtime_ns == current_mtime_ns:
@@ -4936,7 +5156,7 @@ done
                 session.native_title_updated_at_ns = time.time_ns()
                 state_changed = True
             if state_changed and persist:
-                self._save_state()
+                self.request_state_save()
             return session.native_title
 
         try:
@@ -4948,7 +5168,7 @@ done
                 session.native_title_updated_at_ns = time.time_ns()
                 state_changed = True
             if state_changed and persist:
-                self._save_state()
+                self.request_state_save()
             return session.native_title
 
         effective_native_title = live_title or native_title
@@ -4961,7 +5181,7 @@ done
             else:
                 session.native_title_updated_at_ns = synced_mtime_ns
         if (state_changed or title_changed) and persist:
-            self._save_state()
+            self.request_state_save()
         return session.native_title
 
     def set_session_friendly_name(
@@ -5286,7 +5506,7 @@ done
             session.last_activity = datetime.now()
             if error_message:
                 session.error_message = error_message
-            self._save_state()
+            self.request_state_save()
 
     def update_telegram_thread(self, session_id: str, chat_id: int, message_id: Optional[int]):
         """Associate a Telegram thread with a session."""
@@ -5301,7 +5521,7 @@ done
                     message_id,
                     revive_deleted=True,
                 )
-            self._save_state()
+            self.request_state_save()
 
     def _get_response_relay_ledger(self):
         ledger = None
@@ -5427,14 +5647,14 @@ done
             detected_role = self.detect_role_from_prompt(text)
             if detected_role:
                 session.role = detected_role
-                self._save_state()
+                self.request_state_save()
 
         should_clear_completed_state = session.agent_task_completed_at is not None and sender_session_id != session_id
 
         def _clear_completed_state() -> None:
             if should_clear_completed_state and session.agent_task_completed_at is not None:
                 session.agent_task_completed_at = None
-                self._save_state()
+                self.request_state_save()
 
         # For permission responses, bypass queue and send directly
         if bypass_queue:
@@ -5618,7 +5838,7 @@ done
                 delivered_at=delivered_at,
             )
             _clear_completed_state()
-            self._save_state()
+            self.request_state_save()
 
         return DeliveryResult.DELIVERED if success else DeliveryResult.FAILED
 
@@ -5748,6 +5968,9 @@ done
             self._codex_fork_runtime_maintenance_task = asyncio.create_task(
                 self._run_codex_fork_runtime_maintenance_loop()
             )
+        if self._pane_title_sampler_task is None:
+            await self._sample_pane_titles()
+            self._pane_title_sampler_task = asyncio.create_task(self._run_pane_title_sampler_loop())
 
     async def stop_background_tasks(self):
         """Stop periodic maintenance tasks owned by SessionManager."""
@@ -5763,6 +5986,11 @@ done
             with contextlib.suppress(asyncio.CancelledError):
                 await self._codex_fork_runtime_maintenance_task
             self._codex_fork_runtime_maintenance_task = None
+        if self._pane_title_sampler_task is not None:
+            self._pane_title_sampler_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._pane_title_sampler_task
+            self._pane_title_sampler_task = None
         for session_id in list(self.codex_fork_event_monitors.keys()):
             await self._stop_codex_fork_event_monitor(session_id)
         pending_topic_tasks = list(self._pending_telegram_topic_tasks)
@@ -5771,6 +5999,11 @@ done
         for task in pending_topic_tasks:
             with contextlib.suppress(asyncio.CancelledError):
                 await task
+        # Fold pending and journaled deltas into sessions.json so external
+        # readers see a complete checkpoint while the server is down.
+        await self._state_save_scheduler.flush()
+        data = self._build_state_snapshot()
+        await asyncio.to_thread(self._write_state_snapshot, data, True)
 
     def reap_completed_auto_bootstrapped_service_sessions(
         self,
@@ -5813,17 +6046,75 @@ done
         return killed_session_ids
 
     async def _run_service_role_maintenance_loop(self) -> None:
-        """Periodically retire completed auto-bootstrapped service sessions."""
+        """Periodically retire completed auto-bootstrapped service sessions.
+
+        Also prunes registry roles held by dead sessions, which alias reads
+        only hide.
+        """
         try:
             while True:
                 try:
                     self.reap_completed_auto_bootstrapped_service_sessions()
                 except Exception:
                     logger.exception("Service role maintenance pass failed")
+                try:
+                    self._prune_agent_registrations(persist=True)
+                except Exception:
+                    logger.exception("Agent registry prune failed")
                 await asyncio.sleep(self.service_role_maintenance_poll_interval_seconds)
         except asyncio.CancelledError:
             raise
 
+    def _pane_title_targets(self) -> list[tuple[str, str]]:
+        """Return ``(node, tmux_session)`` for live sessions whose pane title is read."""
+        targets: list[tuple[str, str]] = []
+        for session in self.sessions.values():
+            if session.status == SessionStatus.STOPPED or not session.tmux_session:
+                continue
+            if session.provider not in ("claude", "codex-fork"):
+                continue
+            if self.is_session_node_unreachable(session):
+                continue
+            targets.append((normalize_node_id(getattr(session, "node", PRIMARY_NODE)), session.tmux_session))
+        return targets
+
+    async def _sample_pane_titles(self) -> None:
+        try:
+            await asyncio.to_thread(
+                self.pane_title_sampler.sample,
+                self.tmux,
+                self._pane_title_targets(),
+            )
+        except Exception:
+            logger.exception("Pane title sample failed")
+
+    async def _run_pane_title_sampler_loop(self) -> None:
+        """Refresh sampled pane titles off the event loop."""
+        try:
+            while True:
+                await asyncio.sleep(self.pane_title_sampler.interval_seconds)
+                await self._sample_pane_titles()
+        except asyncio.CancelledError:
+            raise
+
+    def _read_pane_title(self, session: Session) -> Optional[str]:
+        """Return the session's pane title, from the sampler once it is running.
+
+        Before the first sample (CLI tools, tests) this falls back to asking
+        tmux directly.
+        """
+        if not session.tmux_session:
+            return None
+        if self.pane_title_sampler.active:
+            return self.pane_title_sampler.title(
+                normalize_node_id(getattr(session, "node", PRIMARY_NODE)),
+                session.tmux_session,
+            )
+        title_getter = getattr(self.tmux, "get_pane_title", None)
+        if not callable(title_getter):
+            return None
+        return title_getter(session.tmux_session)
+
     def prune_codex_fork_runtime_artifacts(self) -> list[str]:
         """Remove codex-fork event/control artifacts that no longer belong to a live runtime."""
         removed: list[str] = []
@@ -5941,7 +6232,7 @@ done
             session.error_message = f"codex_fork_runtime_artifacts_missing: {reason}"
             if tmux_error:
                 session.error_message = f"{session.error_message} ({tmux_error})"
-            self._save_state()
+            self.request_state_save()
             return False, tmux_error or "failed to recreate Codex session runtime"
 
         session.error_message = None
@@ -5958,7 +6249,7 @@ done
             self._start_codex_fork_event_monitor(session)
         else:
             self.codex_fork_runtime_owner.pop(session.id, None)
-        self._save_state()
+        self.request_state_save()
         logger.info("Recreated codex-fork runtime artifacts for %s after %s", session.id, reason)
         return True, ""
 
@@ -6005,7 +6296,7 @@ done
                     self._start_codex_fork_event_monitor(session, from_eof=True)
                 if session.error_message and session.error_message.startswith("codex_fork_runtime_artifacts_missing:"):
                     session.error_message = None
-                    self._save_state()
+                    self.request_state_save()
                 continue
 
             missing: list[str] = []
@@ -6021,7 +6312,7 @@ done
                     self._start_codex_fork_event_monitor(session, from_eof=True)
                 if session.error_message and session.error_message.startswith("codex_fork_runtime_artifacts_missing:"):
                     session.error_message = None
-                    self._save_state()
+                    self.request_state_save()
                 continue
 
             reason = ", ".join(missing)
@@ -6044,7 +6335,7 @@ done
                         f"codex_fork_runtime_artifacts_missing: {reason}"
                         + (f" ({error})" if error else "")
                     )
-                    self._save_state()
+                    self.request_state_save()
                 degraded.append(session.id)
 
         return {"removed": removed, "healed": healed, "degraded": degraded}
@@ -6083,7 +6374,7 @@ done
             thread_id = await codex_session.start(thread_id=session.codex_thread_id, model=model)
             session.codex_thread_id = thread_id
             self.codex_sessions[session.id] = codex_session
-            self._save_state()
+            self.request_state_save()
             return codex_session
         except Exception as e:
             logger.error(f"Failed to ensure Codex session for {session.id}: {e}")
@@ -6206,7 +6497,7 @@ done
                 event_type="codex_fork_control_degraded",
                 payload={"reason": normalized_reason},
             )
-        self._save_state()
+        self.request_state_save()
 
     def _clear_codex_fork_control_degraded(self, session: Session) -> None:
         had_runtime_degraded = self.codex_fork_control_degraded.pop(session.id, None) is not None
@@ -6222,7 +6513,7 @@ done
             event_type="codex_fork_control_restored",
             payload={},
         )
-        self._save_state()
+        self.request_state_save()
 
     def _format_tmux_runtime_missing_message(
         self,
@@ -6283,7 +6574,7 @@ done
         if callable(cleanup_session):
             await cleanup_session(session, preserve_record=True)
         else:
-            self._save_state()
+            self.request_state_save()
         return True
 
     async def _deliver_direct(self, session: Session, text: str, model: Optional[str] = None) -> bool:
@@ -6296,7 +6587,7 @@ done
                 await codex_session.send_user_turn(text, model=model)
                 session.status = SessionStatus.RUNNING
                 session.last_activity = datetime.now()
-                self._save_state()
+                self.request_state_save()
                 if self.message_queue_manager:
                     self.message_queue_manager.mark_session_active(session.id)
                 return True
@@ -6314,7 +6605,7 @@ done
                 self._clear_codex_fork_control_degraded(session)
                 session.status = SessionStatus.RUNNING
                 session.last_activity = datetime.now()
-                self._save_state()
+                self.request_state_save()
                 if self.message_queue_manager:
                     self.message_queue_manager.mark_session_active(session.id)
                 return True
@@ -6407,7 +6698,7 @@ done
         # Update session status and activity
         session.last_activity = datetime.now()
         session.status = SessionStatus.IDLE  # Session stopped, waiting for input
-        self._save_state()
+        self.request_state_save()
 
         # Mark idle for message queue delivery
         if self.message_queue_manager:
@@ -6487,7 +6778,7 @@ done
         session.status = SessionStatus.RUNNING
         session.last_activity = datetime.now()
         # Save on turn start (lower frequency)
-        self._save_state()
+        self.request_state_save()
         if self.message_queue_manager:
             self.message_queue_manager.mark_session_active(session_id)
 
@@ -6529,7 +6820,7 @@ done
 
         session.last_activity = datetime.now()
         session.status = SessionStatus.IDLE
-        self._save_state()
+        self.request_state_save()
 
         if self.message_queue_manager:
             self.message_queue_manager.mark_session_idle(
@@ -6948,7 +7239,7 @@ done
             self._retire_codex_app_session_state(session, reason=reason, cleanup_queue=True)
             retired += 1
         if retired:
-            self._save_state()
+            self.request_state_save()
         return retired
 
     def get_activity_state(self, session_or_id: Session | str) -> str:
@@ -7060,16 +7351,12 @@ done
         """Use the live codex-fork pane as a bounded correction for idle reducer gaps."""
         if not session.tmux_session:
             return False
-        title_getter = getattr(self.tmux, "get_pane_title", None)
-        if callable(title_getter):
-            try:
-                pane_title = title_getter(session.tmux_session)
-            except Exception:
-                logger.debug("Failed to read codex-fork pane title for activity projection", exc_info=True)
-            else:
-                if self._codex_fork_pane_title_indicates_working(pane_title or ""):
-                    return True
-        return False
+        try:
+            pane_title = self._read_pane_title(session)
+        except Exception:
+            logger.debug("Failed to read codex-fork pane title for activity projection", exc_info=True)
+            return False
+        return self._codex_fork_pane_title_indicates_working(pane_title or "")
 
     def _compute_codex_app_activity(self, session: Session) -> str:
         """Compute activity state for codex-app sessions (no tmux/output monitor)."""
@@ -7251,12 +7538,12 @@ done
                 session.codex_thread_id = codex_session.thread_id
                 session.status = SessionStatus.IDLE
                 session.last_activity = datetime.now()
-                self._save_state()
+                self.request_state_save()
                 if new_prompt:
                     await codex_session.send_user_turn(new_prompt)
                     session.status = SessionStatus.RUNNING
                     session.last_activity = datetime.now()
-                    self._save_state()
+                    self.request_state_save()
                     if self.message_queue_manager:
                         self.message_queue_manager.mark_session_active(session_id)
                 elif self.message_queue_manager:
@@ -7368,7 +7655,7 @@ done
         if success:
             session.last_activity = datetime.now()
             session.status = SessionStatus.RUNNING
-            self._save_state()
+            self.request_state_save()
 
         return success
 
@@ -7705,7 +7992,7 @@ done
 
         # Reset idle baseline for ChildMonitor
         session.last_tool_call = datetime.now()
-        self._save_state()
+        self.request_state_save()
 
         # --- codex-app path: use review/start RPC ---
         if session.provider == "codex-app":
@@ -7727,7 +8014,7 @@ done
                 )
                 session.status = SessionStatus.RUNNING
                 session.last_activity = datetime.now()
-                self._save_state()
+                self.request_state_save()
             except CodexAppServerError as e:
                 if self.message_queue_manager:
                     self.message_queue_manager.mark_session_idle(session_id)
@@ -7827,7 +8114,7 @@ done
                 steer_success = await self.tmux.send_steer_text(session.tmux_session, steer_text)
                 if steer_success:
                     session.review_config.steer_delivered = True
-                    self._save_state()
+                    self.request_state_save()
                     logger.info(f"Steer text injected for session {session_id}")
                 else:
                     logger.error(f"Failed to inject steer text for session {session_id}")
@@ -8001,7 +8288,7 @@ done
             caller = self.sessions.get(caller_session_id)
             if caller:
                 caller.review_config = review_config
-                self._save_state()
+                self.request_state_save()
 
         # 4. Post @codex review comment
         try:
@@ -8016,7 +8303,7 @@ done
             caller = self.sessions.get(caller_session_id)
             if caller and caller.review_config:
                 caller.review_config.pr_comment_id = comment_result.get("comment_id")
-                self._save_state()
+                self.request_state_save()
 
         posted_at = comment_result["posted_at"]
 
@@ -8251,7 +8538,7 @@ done
             session.recovery_count += 1
             session.last_activity = datetime.now()
             session.status = SessionStatus.IDLE  # Claude starts idle after resume
-            self._save_state()
+            self.request_state_save()
 
             logger.info(
                 f"Crash recovery complete for session {session.id} "
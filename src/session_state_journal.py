@@ -0,0 +1,415 @@
+"""Append-only per-session delta journal layered over the sessions.json checkpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_GENERATION_KEY = "journal_generation"
+DEFAULT_JOURNAL_MIN_SESSIONS = 16
+DEFAULT_JOURNAL_COMPACT_RECORDS = 500
+DEFAULT_SAVE_MAX_LATENCY_SECONDS = 0.25
+
+
+def journal_path_for(state_file: Path) -> Path:
+    """Return the journal path that belongs to one sessions.json checkpoint."""
+    state_path = Path(state_file)
+    return state_path.with_name(f"{state_path.name}{JOURNAL_SUFFIX}")
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha1(_canonical_json(value).encode("utf-8")).hexdigest()
+
+
+def _split_state(data: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    sessions = [item for item in data.get("sessions", []) if isinstance(item, dict)]
+    extra_state = {
+        key: value
+        for key, value in data.items()
+        if key not in {"sessions", JOURNAL_GENERATION_KEY}
+    }
+    return sessions, extra_state
+
+
+def read_journal_records(
+    journal_path: Path,
+    generation: Optional[int],
+) -> tuple[list[dict[str, Any]], bool]:
+    """Read journal records written against ``generation``.
+
+    Returns ``(records, damaged)``. Records are empty when the journal is
+    missing or was written for a different checkpoint generation (for
+    example, a crash after a compaction replaced sessions.json but before the
+    stale journal was removed). Malformed lines, including a torn trailing
+    line from an interrupted append, are skipped so every valid delta is
+    still replayed; ``damaged`` tells the caller the file must not be
+    appended to again.
+    """
+    try:
+        raw_lines = Path(journal_path).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return [], False
+
+    records: list[dict[str, Any]] = []
+    damaged = False
+    header_seen = False
+    for index, line in enumerate(raw_lines):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(
+                "Skipping malformed record on line %d of session state journal %s",
+                index + 1,
+                journal_path,
+            )
+            damaged = True
+            continue
+        if not isinstance(record, dict):
+            damaged = True
+            continue
+        if not header_seen:
+            if record.get("op") != "header" or record.get("generation") != generation:
+                return [], damaged
+            header_seen = True
+            continue
+        records.append(record)
+    return records, damaged
+
+
+def quarantine_journal(journal_path: Path) -> Optional[Path]:
+    """Move a damaged journal aside so later appends cannot overwrite or extend it."""
+    journal_path = Path(journal_path)
+    target = journal_path.with_name(f"{journal_path.name}.corrupt.{int(time.time())}")
+    try:
+        journal_path.replace(target)
+    except FileNotFoundError:
+        return None
+    return target
+
+
+def apply_journal_records(data: dict[str, Any], records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Replay journal records onto a checkpoint payload and return the merged state."""
+    if not records:
+        return data
+
+    sessions: dict[str, dict[str, Any]] = {}
+    for item in data.get("sessions", []):
+        if isinstance(item, dict) and item.get("id"):
+            sessions[str(item["id"])] = item
+    merged = dict(data)
+    for record in records:
+        op = record.get("op")
+        if op == "upsert":
+            session = record.get("session")
+            if isinstance(session, dict) and session.get("id"):
+                sessions[str(session["id"])] = session
+        elif op == "delete":
+            sessions.pop(str(record.get("session_id") or ""), None)
+        elif op == "state":
+            state = record.get("state")
+            if isinstance(state, dict):
+                for key in [key for key in merged if key not in {"sessions", JOURNAL_GENERATION_KEY}]:
+                    if key not in state:
+                        merged.pop(key, None)
+                merged.update(state)
+    merged["sessions"] = list(sessions.values())
+    return merged
+
+
+def load_state_with_journal(state_file: Path) -> dict[str, Any]:
+    """Read sessions.json and replay any journal deltas recorded since its checkpoint."""
+    with open(state_file, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        return data
+    records, _ = read_journal_records(journal_path_for(state_file), data.get(JOURNAL_GENERATION_KEY))
+    return apply_journal_records(data, records)
+
+
+class SessionStateJournal:
+    """Tracks per-session dirtiness and appends only changed records to the journal.
+
+    The sessions.json checkpoint stays the durable, human-readable source for
+    external tooling. Between checkpoints, each save appends upsert/delete
+    records for the sessions whose serialized form changed, plus a ``state``
+    record when the non-session registry fields changed. Callers hold their
+    own save lock; this class is not thread-safe on its own.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        *,
+        min_sessions: int = DEFAULT_JOURNAL_MIN_SESSIONS,
+        compact_every_records: int = DEFAULT_JOURNAL_COMPACT_RECORDS,
+    ):
+        self.state_file = Path(state_file)
+        self.journal_path = journal_path_for(self.state_file)
+        self.min_sessions = max(0, int(min_sessions))
+        self.compact_every_records = max(1, int(compact_every_records))
+        self.generation = 0
+        self.journal_records = 0
+        self.journal_appends = 0
+        self.checkpoints = 0
+        self._primed = False
+        self._session_fingerprints: dict[str, str] = {}
+        self._state_fingerprint: Optional[str] = None
+        self._diff_fingerprints: dict[str, str] = {}
+        self._diff_state_fingerprint: Optional[str] = None
+
+    def prime(self, data: dict[str, Any]) -> None:
+        """Adopt a loaded checkpoint+journal payload as the persisted baseline."""
+        sessions, extra_state = _split_state(data)
+        try:
+            self.generation = int(data.get(JOURNAL_GENERATION_KEY) or 0)
+        except (TypeError, ValueError):
+            self.generation = 0
+        self._session_fingerprints = {
+            str(item["id"]): _fingerprint(item) for item in sessions if item.get("id")
+        }
+        self._state_fingerprint = _fingerprint(extra_state)
+        self._primed = True
+
+    def diff(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return journal records needed to move the persisted baseline to ``data``."""
+        sessions, extra_state = _split_state(data)
+        records: list[dict[str, Any]] = []
+        fingerprints: dict[str, str] = {}
+        for item in sessions:
+            session_id = str(item.get("id") or "")
+            if not session_id:
+                continue
+            fingerprints[session_id] = _fingerprint(item)
+            if self._session_fingerprints.get(session_id) != fingerprints[session_id]:
+                records.append({"op": "upsert", "session": item})
+        for session_id in self._session_fingerprints:
+            if session_id not in fingerprints:
+                records.append({"op": "delete", "session_id": session_id})
+        state_fingerprint = _fingerprint(extra_state)
+        if self._state_fingerprint != state_fingerprint:
+            records.append({"op": "state", "state": extra_state})
+        self._diff_fingerprints = fingerprints
+        self._diff_state_fingerprint = state_fingerprint
+        return records
+
+    def should_checkpoint(self, data: dict[str, Any], records: list[dict[str, Any]]) -> bool:
+        """Decide whether this save should rewrite sessions.json instead of appending."""
+        if not self._primed:
+            return True
+        if len(data.get("sessions", [])) < self.min_sessions:
+            return True
+        return self.journal_records + len(records) > self.compact_every_records
+
+    def next_checkpoint(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Stamp a checkpoint payload with a fresh generation so stale journals are ignored."""
+        stamped = dict(data)
+        stamped[JOURNAL_GENERATION_KEY] = self.generation + 1
+        return stamped
+
+    def mark_checkpointed(self, data: dict[str, Any]) -> None:
+        """Record a completed checkpoint write and discard the now-redundant journal."""
+        self.prime(data)
+        self.journal_records = 0
+        self.checkpoints += 1
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            # The generation bump already makes the old journal unreplayable.
+            logger.warning("Failed to remove compacted session state journal %s: %s", self.journal_path, exc)
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        """Append records returned by the preceding ``diff``; raises OSError when the write fails."""
+        if not records:
+            return
+        lines: list[str] = []
+        if self.journal_records == 0:
+            lines.append(_canonical_json({"op": "header", "generation": self.generation}))
+        lines.extend(_canonical_json(record) for record in records)
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        # One write per batch keeps a crash from interleaving partial records.
+        mode = "ab" if self.journal_records else "wb"
+        with open(self.journal_path, mode) as f:
+            f.write(payload)
+
+        self._session_fingerprints = dict(self._diff_fingerprints)
+        self._state_fingerprint = self._diff_state_fingerprint
+        self.journal_records += len(records)
+        self.journal_appends += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "journal_records": self.journal_records,
+            "journal_appends": self.journal_appends,
+            "checkpoints": self.checkpoints,
+            "tracked_sessions": len(self._session_fingerprints),
+        }
+
+
+def request_state_save_if_supported(session_manager: object) -> bool:
+    """Queue a coalesced save on managers that implement ``request_state_save``.
+
+    Looks the method up on the type so mocks that auto-create attributes fall
+    back to the caller's direct save path. Returns False when not supported.
+    """
+    if not callable(getattr(type(session_manager), "request_state_save", None)):
+        return False
+    session_manager.request_state_save()
+    return True
+
+
+class StateSaveScheduler:
+    """Coalesces bursts of state-save requests into one write-behind flush.
+
+    A request while the scheduler is idle flushes on the next loop iteration;
+    a request within ``max_latency_seconds`` of the previous flush waits until
+    that window closes. Every request that arrives before a flush runs rides
+    along, so a burst costs one snapshot and one write per window.
+    ``snapshot`` runs on the event loop and ``write`` runs in a worker thread,
+    matching ``SessionManager._save_state_async``.
+    """
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict[str, Any]],
+        write: Callable[[dict[str, Any]], bool],
+        *,
+        max_latency_seconds: float = DEFAULT_SAVE_MAX_LATENCY_SECONDS,
+    ):
+        self._snapshot = snapshot
+        self._write = write
+        self.max_latency_seconds = max(0.0, float(max_latency_seconds))
+        self.saves_requested = 0
+        self.saves_performed = 0
+        self.saves_failed = 0
+        self._generation = 0
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_future: Optional[asyncio.Future] = None
+        self._last_flush_at: Optional[float] = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def request(self) -> Optional[asyncio.Future]:
+        """Mark state dirty and arm a flush; returns the future of that flush.
+
+        Without a running event loop the save happens synchronously and
+        ``None`` is returned.
+        """
+        self.saves_requested += 1
+        self._generation += 1
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_sync()
+            return None
+        if self._flush_task is None or self._flush_task.done():
+            delay = 0.0
+            if self._last_flush_at is not None:
+                delay = max(0.0, self._last_flush_at + self.max_latency_seconds - loop.time())
+            self._flush_future = loop.create_future()
+            self._flush_task = loop.create_task(self._flush_after_delay(self._flush_future, delay))
+        return self._flush_future
+
+    async def save(self) -> bool:
+        """Request a save and wait until the coalesced flush covering it completes.
+
+        Returns after one loop iteration when the scheduler was idle, and at
+        most ``max_latency_seconds`` after the previous flush otherwise.
+        """
+        future = self.request()
+        if future is None:
+            return not self._dirty
+        return await asyncio.shield(future)
+
+    def generation(self) -> int:
+        """Return a token for ``mark_clean`` captured before taking a snapshot."""
+        return self._generation
+
+    def mark_clean(self, generation: int) -> None:
+        """Record that a direct full save covered every request up to ``generation``."""
+        if generation == self._generation:
+            self._dirty = False
+
+    async def flush(self) -> bool:
+        """Write pending state now instead of waiting for the timer (shutdown path)."""
+        task = self._flush_task
+        future = self._flush_future
+        self._flush_task = None
+        self._flush_future = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        result = await self._flush_now() if self._dirty else True
+        if future is not None and not future.done():
+            future.set_result(result)
+        return result
+
+    async def _flush_after_delay(self, future: asyncio.Future, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # Requests from here on arm a new flush rather than joining this one,
+        # because the snapshot below may already be too old for them.
+        self._flush_task = None
+        self._flush_future = None
+        result = await self._flush_now() if self._dirty else True
+        if not future.done():
+            future.set_result(result)
+
+    async def _flush_now(self) -> bool:
+        self._dirty = False
+        self._last_flush_at = asyncio.get_running_loop().time()
+        try:
+            data = self._snapshot()
+            result = bool(await asyncio.to_thread(self._write, data))
+        except Exception as exc:
+            logger.error("Coalesced state save failed: %s", exc)
+            result = False
+        self._record_result(result)
+        return result
+
+    def _flush_sync(self) -> None:
+        self._dirty = False
+        try:
+            result = bool(self._write(self._snapshot()))
+        except Exception as exc:
+            logger.error("State save failed: %s", exc)
+            result = False
+        self._record_result(result)
+
+    def _record_result(self, result: bool) -> None:
+        if result:
+            self.saves_performed += 1
+            return
+        self.saves_failed += 1
+        # Keep failed state dirty so the next flush retries it.
+        self._dirty = True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "saves_requested": self.saves_requested,
+            "saves_performed": self.saves_performed,
+            "saves_failed": self.saves_failed,
+            "dirty": self._dirty,
+            "max_latency_seconds": self.max_latency_seconds,
+        }
@@ -6,10 +6,18 @@ import os
 import shlex
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Callable, Optional
 
 from .node_runner import NodeRegistry, NodeRunner, PRIMARY_NODE, normalize_node_id
+from .tmux_snapshot import (
+    DEFAULT_SNAPSHOT_TTL_SECONDS,
+    LIST_PANES_FORMAT,
+    TmuxSnapshot,
+    TmuxSnapshotCache,
+    parse_list_panes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,10 @@ class TmuxController:
             tmux_config.get("history_limit"),
             default=100000,
         )
+        # Shared list-panes snapshots answer existence/title/mode reads.
+        self._snapshots = TmuxSnapshotCache(
+            ttl_seconds=tmux_config.get("snapshot_ttl_seconds", DEFAULT_SNAPSHOT_TTL_SECONDS)
+        )
 
         # Load timeout configuration with fallbacks
         timeouts = self.config.get("timeouts", {})
@@ -157,10 +169,17 @@ class TmuxController:
         socket_name: Optional[str],
         *,
         node: Optional[str] = PRIMARY_NODE,
+        confirm_missing: bool = False,
     ) -> bool:
+        """Answer from the shared snapshot; ``confirm_missing`` re-lists before saying no."""
         target = self._normalize_session_target(session_name)
         if not target:
             return False
+        snapshot = self.snapshot(socket_name=socket_name, node=node)
+        if snapshot is not None and not snapshot.has_session(target) and confirm_missing:
+            snapshot = self.snapshot(socket_name=socket_name, node=node, force=True)
+        if snapshot is not None:
+            return snapshot.has_session(target)
         result = subprocess.run(
             self.tmux_cmd("has-session", "-t", target, socket_name=socket_name, node=node),
             capture_output=True,
@@ -172,20 +191,90 @@ class TmuxController:
             raise RuntimeError(f"Node {normalize_node_id(node)} unreachable: {detail}")
         return result.returncode == 0
 
+    def snapshot(
+        self,
+        *,
+        socket_name: Optional[str] = "__primary__",
+        node: Optional[str] = PRIMARY_NODE,
+        force: bool = False,
+    ) -> Optional[TmuxSnapshot]:
+        """Return pane state for every session on one socket, cached briefly.
+
+        Returns None when tmux could not be listed; raises RuntimeError when
+        a remote node's SSH transport fails, like ``has-session`` did.
+        """
+        effective_node = normalize_node_id(node)
+        effective_socket = self.socket_name if socket_name == "__primary__" else socket_name
+
+        def load() -> Optional[TmuxSnapshot]:
+            started = time.monotonic()
+            try:
+                result = self._run_tmux(
+                    "list-panes",
+                    "-a",
+                    "-F",
+                    LIST_PANES_FORMAT,
+                    check=False,
+                    timeout=self.send_keys_timeout_seconds,
+                    socket_name=effective_socket,
+                    node=effective_node,
+                )
+            except subprocess.TimeoutExpired:
+                logger.warning("tmux list-panes timed out on node %s", effective_node)
+                return None
+            if result.returncode == 0:
+                return parse_list_panes(result.stdout or "", taken_at=started)
+            if effective_node != PRIMARY_NODE and result.returncode == 255:
+                detail = (result.stderr or result.stdout or "").strip() or "ssh transport failed"
+                raise RuntimeError(f"Node {effective_node} unreachable: {detail}")
+            stderr = (result.stderr or "").lower()
+            # No server on this socket means no sessions, not a failed listing.
+            if "no server running" in stderr or "error connecting" in stderr:
+                return parse_list_panes("", taken_at=started)
+            return None
+
+        return self._snapshots.get((effective_node, effective_socket), load, force=force)
+
+    def invalidate_snapshots(self, node: Optional[str] = None) -> None:
+        """Forget cached pane state after creating or killing sessions."""
+        self._snapshots.invalidate(normalize_node_id(node) if node is not None else None)
+
+    def _active_pane_snapshot(self, session_name: str, *, force: bool = False):
+        """Return the cached active-pane state for a bare session target, else None."""
+        target = self._normalize_session_target(session_name)
+        if not target or target != session_name:
+            return None
+        node = self._node_for_session(target)
+        snapshot = self.snapshot(
+            socket_name=self._resolve_socket_for_session(target, node=node),
+            node=node,
+            force=force,
+        )
+        return snapshot.pane(target) if snapshot is not None else None
+
     def _session_exists_on_socket_for_node(
         self,
         session_name: str,
         socket_name: Optional[str],
         *,
         node: Optional[str] = PRIMARY_NODE,
+        confirm_missing: bool = False,
     ) -> bool:
         """Call _session_exists_on_socket with backward compatibility for tests/mocks."""
-        try:
-            return self._session_exists_on_socket(session_name, socket_name, node=node)
-        except TypeError as exc:
-            if "unexpected keyword argument 'node'" not in str(exc):
-                raise
-            return self._session_exists_on_socket(session_name, socket_name)
+        kwargs: dict[str, object] = {"node": node}
+        if confirm_missing:
+            kwargs["confirm_missing"] = True
+        while True:
+            try:
+                return self._session_exists_on_socket(session_name, socket_name, **kwargs)
+            except TypeError as exc:
+                rejected = next(
+                    (name for name in kwargs if f"unexpected keyword argument '{name}'" in str(exc)),
+                    None,
+                )
+                if rejected is None:
+                    raise
+                kwargs.pop(rejected)
 
     def _resolve_socket_for_session(self, session_name: str, *, node: Optional[str] = None) -> Optional[str]:
         """Resolve which tmux server owns a session, supporting legacy default-server panes."""
@@ -642,6 +731,10 @@ class TmuxController:
     def _get_pane_in_mode(self, session_name: str) -> Optional[int]:
         """Return tmux pane_in_mode (1 copy-mode, 0 normal) for active pane."""
         try:
+            # Read right before injecting keys, so always re-list.
+            pane = self._active_pane_snapshot(session_name, force=True)
+            if pane is not None:
+                return pane.pane_in_mode
             result = self._run_tmux_for_session(
                 session_name,
                 "display-message", "-p", "-t", session_name, "#{pane_in_mode}",
@@ -657,6 +750,9 @@ class TmuxController:
     def get_pane_title(self, session_name: str) -> Optional[str]:
         """Return the active pane title for one tmux session."""
         try:
+            pane = self._active_pane_snapshot(session_name)
+            if pane is not None:
+                return pane.pane_title or None
             result = self._run_tmux_for_session(
                 session_name,
                 "display-message", "-p", "-t", session_name, "#{pane_title}",
@@ -669,6 +765,28 @@ class TmuxController:
         except Exception:
             return None
 
+    def list_pane_titles(
+        self,
+        *,
+        socket_name: Optional[str] = "__primary__",
+        node: Optional[str] = PRIMARY_NODE,
+    ) -> Optional[dict[str, str]]:
+        """Return active pane titles for every session on one socket.
+
+        Served from the shared snapshot, so one ``list-panes -a`` covers every
+        session. Sessions without a title map to ``""`` so callers can tell
+        them from missing ones. Returns None when tmux could not be queried
+        (as opposed to an empty server).
+        """
+        try:
+            snapshot = self.snapshot(socket_name=socket_name, node=node)
+        except Exception:
+            logger.debug("Failed to list pane titles on node %s", node, exc_info=True)
+            return None
+        if snapshot is None:
+            return None
+        return {name: pane.pane_title for name, pane in snapshot.panes.items()}
+
     def _initialize_pane_title(self, session_name: str, *, node: Optional[str] = None) -> None:
         """Seed a fresh pane with a neutral title before provider-specific updates arrive."""
         try:
@@ -1039,11 +1157,20 @@ class TmuxController:
         return True
 
     def session_exists(self, session_name: str, *, node: Optional[str] = None) -> bool:
-        """Check if a tmux session exists."""
+        """Check if a tmux session exists.
+
+        Positive answers may come from a snapshot up to the TTL old; a missing
+        session is re-listed before returning False, since callers treat that
+        as the session having died.
+        """
         effective_node = normalize_node_id(node or self._node_for_session(session_name))
-        if self._session_exists_on_socket_for_node(session_name, self.socket_name, node=effective_node):
+        if self._session_exists_on_socket_for_node(
+            session_name, self.socket_name, node=effective_node, confirm_missing=True
+        ):
             return True
-        if self.socket_name and self._session_exists_on_socket_for_node(session_name, None, node=effective_node):
+        if self.socket_name and self._session_exists_on_socket_for_node(
+            session_name, None, node=effective_node, confirm_missing=True
+        ):
             return True
         return False
 
@@ -1059,6 +1186,9 @@ class TmuxController:
     def get_history_limit(self, session_name: str) -> Optional[int]:
         """Return the active pane history limit for a tmux session."""
         try:
+            pane = self._active_pane_snapshot(session_name)
+            if pane is not None:
+                return pane.history_limit
             result = self._run_tmux_for_session(
                 session_name,
                 "display-message",
@@ -1179,6 +1309,7 @@ class TmuxController:
                 "-n", "__sm_bootstrap",
                 node=node,
             )
+            self.invalidate_snapshots(node)
             self._ensure_server_options(node=node)
             self._run_tmux("set-option", "-t", session_name, "history-limit", str(self.history_limit), node=node)
             self._run_tmux("new-window", "-d", "-t", session_name, "-n", "main", "-c", str(working_path), node=node)
@@ -1291,6 +1422,7 @@ class TmuxController:
                 "-n", "__sm_bootstrap",
                 node=node,
             )
+            self.invalidate_snapshots(node)
             self._ensure_server_options(node=node)
             self._run_tmux("set-option", "-t", session_name, "history-limit", str(self.history_limit), node=node)
             self._run_tmux("new-window", "-d", "-t", session_name, "-n", "main", "-c", str(working_path), node=node)
@@ -1647,6 +1779,7 @@ class TmuxController:
 
         try:
             self._run_tmux_for_session(session_name, "kill-session", "-t", session_name)
+            self.invalidate_snapshots(self._node_for_session(session_name))
             logger.info(f"Killed session {session_name}")
             return True
 
@@ -0,0 +1,149 @@
+"""Short-lived, shared snapshots of tmux pane state.
+
+Existence checks, socket resolution, pane titles, copy-mode and history-limit
+reads used to fork one ``tmux`` process each, per session, per caller. A
+snapshot answers all of them from a single ``list-panes -a`` per
+``(node, socket)``. Snapshots are cached for a short TTL and shared across
+threads. Callers whose answer gates a destructive or input-sensitive action
+ask for a forced refresh instead.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+DEFAULT_SNAPSHOT_TTL_SECONDS = 1.0
+
+# pane_title goes last: it is free text and may itself contain tabs.
+LIST_PANES_FORMAT = "\t".join(
+    [
+        "#{session_name}",
+        "#{window_active}",
+        "#{pane_active}",
+        "#{pane_id}",
+        "#{pane_dead}",
+        "#{pane_dead_status}",
+        "#{pane_in_mode}",
+        "#{history_limit}",
+        "#{pane_title}",
+    ]
+)
+_FIELD_COUNT = 9
+
+
+@dataclass(frozen=True)
+class PaneSnapshot:
+    """State of a session's active pane (active pane of its active window)."""
+
+    session_name: str
+    pane_id: str
+    pane_dead: bool
+    pane_dead_status: Optional[str]
+    pane_in_mode: Optional[int]
+    history_limit: Optional[int]
+    pane_title: str
+
+
+@dataclass(frozen=True)
+class TmuxSnapshot:
+    """Every session on one tmux server at ``taken_at`` (monotonic seconds)."""
+
+    panes: dict[str, PaneSnapshot]
+    taken_at: float
+
+    def has_session(self, session_name: str) -> bool:
+        return session_name in self.panes
+
+    def pane(self, session_name: str) -> Optional[PaneSnapshot]:
+        return self.panes.get(session_name)
+
+
+def _parse_optional_int(raw: str) -> Optional[int]:
+    return int(raw) if raw.isdigit() else None
+
+
+def parse_list_panes(stdout: str, taken_at: Optional[float] = None) -> TmuxSnapshot:
+    """Build a snapshot from ``list-panes -a -F LIST_PANES_FORMAT`` output."""
+    panes: dict[str, PaneSnapshot] = {}
+    for line in (stdout or "").splitlines():
+        parts = line.split("\t", _FIELD_COUNT - 1)
+        if len(parts) != _FIELD_COUNT or not parts[0]:
+            continue
+        if parts[1] != "1" or parts[2] != "1":
+            continue
+        panes[parts[0]] = PaneSnapshot(
+            session_name=parts[0],
+            pane_id=parts[3],
+            pane_dead=parts[4] == "1",
+            pane_dead_status=parts[5] or None,
+            pane_in_mode=_parse_optional_int(parts[6]),
+            history_limit=_parse_optional_int(parts[7]),
+            pane_title=parts[8].strip(),
+        )
+    return TmuxSnapshot(panes=panes, taken_at=time.monotonic() if taken_at is None else taken_at)
+
+
+class TmuxSnapshotCache:
+    """TTL cache of snapshots keyed by ``(node, socket)``.
+
+    Concurrent callers for the same key wait on one load rather than each
+    forking tmux. A loader returning None (tmux could not be queried) is not
+    cached, so the next caller retries.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._snapshots: dict[Hashable, TmuxSnapshot] = {}
+        self.loads = 0
+        self.hits = 0
+
+    def _fresh(self, key: Hashable, now: float) -> Optional[TmuxSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and now - snapshot.taken_at < self.ttl_seconds:
+            return snapshot
+        return None
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Optional[TmuxSnapshot]],
+        *,
+        force: bool = False,
+    ) -> Optional[TmuxSnapshot]:
+        requested_at = time.monotonic()
+        if not force:
+            snapshot = self._fresh(key, requested_at)
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have loaded while this one waited; a forced
+            # read still accepts it when the load started after the request.
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                if force and snapshot.taken_at >= requested_at:
+                    return snapshot
+                if not force and self._fresh(key, time.monotonic()) is snapshot:
+                    self.hits += 1
+                    return snapshot
+            self.loads += 1
+            snapshot = loader()
+            if snapshot is not None:
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def invalidate(self, node: Optional[str] = None) -> None:
+        """Drop cached snapshots for one node (or all) after tmux mutations."""
+        with self._lock:
+            if node is None:
+                self._snapshots.clear()
+                return
+            for key in [key for key in self._snapshots if isinstance(key, tuple) and key[0] == node]:
+                self._snapshots.pop(key, None)
@@ -0,0 +1,433 @@
+"""Shared, offset-resumable index over Claude JSONL transcripts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSCRIPT_INDEX_MAX_ENTRIES = 256
+_READ_CHUNK_BYTES = 1024 * 1024
+_BOUNDARY_PROBE_BYTES = 64
+DEFAULT_REVERSE_BLOCK_BYTES = 64 * 1024
+
+
+def hash_transcript_text(text: str) -> str:
+    """Hash visible message text the same way inbound turns record ``text_hash``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def extract_visible_message_text(entry: dict) -> str:
+    """Join the visible text blocks of one transcript user/assistant entry."""
+    message = entry.get("message") if isinstance(entry.get("message"), dict) else {}
+    content = message.get("content", entry.get("content", []))
+    if isinstance(content, str):
+        return content.strip()
+    texts: list[str] = []
+    if isinstance(content, list):
+        for item in content:
+            if isinstance(item, str):
+                texts.append(item)
+            elif isinstance(item, dict) and item.get("type") == "text":
+                text = item.get("text")
+                if isinstance(text, str):
+                    texts.append(text)
+    return "\n".join(texts).strip()
+
+
+def extract_assistant_message_text(entry: dict) -> str:
+    """Join text blocks of an assistant entry the way Stop hooks report them."""
+    message = entry.get("message", {})
+    content = message.get("content", []) if isinstance(message, dict) else []
+    texts = []
+    for item in content if isinstance(content, list) else []:
+        if isinstance(item, dict) and item.get("type") == "text":
+            texts.append(item.get("text", ""))
+    return "\n".join(texts).strip()
+
+
+def parse_transcript_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a transcript ISO-8601 timestamp into an aware UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class TranscriptAssistantLine:
+    """Location of one assistant entry, used to resume scans near a turn."""
+
+    offset: int
+    line_number: int
+    completed_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class TranscriptSnapshot:
+    """Metadata derived from every complete line of a transcript."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    custom_title: Optional[str]
+    agent_name: Optional[str]
+    native_title: Optional[str]
+    first_user_cwd: Optional[str]
+    first_user_timestamp: Optional[str]
+    has_assistant: bool
+    last_assistant_message: Optional[str]
+    last_nonempty_assistant_message: Optional[str]
+
+    @property
+    def title(self) -> Optional[str]:
+        """Latest custom title, falling back to the latest agent name."""
+        return self.custom_title or self.agent_name
+
+
+@dataclass
+class _TranscriptState:
+    inode: int = 0
+    mtime_ns: int = 0
+    size: int = 0
+    offset: int = 0
+    line_count: int = 0
+    custom_title: Optional[str] = None
+    agent_name: Optional[str] = None
+    native_title: Optional[str] = None
+    first_user_seen_with_cwd: bool = False
+    first_user_cwd: Optional[str] = None
+    first_user_timestamp: Optional[str] = None
+    has_assistant: bool = False
+    last_assistant_message: Optional[str] = None
+    last_nonempty_assistant_message: Optional[str] = None
+    user_hash_end_offsets: dict[str, int] = field(default_factory=dict)
+    assistant_lines: list[TranscriptAssistantLine] = field(default_factory=list)
+    tail_entry: Optional[dict[str, Any]] = None
+    boundary: bytes = b""
+
+    def reset(self, inode: int) -> None:
+        """Forget everything scanned so far, e.g. after truncation or replacement."""
+        fresh = _TranscriptState(inode=inode)
+        for name in fresh.__dataclass_fields__:
+            setattr(self, name, getattr(fresh, name))
+
+    def apply(self, entry: dict[str, Any], start: int, end: int, line_number: int) -> None:
+        entry_type = entry.get("type")
+        if entry_type == "user":
+            if not self.first_user_seen_with_cwd:
+                candidate_cwd = str(entry.get("cwd") or "").strip()
+                if candidate_cwd:
+                    self.first_user_cwd = candidate_cwd
+                    self.first_user_seen_with_cwd = True
+                self.first_user_timestamp = entry.get("timestamp")
+            text = extract_visible_message_text(entry)
+            if text:
+                self.user_hash_end_offsets[hash_transcript_text(text)] = end
+        elif entry_type == "assistant":
+            text = extract_assistant_message_text(entry)
+            self.has_assistant = True
+            self.last_assistant_message = text or None
+            if text:
+                self.last_nonempty_assistant_message = text
+            self.assistant_lines.append(
+                TranscriptAssistantLine(
+                    offset=start,
+                    line_number=line_number,
+                    completed_at=parse_transcript_timestamp(entry.get("timestamp")),
+                )
+            )
+        elif entry_type == "custom-title":
+            candidate = str(entry.get("customTitle") or "").strip()
+            if candidate:
+                self.custom_title = candidate
+                self.native_title = candidate
+        elif entry_type == "agent-name":
+            candidate = str(entry.get("agentName") or "").strip()
+            if candidate:
+                self.agent_name = candidate
+                self.native_title = candidate
+
+
+class TranscriptIndex:
+    """Remembers per-transcript scan offsets so each call parses only appended bytes.
+
+    Entries are keyed by path and invalidated when the inode changes, the
+    file shrinks below the last scanned offset, or it is rewritten in place
+    (same size, new mtime). Only newline-terminated lines advance the stored
+    offset; a trailing partial write is parsed for the current answer but
+    re-read on the next call.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TRANSCRIPT_INDEX_MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._states: OrderedDict[str, tuple[_TranscriptState, threading.Lock]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _state_for(self, key: str) -> tuple[_TranscriptState, threading.Lock]:
+        with self._lock:
+            entry = self._states.get(key)
+            if entry is None:
+                entry = (_TranscriptState(), threading.Lock())
+                self._states[key] = entry
+                while len(self._states) > self.max_entries:
+                    self._states.popitem(last=False)
+            else:
+                self._states.move_to_end(key)
+            return entry
+
+    def forget(self, transcript_path: str) -> None:
+        """Drop cached state for one transcript."""
+        key = str(Path(transcript_path).expanduser())
+        with self._lock:
+            self._states.pop(key, None)
+
+    def _refresh(self, path: Path, state: _TranscriptState) -> None:
+        """Bring ``state`` up to date with ``path``; caller holds the state's lock."""
+        stat = path.stat()
+        rewritten = stat.st_size == state.size and stat.st_mtime_ns != state.mtime_ns
+        if stat.st_ino != state.inode or stat.st_size < state.offset or (rewritten and state.size):
+            if state.size:
+                logger.debug("Transcript %s was replaced or rewritten; rescanning", path)
+            state.reset(stat.st_ino)
+        state.mtime_ns = stat.st_mtime_ns
+        if stat.st_size == state.size:
+            return
+
+        state.tail_entry = None
+        with path.open("rb") as handle:
+            if state.offset:
+                # Appends keep the bytes before the scanned offset intact; a
+                # mismatch means the file was rewritten and must be rescanned.
+                probe_start = max(0, state.offset - _BOUNDARY_PROBE_BYTES)
+                handle.seek(probe_start)
+                if handle.read(state.offset - probe_start) != state.boundary:
+                    logger.debug("Transcript %s changed before the scanned offset; rescanning", path)
+                    state.reset(stat.st_ino)
+                    state.mtime_ns = stat.st_mtime_ns
+            handle.seek(state.offset)
+            pending = b""
+            while True:
+                chunk = handle.read(_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                pending += chunk
+                line_start = 0
+                while True:
+                    newline = pending.find(b"\n", line_start)
+                    if newline < 0:
+                        break
+                    raw_line = pending[line_start:newline]
+                    start = state.offset
+                    state.offset += newline + 1 - line_start
+                    state.line_count += 1
+                    line_start = newline + 1
+                    entry = self._parse_line(raw_line)
+                    if entry is not None:
+                        state.apply(entry, start, state.offset, state.line_count)
+                if line_start:
+                    consumed = pending[max(0, line_start - _BOUNDARY_PROBE_BYTES):line_start]
+                    state.boundary = (state.boundary + consumed)[-_BOUNDARY_PROBE_BYTES:]
+                pending = pending[line_start:]
+            state.size = state.offset + len(pending)
+            if pending.strip():
+                state.tail_entry = self._parse_line(pending)
+
+    @staticmethod
+    def _parse_line(raw_line: bytes) -> Optional[dict[str, Any]]:
+        if not raw_line.strip():
+            return None
+        try:
+            entry = json.loads(raw_line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def snapshot(self, transcript_path: str) -> TranscriptSnapshot:
+        """Return current metadata, parsing only bytes appended since the last call.
+
+        Raises ``OSError`` (including ``FileNotFoundError``) when the
+        transcript cannot be read.
+        """
+        path = Path(transcript_path).expanduser()
+        state, lock = self._state_for(str(path))
+        with lock:
+            self._refresh(path, state)
+            view = _TranscriptState(
+                first_user_seen_with_cwd=state.first_user_seen_with_cwd,
+                first_user_cwd=state.first_user_cwd,
+                first_user_timestamp=state.first_user_timestamp,
+                custom_title=state.custom_title,
+                agent_name=state.agent_name,
+                native_title=state.native_title,
+                has_assistant=state.has_assistant,
+                last_assistant_message=state.last_assistant_message,
+                last_nonempty_assistant_message=state.last_nonempty_assistant_message,
+            )
+            if state.tail_entry is not None:
+                view.apply(state.tail_entry, state.offset, state.size, state.line_count + 1)
+            return TranscriptSnapshot(
+                path=str(path),
+                size=state.size,
+                mtime_ns=state.mtime_ns,
+                custom_title=view.custom_title,
+                agent_name=view.agent_name,
+                native_title=view.native_title,
+                first_user_cwd=view.first_user_cwd,
+                first_user_timestamp=view.first_user_timestamp,
+                has_assistant=view.has_assistant,
+                last_assistant_message=view.last_assistant_message,
+                last_nonempty_assistant_message=view.last_nonempty_assistant_message,
+            )
+
+    def peek(self, transcript_path: str) -> Optional[TranscriptSnapshot]:
+        """Return a refreshed snapshot only when the transcript is already indexed.
+
+        Unlike ``snapshot`` this never starts a cold full scan, so callers that
+        only need the newest entries can fall back to ``read_transcript_tail``.
+        """
+        key = str(Path(transcript_path).expanduser())
+        with self._lock:
+            if key not in self._states:
+                return None
+        return self.snapshot(key)
+
+    def user_text_end_offset(self, transcript_path: str, text_hash: str) -> Optional[int]:
+        """Return the byte offset just past the newest user line whose text hashes to ``text_hash``."""
+        path = Path(transcript_path).expanduser()
+        state, lock = self._state_for(str(path))
+        with lock:
+            self._refresh(path, state)
+            tail = state.tail_entry
+            if tail is not None and tail.get("type") == "user":
+                text = extract_visible_message_text(tail)
+                if text and hash_transcript_text(text) == text_hash:
+                    return state.size
+            return state.user_hash_end_offsets.get(text_hash)
+
+    def assistant_scan_start(self, transcript_path: str, completed_after: datetime) -> tuple[int, int]:
+        """Return ``(byte_offset, line_number)`` of the first assistant line at or after ``completed_after``.
+
+        Falls back to the end of the indexed region when no complete line
+        qualifies. Callers still filter what they read from there; this only
+        skips the prefix that cannot contain a match.
+        """
+        path = Path(transcript_path).expanduser()
+        state, lock = self._state_for(str(path))
+        with lock:
+            self._refresh(path, state)
+            for line in state.assistant_lines:
+                if line.completed_at is not None and line.completed_at >= completed_after:
+                    return line.offset, line.line_number
+            return state.offset, state.line_count + 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._states), "max_entries": self.max_entries}
+
+
+def iter_lines_reverse(
+    transcript_path: str | Path,
+    *,
+    block_size: int = DEFAULT_REVERSE_BLOCK_BYTES,
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(line_start_offset, raw_line)`` for non-blank lines, newest first.
+
+    Seeks backward from EOF in ``block_size`` reads, stitching lines that span
+    block boundaries, so reading the last N lines costs their size rather
+    than the file's. A trailing line without a newline (a partial write) is
+    yielded like any other; callers skip it when it does not parse.
+    """
+    block_size = max(1, int(block_size))
+    with Path(transcript_path).expanduser().open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        # Pieces of the line currently being assembled, newest piece first.
+        carry: list[bytes] = []
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            handle.seek(position)
+            block = handle.read(read_size)
+            end = len(block)
+            while True:
+                newline = block.rfind(b"\n", 0, end)
+                if newline < 0:
+                    carry.append(block[:end])
+                    break
+                line = block[newline + 1:end] + b"".join(reversed(carry))
+                carry = []
+                if line.strip():
+                    yield position + newline + 1, line
+                end = newline
+        line = b"".join(reversed(carry))
+        if line.strip():
+            yield 0, line
+
+
+@dataclass(frozen=True)
+class TranscriptTail:
+    """Newest assistant message (and any title newer than it) read from EOF."""
+
+    mtime_ns: int
+    assistant_found: bool
+    last_assistant_message: Optional[str]
+    title_found: bool
+    native_title: Optional[str]
+
+
+def read_transcript_tail(
+    transcript_path: str | Path,
+    *,
+    skip_empty_assistant: bool = False,
+    block_size: int = DEFAULT_REVERSE_BLOCK_BYTES,
+) -> TranscriptTail:
+    """Read newest-first until the latest assistant entry, without scanning the file.
+
+    With ``skip_empty_assistant`` the scan continues past assistant entries
+    that have no visible text; otherwise the newest assistant entry wins and
+    an empty one reports ``None`` rather than an older, stale message. Titles
+    (``custom-title``/``agent-name``) are reported only when one appears in
+    the scanned tail; ``title_found`` is False when the title is older than
+    the message and was therefore not read.
+    """
+    path = Path(transcript_path).expanduser()
+    mtime_ns = path.stat().st_mtime_ns
+    title: Optional[str] = None
+    title_found = False
+    for _, raw_line in iter_lines_reverse(path, block_size=block_size):
+        entry = TranscriptIndex._parse_line(raw_line)
+        if entry is None:
+            continue
+        entry_type = entry.get("type")
+        if not title_found and entry_type in {"custom-title", "agent-name"}:
+            key = "customTitle" if entry_type == "custom-title" else "agentName"
+            candidate = str(entry.get(key) or "").strip()
+            if candidate:
+                title, title_found = candidate, True
+        elif entry_type == "assistant":
+            text = extract_assistant_message_text(entry)
+            if text or not skip_empty_assistant:
+                return TranscriptTail(mtime_ns, True, text or None, title_found, title)
+    return TranscriptTail(mtime_ns, False, None, True, title)
+
+_shared_index = TranscriptIndex()
+
+
+def get_transcript_index() -> TranscriptIndex:
+    """Return the process-wide transcript index shared by hooks, monitors, and relays."""
+    return _shared_index
@@ -262,6 +262,35 @@ class TestSessionEndpoints:
         assert response.json()["sessions"][0]["status"] == "stopped"
         mock_session_manager.list_sessions.assert_called_once_with(include_stopped=True)
 
+    def test_list_sessions_etag_revalidation(self, test_client, mock_session_manager, sample_session):
+        """GET /sessions serves a cached snapshot with a strong ETag and 304s."""
+        mock_session_manager.state_version = 1
+        mock_session_manager.list_sessions.return_value = [sample_session]
+        mock_session_manager.get_activity_state.return_value = "idle"
+        mock_session_manager.list_adoption_proposals.return_value = []
+
+        first = test_client.get("/sessions")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert etag.startswith('"')
+
+        again = test_client.get("/sessions", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        # Unchanged fleet: the snapshot is reused instead of re-rendered.
+        assert mock_session_manager.list_adoption_proposals.call_count == 1
+
+        sample_session.agent_status_text = "deploying"
+        changed = test_client.get("/sessions", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["sessions"][0]["agent_status_text"] == "deploying"
+
+        sample_session.git_remote_url = "git@example.com:repo.git"
+        mock_session_manager.state_version = 2
+        saved = test_client.get("/sessions")
+        assert saved.json()["sessions"][0]["git_remote_url"] == "git@example.com:repo.git"
+
     def test_list_sessions_empty(self, test_client, mock_session_manager):
         """GET /sessions returns empty list when no sessions."""
         mock_session_manager.list_sessions.return_value = []
@@ -832,9 +832,11 @@ class TestStatePersistence:
 
     @pytest.mark.asyncio
     async def test_state_saved_on_status_update(self, session_manager, temp_state_file):
-        """State is saved when status updated."""
+        """State is saved (write-behind) when status updated."""
         session = await session_manager.create_session(working_dir="/tmp/test")
         session_manager.update_session_status(session.id, SessionStatus.IDLE)
+        assert session_manager._state_save_scheduler.dirty is True
+        await session_manager._state_save_scheduler.flush()
 
         saved = json.loads(temp_state_file.read_text())
         assert saved["sessions"][0]["status"] == "idle"
@@ -68,6 +68,38 @@ def test_adoption_proposal_persists_and_accept_rebinds_parent(tmp_path):
     assert restored.get_session(target.id).parent_session_id == proposer.id
 
 
+def test_pending_proposal_index_tracks_create_and_decide(tmp_path):
+    manager = _manager(tmp_path)
+    first_em = _session("em000001", tmp_path, is_em=True)
+    second_em = _session("em000002", tmp_path, is_em=True)
+    target = _session("child001", tmp_path)
+    for session in (first_em, second_em, target):
+        manager.sessions[session.id] = session
+
+    proposal = manager.create_adoption_proposal(first_em.id, target.id)
+    pending = manager.list_adoption_proposals(
+        target_session_id=target.id,
+        status=AdoptionProposalStatus.PENDING,
+    )
+    assert [p.id for p in pending] == [proposal.id]
+
+    manager.decide_adoption_proposal(proposal.id, accepted=False)
+    assert manager.list_adoption_proposals(
+        target_session_id=target.id,
+        status=AdoptionProposalStatus.PENDING,
+    ) == []
+
+    retry = manager.create_adoption_proposal(second_em.id, target.id)
+    assert [
+        p.id
+        for p in manager.list_adoption_proposals(
+            target_session_id=target.id,
+            status=AdoptionProposalStatus.PENDING,
+        )
+    ] == [retry.id]
+    assert len(manager.list_adoption_proposals(target_session_id=target.id)) == 2
+
+
 def test_adoption_proposal_requires_em(tmp_path):
     manager = _manager(tmp_path)
     proposer = _session("worker001", tmp_path, is_em=False)
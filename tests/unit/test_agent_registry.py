@@ -160,6 +160,30 @@ def test_lookup_prunes_stopped_registration(tmp_path):
     assert state_data["agent_registrations"] == []
 
 
+def test_alias_reads_hide_dead_owners_without_writing_state(tmp_path):
+    manager = _manager(tmp_path)
+    session = _session("read1234", tmp_path)
+    other = _session("read5678", tmp_path)
+    manager.sessions[session.id] = session
+    manager.sessions[other.id] = other
+    manager.register_agent_role(session.id, "reviewer")
+    manager.register_agent_role(session.id, "architect")
+    manager.register_agent_role(other.id, "scribe")
+    assert manager.get_session_aliases(session.id) == ["architect", "reviewer"]
+
+    session.status = SessionStatus.STOPPED
+    with patch.object(manager, "request_state_save") as save:
+        assert manager.get_session_aliases(session.id) == []
+        assert manager.get_session_aliases(other.id) == ["scribe"]
+    save.assert_not_called()
+    assert set(manager.agent_registrations) == {"architect", "reviewer", "scribe"}
+
+    assert manager._prune_agent_registrations(persist=False) is True
+    assert set(manager.agent_registrations) == {"scribe"}
+    manager.unregister_agent_role(other.id, "scribe")
+    assert manager.get_session_aliases(other.id) == []
+
+
 def test_register_role_reparents_live_children_from_stopped_prior_holder(tmp_path):
     manager = _manager(tmp_path)
     old_owner = _session("chiefold", tmp_path)
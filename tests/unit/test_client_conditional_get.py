@@ -0,0 +1,46 @@
+"""Unit tests for ETag revalidation in SessionManagerClient.list_sessions."""
+
+import io
+import urllib.error
+from unittest.mock import patch
+
+from src.cli.client import SessionManagerClient
+
+
+class _Response(io.BytesIO):
+    status = 200
+
+    def __init__(self, body: bytes, etag: str):
+        super().__init__(body)
+        self.headers = {"ETag": etag}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_list_sessions_revalidates_with_if_none_match():
+    client = SessionManagerClient(api_url="http://127.0.0.1:8420")
+    not_modified = urllib.error.HTTPError("http://127.0.0.1:8420/sessions", 304, "Not Modified", {}, None)
+
+    with patch(
+        "urllib.request.urlopen",
+        side_effect=[_Response(b'{"sessions":[{"id":"s1"}]}', '"v1"'), not_modified],
+    ) as urlopen:
+        first = client.list_sessions()
+        first[0]["id"] = "mutated-by-caller"
+        second = client.list_sessions()
+
+    assert urlopen.call_args_list[0].args[0].get_header("If-none-match") is None
+    assert urlopen.call_args_list[1].args[0].get_header("If-none-match") == '"v1"'
+    assert second == [{"id": "s1"}]
+
+
+def test_list_sessions_without_cached_body_treats_304_as_error():
+    client = SessionManagerClient(api_url="http://127.0.0.1:8420")
+    not_modified = urllib.error.HTTPError("http://127.0.0.1:8420/sessions", 304, "Not Modified", {}, None)
+
+    with patch("urllib.request.urlopen", side_effect=not_modified):
+        assert client.list_sessions() is None
@@ -0,0 +1,35 @@
+"""Unit tests for SessionManagerClient.stream_events SSE parsing."""
+
+import io
+from unittest.mock import patch
+
+from src.cli.client import SessionManagerClient
+
+
+class _Response(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_stream_events_parses_frames_and_sends_cursor():
+    body = (
+        b'event: hello\ndata: {"session_event_id":"e-0"}\n\n'
+        b": keepalive\n\n"
+        b'id: e-1\nevent: session_delta\ndata: {"session_id":"s1"}\n\n'
+        b"event: broken\ndata: not-json\n\n"
+    )
+    client = SessionManagerClient(api_url="http://127.0.0.1:8420")
+
+    with patch("urllib.request.urlopen", return_value=_Response(body)) as urlopen:
+        events = list(client.stream_events(last_event_id="e-0"))
+
+    request = urlopen.call_args.args[0]
+    assert request.full_url == "http://127.0.0.1:8420/events"
+    assert request.get_header("Last-event-id") == "e-0"
+    assert events == [
+        {"event": "hello", "id": None, "data": {"session_event_id": "e-0"}},
+        {"event": "session_delta", "id": "e-1", "data": {"session_id": "s1"}},
+    ]
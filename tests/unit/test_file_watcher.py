@@ -0,0 +1,103 @@
+"""Tests for the optional inotify file watcher and its polling fallback."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.file_watcher import FileWatcher
+from src.models import Session
+from src.output_monitor import OutputMonitor
+
+requires_inotify = pytest.mark.skipif(
+    not FileWatcher().available, reason="inotify is not available on this platform"
+)
+
+
+@requires_inotify
+@pytest.mark.asyncio
+async def test_watch_fires_on_append_and_creation(tmp_path):
+    watcher = FileWatcher()
+    existing = tmp_path / "existing.log"
+    existing.write_text("")
+    hits: list[str] = []
+
+    first = watcher.watch(existing, lambda: hits.append("existing"))
+    second = watcher.watch(tmp_path / "later.log", lambda: hits.append("later"))
+    assert first is not None and second is not None
+    assert watcher.stats()["directories"] == 1
+
+    with existing.open("a") as handle:
+        handle.write("line\n")
+    (tmp_path / "later.log").write_text("created\n")
+    (tmp_path / "unrelated.log").write_text("ignored\n")
+    for _ in range(50):
+        if {"existing", "later"} <= set(hits):
+            break
+        await asyncio.sleep(0.01)
+
+    assert {"existing", "later"} <= set(hits)
+    watcher.unwatch(first)
+    watcher.unwatch(second)
+    assert watcher.stats()["directories"] == 0
+
+
+@requires_inotify
+@pytest.mark.asyncio
+async def test_unwatched_path_no_longer_fires(tmp_path):
+    watcher = FileWatcher()
+    target = tmp_path / "t.log"
+    hits: list[int] = []
+    token = watcher.watch(target, lambda: hits.append(1))
+    watcher.unwatch(token)
+
+    target.write_text("data\n")
+    await asyncio.sleep(0.05)
+
+    assert hits == []
+
+
+@pytest.mark.asyncio
+async def test_unavailable_watcher_returns_no_token(tmp_path):
+    watcher = FileWatcher()
+    watcher._disabled = True
+
+    assert watcher.available is False
+    assert watcher.watch(tmp_path / "t.log", lambda: None) is None
+
+
+@requires_inotify
+@pytest.mark.asyncio
+async def test_output_monitor_wakes_idle_session_on_write(tmp_path):
+    log_file = tmp_path / "wake.log"
+    log_file.write_text("")
+    session = Session(
+        id="wake0001",
+        name="claude-wake0001",
+        working_dir=str(tmp_path),
+        tmux_session="claude-wake0001",
+        provider="codex",
+        log_file=str(log_file),
+    )
+    # Poll slowly so only an inotify wake can explain a fast detection.
+    monitor = OutputMonitor(poll_interval=2.0, config={
+        "timeouts": {"output_monitor": {"liveness_check_interval_seconds": 600}},
+    })
+    await monitor.start_monitoring(session)
+    assert monitor._poll_slots[session.id].watch_token is not None
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with log_file.open("a") as handle:
+        handle.write("Allow once? [Y/n]\n")
+    for _ in range(100):
+        if monitor._file_positions[session.id] > 0:
+            break
+        await asyncio.sleep(0.005)
+    elapsed = loop.time() - started
+    detected = monitor._file_positions[session.id] > 0
+    await monitor.stop_all()
+
+    assert detected is True
+    assert elapsed < 0.1
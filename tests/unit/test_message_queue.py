@@ -34,6 +34,9 @@ def _close_message_queue(mq: MessageQueueManager) -> None:
         if callable(cancel):
             cancel()
         mq._monitor_task = None
+    if mq._db_executor is not None:
+        mq._db_executor.shutdown(wait=True)
+        mq._db_executor = None
     if mq._db_conn is not None:
         mq._db_conn.close()
         mq._db_conn = None
@@ -487,6 +490,108 @@ class TestDatabaseOperations:
         assert len(pending) == 0
 
 
+class TestPendingIndex:
+    """Tests for the in-memory pending-message index."""
+
+    def test_lookups_do_not_query_database(self, message_queue):
+        with patch('asyncio.create_task', noop_create_task):
+            msg = message_queue.queue_message("target123", "Hello")
+        message_queue._get_sessions_with_pending()
+
+        with patch.object(message_queue, "_execute_query", side_effect=AssertionError("queried")):
+            assert message_queue._get_sessions_with_pending() == ["target123"]
+            assert [m.id for m in message_queue.get_pending_messages("target123")] == [msg.id]
+
+        message_queue._mark_delivered(msg.id)
+        assert message_queue._get_sessions_with_pending() == []
+
+    def test_raw_write_reloads_index(self, message_queue):
+        with patch('asyncio.create_task', noop_create_task):
+            msg = message_queue.queue_message("target123", "Hello")
+        assert message_queue.get_queue_length("target123") == 1
+
+        message_queue._execute(
+            "UPDATE message_queue SET delivered_at = ? WHERE id = ?",
+            (datetime.now().isoformat(), msg.id),
+        )
+
+        assert message_queue.get_queue_length("target123") == 0
+        assert message_queue._pending_index.stats()["invalidations"] == 1
+
+    def test_new_manager_loads_pending_from_database(self, mock_session_manager, temp_db_path, message_queue):
+        with patch('asyncio.create_task', noop_create_task):
+            msg = message_queue.queue_message("target123", "Survives restart")
+
+        mq = MessageQueueManager(session_manager=mock_session_manager, db_path=temp_db_path)
+        try:
+            assert [m.id for m in mq.get_pending_messages("target123")] == [msg.id]
+        finally:
+            _close_message_queue(mq)
+
+
+class TestAsyncDatabaseLayer:
+    """Tests for the DB-thread write batching used on the delivery path."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_commit_in_one_transaction(self, message_queue):
+        with patch('asyncio.create_task', noop_create_task):
+            msgs = [message_queue.queue_message("target123", f"m{i}") for i in range(3)]
+        commits = []
+        real_conn = message_queue._db_conn
+        proxy = MagicMock(wraps=real_conn)
+        proxy.cursor = real_conn.cursor
+        proxy.in_transaction = False
+        proxy.commit = MagicMock(side_effect=lambda: (commits.append(1), real_conn.commit()))
+        message_queue._db_conn = proxy
+        try:
+            delivered_at = await message_queue._mark_delivered_async([m.id for m in msgs])
+        finally:
+            message_queue._db_conn = real_conn
+
+        assert len(commits) == 1
+        assert await message_queue.get_pending_messages_async("target123") == []
+        rows = message_queue._execute_query("SELECT DISTINCT delivered_at FROM message_queue")
+        assert rows == [(delivered_at.isoformat(),)]
+
+    @pytest.mark.asyncio
+    async def test_failing_statement_only_fails_its_caller(self, message_queue):
+        with patch('asyncio.create_task', noop_create_task):
+            msg = message_queue.queue_message("target123", "keep going")
+
+        good, bad = await asyncio.gather(
+            message_queue._execute_async(
+                "UPDATE message_queue SET delivered_at = ? WHERE id = ?",
+                ("2026-01-01T00:00:00+00:00", msg.id),
+            ),
+            message_queue._execute_async("UPDATE no_such_table SET x = 1"),
+            return_exceptions=True,
+        )
+
+        assert good == 1
+        assert isinstance(bad, sqlite3.OperationalError)
+        assert await message_queue.get_queue_length_async("target123") == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_writes(self, message_queue, temp_db_path):
+        with patch('asyncio.create_task', noop_create_task):
+            msg = message_queue.queue_message("target123", "flush me")
+
+        write = asyncio.ensure_future(message_queue._mark_delivered_async([msg.id]))
+        while not message_queue._pending_db_writes:
+            await asyncio.sleep(0)
+        await message_queue.stop()
+        await write
+
+        conn = sqlite3.connect(temp_db_path)
+        try:
+            row = conn.execute(
+                "SELECT delivered_at FROM message_queue WHERE id = ?", (msg.id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        assert row[0] is not None
+
+
 class TestNotifyCallback:
     """Tests for notification callback."""
 
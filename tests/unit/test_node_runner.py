@@ -1,7 +1,9 @@
 import os
 import subprocess
 
-from src.node_runner import NodeRegistry, NodeRunner
+import pytest
+
+from src.node_runner import NodeRegistry, NodeRunner, _READ_TAILS_SCRIPT, _parse_tail_frames
 
 
 def test_primary_command_is_local_argv():
@@ -142,3 +144,120 @@ def test_remote_command_available_expands_home_relative_path(monkeypatch):
     assert "${HOME%/}/${path#\\~/}" in remote_payload
     assert 'test -f "$path" && test -x "$path"' in remote_payload
     assert "~/bin/claude" in remote_payload
+
+
+def _worker_runner(tmp_path):
+    registry = NodeRegistry.from_config(
+        {
+            "nodes": {
+                "control_dir": str(tmp_path / "ssh"),
+                "registry": {"worker": {"ssh": "dev@example"}},
+            }
+        }
+    )
+    return NodeRunner(registry)
+
+
+def test_remote_command_uses_managed_control_path_by_default(tmp_path):
+    runner = _worker_runner(tmp_path)
+
+    command = runner.command("worker", ["true"])
+
+    assert command[command.index("-S") + 1] == str(tmp_path / "ssh" / "worker")
+
+
+def test_pool_restarts_dead_master_once_and_reuses_it(tmp_path, monkeypatch):
+    runner = _worker_runner(tmp_path)
+    stale_socket = tmp_path / "ssh" / "worker"
+    stale_socket.parent.mkdir()
+    stale_socket.write_text("")
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-O" in cmd:
+            return subprocess.CompletedProcess(cmd, 255, stdout="", stderr="no master")
+        if "-M" in cmd:
+            assert not stale_socket.exists()
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+
+    runner.run("worker", ["echo", "ok"])
+    runner.run("worker", ["echo", "ok"])
+
+    assert [cmd for cmd in calls if "-O" in cmd or "-M" in cmd] == calls[:2]
+    assert len(calls) == 4
+    stats = runner.connection_stats("worker")
+    assert stats["masters_started"] == 1
+    assert stats["commands"] == 2
+    assert stats["healthy"] is True
+    assert stats["avg_rtt_ms"] is not None
+    assert runner.connection_stats("primary") is None
+
+
+def test_transport_failure_forces_health_recheck(tmp_path, monkeypatch):
+    runner = _worker_runner(tmp_path)
+    checks = []
+
+    def _fake_run(cmd, **kwargs):
+        if "-O" in cmd:
+            checks.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+        return subprocess.CompletedProcess(cmd, 255, stdout="", stderr="connection reset")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+
+    runner.run("worker", ["true"], check=False)
+    assert runner.connection_stats("worker")["transport_failures"] == 1
+    runner.run("worker", ["true"], check=False)
+
+    assert len(checks) == 2
+
+
+def test_read_tails_script_frames_several_files(tmp_path):
+    grown = tmp_path / "grown.log"
+    grown.write_bytes(b"old\nnew \xe2\x9c\x93\n")
+    idle = tmp_path / "idle.log"
+    idle.write_bytes(b"same\n")
+    args = [str(grown), "4", str(tmp_path / "missing.log"), "0", str(idle), "5"]
+
+    result = subprocess.run(
+        ["/bin/sh", "-c", _READ_TAILS_SCRIPT, "sh", *args],
+        capture_output=True,
+        check=True,
+    )
+
+    assert _parse_tail_frames(b"motd banner\n" + result.stdout, 3) == [
+        (len(grown.read_bytes()), "new ✓\n".encode()),
+        (None, b""),
+        (5, b""),
+    ]
+
+
+def test_read_tails_uses_one_remote_call_per_node(tmp_path, monkeypatch):
+    runner = _worker_runner(tmp_path)
+    runner.pool.ensure = lambda *args, **kwargs: True
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        assert kwargs["text"] is False
+        stdout = (
+            b"__SM_TAIL__ 10 2\nhi\n__SM_TAIL_END__\n"
+            b"__SM_TAIL__ missing 0\n\n__SM_TAIL_END__\n"
+        )
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+
+    tails = runner.read_tails("worker", [("/logs/a.log", 8), ("/logs/b.log", 0)])
+
+    assert tails == [(10, b"hi"), (None, b"")]
+    assert len(calls) == 1
+
+
+def test_read_tails_rejects_misaligned_frames():
+    with pytest.raises(RuntimeError):
+        _parse_tail_frames(b"__SM_TAIL__ 10 5\nhi\n__SM_TAIL_END__\n", 1)
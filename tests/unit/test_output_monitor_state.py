@@ -423,3 +423,141 @@ async def test_cleanup_session_preserve_record_cancels_external_monitor_task(tmp
     assert task.done() is True
     assert session.id not in monitor._tasks
     assert session.id in sm.sessions
+
+
+def _log_session(tmp_path, session_id: str) -> Session:
+    log_file = tmp_path / f"{session_id}.log"
+    log_file.write_text("")
+    return Session(
+        id=session_id,
+        name=f"claude-{session_id}",
+        working_dir=str(tmp_path),
+        tmux_session=f"claude-{session_id}",
+        provider="codex",
+        log_file=str(log_file),
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reads_all_local_logs_in_one_thread_hop(tmp_path, monkeypatch):
+    monitor = OutputMonitor(poll_interval=0.01, config={
+        "timeouts": {"output_monitor": {"liveness_check_interval_seconds": 60}},
+    })
+    sessions = [_log_session(tmp_path, f"batch{i:03d}") for i in range(5)]
+    for session in sessions:
+        await monitor.start_monitoring(session)
+    for session in sessions:
+        with open(session.log_file, "a") as handle:
+            handle.write(f"output from {session.id}\n")
+
+    batches: list[int] = []
+    original = OutputMonitor._read_new_log_contents.__func__
+
+    def counting(cls, requests):
+        batches.append(len(requests))
+        return original(cls, requests)
+
+    monkeypatch.setattr(OutputMonitor, "_read_new_log_contents", classmethod(counting))
+    for _ in range(100):
+        if all(monitor._file_positions[s.id] > 0 for s in sessions):
+            break
+        await asyncio.sleep(0.01)
+    await monitor.stop_all()
+
+    assert all(size > 0 for size in batches)
+    assert batches[0] == len(sessions)
+    assert monitor._scheduler_task is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_backs_off_idle_sessions_and_wakes_on_activity(tmp_path):
+    monitor = OutputMonitor(poll_interval=0.01, config={
+        "monitor": {"file_watch": False},
+        "timeouts": {"output_monitor": {
+            "idle_poll_interval_seconds": 0.08,
+            "liveness_check_interval_seconds": 60,
+        }},
+    })
+    session = _log_session(tmp_path, "idle0001")
+    await monitor.start_monitoring(session)
+    slot = monitor._poll_slots[session.id]
+
+    for _ in range(100):
+        if slot.interval == 0.08:
+            break
+        await asyncio.sleep(0.01)
+    assert slot.interval == 0.08
+
+    monitor.update_activity(session.id)
+    assert slot.interval == 0.01
+
+    with open(session.log_file, "a") as handle:
+        handle.write("busy\n")
+    for _ in range(100):
+        if monitor._file_positions[session.id] > 0:
+            break
+        await asyncio.sleep(0.01)
+    await monitor.stop_monitoring(session.id)
+
+    assert monitor._file_positions.get(session.id) is None
+    assert session.id not in monitor._poll_slots
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spreads_liveness_checks_across_ticks():
+    monitor = OutputMonitor(poll_interval=1.0)
+    slots = {}
+    for i in range(60):
+        session = _make_session(f"live{i:04d}")
+        session.log_file = "/nonexistent/log"
+        slots[session.id] = SimpleNamespace(
+            session=session,
+            interval=1.0,
+            next_poll_at=0.0,
+            next_liveness_at=0.0,
+            queue=asyncio.Queue(maxsize=1),
+            busy=False,
+        )
+    monitor._poll_slots = slots
+
+    await monitor._run_scheduler_tick()
+
+    dispatched = [slot.queue.get_nowait() for slot in slots.values()]
+    # 60 sessions over a 30-tick liveness interval: two probes per tick.
+    assert sum(tick.check_liveness for tick in dispatched) == 2
+    assert all(slot.busy for slot in slots.values())
+
+
+@pytest.mark.asyncio
+async def test_scheduler_batches_remote_reads_per_node(tmp_path):
+    class _Runner:
+        def __init__(self):
+            self.calls: list[tuple[str, list[tuple[str, int]]]] = []
+
+        def read_tails(self, node_id, requests):
+            self.calls.append((node_id, list(requests)))
+            return [(len(path), path.encode()) for path, _offset in requests]
+
+    runner = _Runner()
+    monitor = OutputMonitor(poll_interval=1.0)
+    monitor._session_manager = SimpleNamespace(node_runner=runner, mark_node_unreachable=lambda *_: None)
+    slots = {}
+    for i, node in enumerate(["worker", "worker", "worker", "other"]):
+        session = _make_session(f"remote{i:02d}")
+        session.node = node
+        session.log_file = f"/logs/{session.id}.log"
+        slots[session.id] = SimpleNamespace(
+            session=session,
+            interval=1.0,
+            next_poll_at=0.0,
+            next_liveness_at=float("inf"),
+            queue=asyncio.Queue(maxsize=1),
+            busy=False,
+        )
+    monitor._poll_slots = slots
+
+    await monitor._run_scheduler_tick()
+
+    assert sorted((node, len(requests)) for node, requests in runner.calls) == [("other", 1), ("worker", 3)]
+    tick = slots["remote01"].queue.get_nowait()
+    assert tick.read_result == (len("/logs/remote01.log"), "/logs/remote01.log")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import tempfile
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.models import Session, SessionStatus
+from src.pane_title_sampler import PaneTitleSampler
+from src.session_manager import SessionManager
+
+SPINNER = chr(0x283C)
+
+
+def test_sample_queries_each_node_once_and_falls_back_to_default_socket():
+    tmux = MagicMock(socket_name="session-manager")
+
+    def list_pane_titles(socket_name="__primary__", node="primary"):
+        if socket_name is None:
+            return {"legacy": "old"}
+        return {"a": "one", "b": "two"} if node == "primary" else {"r": "remote"}
+
+    tmux.list_pane_titles.side_effect = list_pane_titles
+    sampler = PaneTitleSampler()
+
+    changed = sampler.sample(tmux, [("primary", "a"), ("primary", "b"), ("primary", "legacy"), ("mini", "r")])
+
+    assert changed is True
+    assert sampler.title("primary", "a") == "one"
+    assert sampler.title("primary", "legacy") == "old"
+    assert sampler.title("mini", "r") == "remote"
+    assert tmux.list_pane_titles.call_count == 3
+
+
+def test_failed_node_query_keeps_previous_titles():
+    tmux = MagicMock(socket_name=None)
+    tmux.list_pane_titles.return_value = {"a": "one"}
+    sampler = PaneTitleSampler()
+    sampler.sample(tmux, [("primary", "a")])
+
+    tmux.list_pane_titles.return_value = None
+    assert sampler.sample(tmux, [("primary", "a")]) is False
+    assert sampler.title("primary", "a") == "one"
+
+
+def _codex_fork_session() -> Session:
+    return Session(
+        id="cf-sampled",
+        name="codex-fork-cf-sampled",
+        working_dir="/tmp",
+        tmux_session="codex-fork-cf-sampled",
+        provider="codex-fork",
+        status=SessionStatus.IDLE,
+    )
+
+
+def test_activity_state_reads_sampled_title_without_tmux_calls():
+    tmpdir = tempfile.TemporaryDirectory()
+    manager = SessionManager(log_dir=tmpdir.name, state_file=f"{tmpdir.name}/state.json")
+    session = _codex_fork_session()
+    manager.sessions[session.id] = session
+    manager.codex_fork_lifecycle[session.id] = {
+        "state": "idle",
+        "cause_event_type": "turn_complete",
+        "updated_at": datetime.now().isoformat(),
+    }
+    manager.tmux = MagicMock(socket_name=None)
+    manager.tmux.list_pane_titles.return_value = {session.tmux_session: f"{SPINNER} project-title"}
+
+    manager.pane_title_sampler.sample(manager.tmux, manager._pane_title_targets())
+    assert manager.get_activity_state(session.id) == "working"
+
+    manager.tmux.list_pane_titles.return_value = {session.tmux_session: "project-title"}
+    manager.pane_title_sampler.sample(manager.tmux, manager._pane_title_targets())
+    assert manager.get_activity_state(session.id) == "idle"
+
+    manager.tmux.get_pane_title.assert_not_called()
+    tmpdir.cleanup()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from src.models import QueuedMessage
+from src.pending_message_index import PendingMessageIndex
+
+
+def _msg(target: str, minutes_ago: float, mode: str = "sequential", **extra) -> QueuedMessage:
+    return QueuedMessage(
+        target_session_id=target,
+        text=f"{target}-{minutes_ago}",
+        delivery_mode=mode,
+        queued_at=datetime(2026, 1, 1, 12, 0) - timedelta(minutes=minutes_ago),
+        **extra,
+    )
+
+
+def test_load_orders_messages_by_queued_time():
+    index = PendingMessageIndex()
+    newer, older = _msg("a", 1), _msg("a", 5)
+
+    assert index.load([newer, older], index.generation) is True
+
+    assert index.pending("a") == [older, newer]
+    assert index.sessions() == ["a"]
+
+
+def test_add_keeps_order_and_filters_by_mode():
+    index = PendingMessageIndex()
+    index.load([], index.generation)
+    first, late_arrival = _msg("a", 1, "important"), _msg("a", 3)
+    index.add(first)
+    index.add(late_arrival)
+
+    assert index.pending("a") == [late_arrival, first]
+    assert index.pending("a", delivery_mode="important") == [first]
+
+
+def test_discard_drops_empty_sessions():
+    index = PendingMessageIndex()
+    keep, drop = _msg("a", 2), _msg("b", 2, message_category="context_monitor")
+    index.load([keep, drop], index.generation)
+
+    index.discard_where(lambda m: m.message_category == "context_monitor")
+
+    assert index.sessions() == ["a"]
+    index.discard([keep.id])
+    assert index.sessions() == []
+    assert index.count("a") == 0
+
+
+def test_load_racing_a_write_is_discarded():
+    index = PendingMessageIndex()
+    generation = index.generation
+    index.add(_msg("a", 1))  # lands between the query and the load
+
+    assert index.load([], generation) is False
+    assert index.loaded is False
+
+
+def test_stats_report_size_and_staleness():
+    index = PendingMessageIndex()
+    index.load(
+        [_msg("a", 10), _msg("a", 1, "urgent"), _msg("b", 2)],
+        index.generation,
+    )
+
+    stats = index.stats(now=datetime(2026, 1, 1, 12, 0))
+
+    assert stats["sessions"] == 2
+    assert stats["messages"] == 3
+    assert stats["by_mode"] == {"sequential": 2, "urgent": 1}
+    assert stats["oldest_pending_seconds"] == 600
+    assert stats["oldest_pending_seconds_by_session"] == {"a": 600, "b": 120}
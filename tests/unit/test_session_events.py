@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.models import Session, SessionStatus
+from src.session_events import SessionEventLog
+from src.session_manager import SessionManager
+
+
+def _view(**overrides) -> dict:
+    view = {
+        "status": "running",
+        "activity_state": "working",
+        "friendly_name": "worker",
+        "queue_length": 0,
+        "completion_status": None,
+    }
+    view.update(overrides)
+    return view
+
+
+def test_first_update_is_a_baseline():
+    log = SessionEventLog()
+
+    assert log.update({"a": _view()}) == []
+    assert log.version == 0
+    assert log.snapshot()["sessions"] == {"a": _view()}
+
+
+def test_deltas_carry_only_changed_fields_and_kinds():
+    log = SessionEventLog()
+    log.update({"a": _view(), "b": _view()})
+
+    events = log.update({
+        "a": _view(friendly_name="renamed", queue_length=2),
+        "c": _view(),
+    })
+
+    assert [(e["session_id"], e["change"]) for e in events] == [
+        ("a", "updated"),
+        ("c", "created"),
+        ("b", "removed"),
+    ]
+    assert events[0]["fields"] == {"friendly_name": "renamed", "queue_length": 2}
+    assert events[0]["kinds"] == ["queue", "renamed"]
+    assert [e["version"] for e in events] == [1, 2, 3]
+
+
+def test_stop_is_reported_as_killed():
+    log = SessionEventLog()
+    log.update({"a": _view()})
+
+    (event,) = log.update({"a": _view(status="stopped", activity_state="stopped")})
+
+    assert event["kinds"] == ["activity", "status", "killed"]
+
+
+def test_since_replays_or_reports_gap():
+    log = SessionEventLog(replay_size=2)
+    log.update({"a": _view()})
+    for count in range(1, 4):
+        log.update({"a": _view(queue_length=count)})
+
+    assert [e["version"] for e in log.since(1)] == [2, 3]
+    assert log.since(3) == []
+    assert log.since(0) is None  # fell out of the ring
+    assert log.since(9) is None  # cursor from the future (another process)
+
+
+def test_event_ids_are_scoped_to_the_epoch():
+    log = SessionEventLog()
+    other = SessionEventLog()
+
+    assert log.parse_event_id(log.event_id(7)) == 7
+    assert log.parse_event_id(other.event_id(7)) is None
+    assert log.parse_event_id("garbage") is None
+    assert log.parse_event_id(None) is None
+
+
+def test_listeners_receive_published_events():
+    log = SessionEventLog()
+    received = []
+    log.add_listener(received.append)
+    log.update({})
+
+    log.update({"a": _view()})
+    log.remove_listener(received.append)
+    log.update({})
+
+    assert [e["change"] for e in received] == ["created"]
+
+
+def _manager(tmp_path) -> SessionManager:
+    return SessionManager(
+        log_dir=str(tmp_path / "logs"),
+        state_file=str(tmp_path / "sessions.json"),
+    )
+
+
+def _session(session_id: str, tmp_path) -> Session:
+    return Session(
+        id=session_id,
+        name=f"claude-{session_id}",
+        working_dir=str(tmp_path),
+        tmux_session=f"claude-{session_id}",
+        provider="claude",
+        log_file=str(tmp_path / f"{session_id}.log"),
+        status=SessionStatus.IDLE,
+    )
+
+
+def test_manager_publishes_rename_and_kill_deltas(tmp_path):
+    manager = _manager(tmp_path)
+    session = _session("s1", tmp_path)
+    manager.sessions[session.id] = session
+    manager.refresh_session_deltas()
+
+    session.friendly_name = "builder"
+    (renamed,) = manager.refresh_session_deltas()
+    session.status = SessionStatus.STOPPED
+    (killed,) = manager.refresh_session_deltas()
+
+    assert renamed["fields"] == {"friendly_name": "builder"}
+    assert "killed" in killed["kinds"]
+    assert manager.session_events.version == 2
+
+
+def test_state_save_requests_coalesce_into_one_refresh(tmp_path):
+    manager = _manager(tmp_path)
+    manager.sessions["s1"] = _session("s1", tmp_path)
+    manager.refresh_session_deltas()
+
+    async def mutate():
+        manager.sessions["s1"].friendly_name = "one"
+        manager.notify_session_change()
+        manager.sessions["s1"].friendly_name = "two"
+        manager.notify_session_change()
+        await asyncio.sleep(0)
+
+    asyncio.run(mutate())
+
+    assert manager.session_events.refreshes == 2
+    assert [e["fields"] for e in manager.session_events.since(0)] == [{"friendly_name": "two"}]
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.models import Session, SessionStatus
+from src.session_manager import SessionManager
+from src.session_state_journal import journal_path_for, load_state_with_journal
+
+
+def _manager(tmp_path, **state_persistence) -> SessionManager:
+    config = {"state_persistence": {"journal_min_sessions": 4, **state_persistence}}
+    return SessionManager(
+        log_dir=str(tmp_path / "logs"),
+        state_file=str(tmp_path / "sessions.json"),
+        config=config,
+    )
+
+
+def _session(session_id: str, tmp_path) -> Session:
+    return Session(
+        id=session_id,
+        name=f"claude-{session_id}",
+        working_dir=str(tmp_path),
+        tmux_session=f"claude-{session_id}",
+        provider="claude",
+        log_file=str(tmp_path / f"{session_id}.log"),
+        status=SessionStatus.STOPPED,
+    )
+
+
+def _journal_lines(tmp_path) -> list[dict]:
+    path = journal_path_for(tmp_path / "sessions.json")
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _seed(manager: SessionManager, tmp_path, count: int = 6) -> None:
+    for idx in range(count):
+        session = _session(f"sess{idx:04d}", tmp_path)
+        manager.sessions[session.id] = session
+    assert manager._save_state() is True
+
+
+def test_small_fleet_keeps_full_checkpoint_writes(tmp_path):
+    manager = _manager(tmp_path, journal_min_sessions=16)
+    _seed(manager, tmp_path, count=3)
+
+    manager.sessions["sess0001"].friendly_name = "renamed"
+    assert manager._save_state() is True
+
+    assert not journal_path_for(tmp_path / "sessions.json").exists()
+    checkpoint = json.loads((tmp_path / "sessions.json").read_text())
+    assert checkpoint["sessions"][1]["friendly_name"] == "renamed"
+
+
+def test_large_fleet_appends_only_changed_sessions(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+    checkpoint_before = (tmp_path / "sessions.json").read_text()
+
+    manager.sessions["sess0002"].friendly_name = "worker"
+    assert manager._save_state() is True
+    # Unchanged saves cost nothing.
+    assert manager._save_state() is True
+
+    assert (tmp_path / "sessions.json").read_text() == checkpoint_before
+    lines = _journal_lines(tmp_path)
+    assert lines[0]["op"] == "header"
+    assert [line["op"] for line in lines[1:]] == ["upsert"]
+    assert lines[1]["session"]["id"] == "sess0002"
+    assert lines[1]["session"]["friendly_name"] == "worker"
+
+
+def test_journal_records_deletes_and_registry_changes(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+
+    del manager.sessions["sess0004"]
+    manager.em_topic = {"chat_id": 1, "thread_id": 2}
+    assert manager._save_state() is True
+
+    ops = [line["op"] for line in _journal_lines(tmp_path)[1:]]
+    assert ops == ["delete", "state"]
+    merged = load_state_with_journal(tmp_path / "sessions.json")
+    assert [item["id"] for item in merged["sessions"]] == [
+        "sess0000",
+        "sess0001",
+        "sess0002",
+        "sess0003",
+        "sess0005",
+    ]
+    assert merged["em_topic"] == {"chat_id": 1, "thread_id": 2}
+
+
+def test_startup_replays_journal_over_checkpoint(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+    manager.sessions["sess0003"].friendly_name = "journaled"
+    assert manager._save_state() is True
+
+    restored = _manager(tmp_path)
+
+    assert restored.sessions["sess0003"].friendly_name == "journaled"
+    assert len(restored.sessions) == 6
+
+
+def test_journal_compacts_into_checkpoint_after_threshold(tmp_path):
+    manager = _manager(tmp_path, journal_compact_records=2)
+    _seed(manager, tmp_path)
+
+    manager.sessions["sess0000"].friendly_name = "one"
+    assert manager._save_state() is True
+    manager.sessions["sess0001"].friendly_name = "two"
+    assert manager._save_state() is True
+    assert journal_path_for(tmp_path / "sessions.json").exists()
+
+    manager.sessions["sess0002"].friendly_name = "three"
+    assert manager._save_state() is True
+
+    assert not journal_path_for(tmp_path / "sessions.json").exists()
+    checkpoint = json.loads((tmp_path / "sessions.json").read_text())
+    names = {item["id"]: item["friendly_name"] for item in checkpoint["sessions"]}
+    assert names["sess0000"] == "one"
+    assert names["sess0001"] == "two"
+    assert names["sess0002"] == "three"
+
+
+def test_stale_generation_journal_is_ignored(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+    manager.sessions["sess0000"].friendly_name = "stale"
+    assert manager._save_state() is True
+    stale_journal = journal_path_for(tmp_path / "sessions.json").read_text()
+
+    manager.sessions["sess0000"].friendly_name = "fresh"
+    assert manager._write_state_snapshot(manager._build_state_snapshot(), force_checkpoint=True) is True
+    # Simulate a crash between the checkpoint replace and the journal unlink.
+    journal_path_for(tmp_path / "sessions.json").write_text(stale_journal)
+
+    merged = load_state_with_journal(tmp_path / "sessions.json")
+    assert merged["sessions"][0]["friendly_name"] == "fresh"
+
+
+def test_torn_trailing_journal_record_is_ignored(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+    manager.sessions["sess0001"].friendly_name = "kept"
+    assert manager._save_state() is True
+    with open(journal_path_for(tmp_path / "sessions.json"), "a") as f:
+        f.write('{"op":"upsert","session":{"id":"sess0001","friendly_na')
+
+    merged = load_state_with_journal(tmp_path / "sessions.json")
+    assert merged["sessions"][1]["friendly_name"] == "kept"
+
+
+@pytest.mark.asyncio
+async def test_burst_of_save_requests_costs_one_write(tmp_path):
+    manager = _manager(tmp_path, save_max_latency_seconds=0.05)
+    _seed(manager, tmp_path)
+    writes = []
+    original_write = manager._write_state_snapshot
+
+    def counting_write(data, force_checkpoint=False):
+        writes.append(data)
+        return original_write(data, force_checkpoint)
+
+    manager._write_state_snapshot = counting_write
+
+    for idx in range(200):
+        manager.sessions["sess0000"].friendly_name = f"burst-{idx}"
+        manager.request_state_save()
+    assert await manager._save_state_async() is True
+
+    assert len(writes) == 1
+    stats = manager._state_save_scheduler.stats()
+    assert stats["saves_requested"] == 201
+    assert stats["saves_performed"] == 1
+    assert stats["dirty"] is False
+    merged = load_state_with_journal(tmp_path / "sessions.json")
+    assert merged["sessions"][0]["friendly_name"] == "burst-199"
+
+
+@pytest.mark.asyncio
+async def test_direct_save_satisfies_pending_coalesced_save(tmp_path):
+    manager = _manager(tmp_path, save_max_latency_seconds=0.05)
+    _seed(manager, tmp_path)
+
+    manager.sessions["sess0001"].friendly_name = "direct"
+    manager.request_state_save()
+    assert manager._save_state() is True
+    performed = manager._state_save_scheduler.saves_performed
+    await asyncio.sleep(0.1)
+
+    assert manager._state_save_scheduler.saves_performed == performed
+    assert manager._state_save_scheduler.dirty is False
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_save_into_checkpoint(tmp_path):
+    manager = _manager(tmp_path, save_max_latency_seconds=60)
+    _seed(manager, tmp_path)
+
+    manager.sessions["sess0002"].friendly_name = "flushed"
+    manager.request_state_save()
+    await manager.stop_background_tasks()
+
+    assert not journal_path_for(tmp_path / "sessions.json").exists()
+    checkpoint = json.loads((tmp_path / "sessions.json").read_text())
+    assert checkpoint["sessions"][2]["friendly_name"] == "flushed"
+
+
+def test_corrupt_mid_journal_record_keeps_valid_deltas_and_quarantines(tmp_path):
+    manager = _manager(tmp_path)
+    _seed(manager, tmp_path)
+    for idx, name in enumerate(["one", "two", "three"]):
+        manager.sessions[f"sess000{idx}"].friendly_name = name
+        assert manager._save_state() is True
+    journal_path = journal_path_for(tmp_path / "sessions.json")
+    lines = journal_path.read_text().splitlines()
+    lines[1] = lines[1][:25]
+    journal_path.write_text("\n".join(lines) + "\n")
+    damaged_journal = journal_path.read_text()
+
+    restored = _manager(tmp_path)
+
+    assert restored.sessions["sess0001"].friendly_name == "two"
+    assert restored.sessions["sess0002"].friendly_name == "three"
+    assert not journal_path.exists()
+    quarantined = list(tmp_path.glob("sessions.json.journal.corrupt.*"))
+    assert len(quarantined) == 1
+    assert quarantined[0].read_text() == damaged_journal
+    checkpoint = json.loads((tmp_path / "sessions.json").read_text())
+    names = {item["id"]: item["friendly_name"] for item in checkpoint["sessions"]}
+    assert names["sess0001"] == "two"
+    assert names["sess0002"] == "three"
+
+    restored.sessions["sess0003"].friendly_name = "after"
+    assert restored._save_state() is True
+    assert quarantined[0].read_text() == damaged_journal
+
+
+@pytest.mark.asyncio
+async def test_idle_save_flushes_without_waiting_for_latency_window(tmp_path):
+    manager = _manager(tmp_path, save_max_latency_seconds=60)
+    _seed(manager, tmp_path)
+
+    manager.sessions["sess0003"].friendly_name = "prompt"
+    assert await asyncio.wait_for(manager._save_state_async(), timeout=1) is True
+
+    merged = load_state_with_journal(tmp_path / "sessions.json")
+    assert merged["sessions"][3]["friendly_name"] == "prompt"
+
+
+@pytest.mark.asyncio
+async def test_status_update_burst_costs_one_write(tmp_path):
+    manager = _manager(tmp_path, save_max_latency_seconds=0.05)
+    _seed(manager, tmp_path)
+    writes = []
+    original_write = manager._write_state_snapshot
+
+    def counting_write(data, force_checkpoint=False):
+        writes.append(data)
+        return original_write(data, force_checkpoint)
+
+    manager._write_state_snapshot = counting_write
+
+    for idx in range(50):
+        status = SessionStatus.RUNNING if idx % 2 else SessionStatus.IDLE
+        manager.update_session_status("sess0004", status)
+    await manager._state_save_scheduler.flush()
+
+    assert len(writes) == 1
@@ -0,0 +1,114 @@
+import subprocess
+import threading
+from unittest.mock import MagicMock
+
+from src.tmux_controller import TmuxController
+from src.tmux_snapshot import TmuxSnapshotCache, parse_list_panes
+
+
+def _line(session, *, window_active="1", pane_active="1", pane_id="%1", dead="0", in_mode="0", history="2000", title=""):
+    return "\t".join([session, window_active, pane_active, pane_id, dead, "", in_mode, history, title])
+
+
+def _listing(*lines, returncode=0, stderr=""):
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout="\n".join(lines), stderr=stderr)
+
+
+def test_parse_keeps_active_pane_of_active_window():
+    snapshot = parse_list_panes(
+        "\n".join(
+            [
+                _line("a", pane_active="0", title="inactive pane"),
+                _line("a", pane_id="%2", in_mode="1", title="active\ttitle"),
+                _line("a", window_active="0", title="other window"),
+                _line("b", dead="1", history=""),
+            ]
+        )
+    )
+
+    pane = snapshot.pane("a")
+    assert (pane.pane_id, pane.pane_in_mode, pane.history_limit, pane.pane_title) == ("%2", 1, 2000, "active\ttitle")
+    assert snapshot.pane("b").pane_dead is True
+    assert snapshot.pane("b").history_limit is None
+    assert snapshot.has_session("c") is False
+
+
+def test_cache_shares_one_load_until_ttl_or_force():
+    cache = TmuxSnapshotCache(ttl_seconds=60)
+    loader = MagicMock(side_effect=lambda: parse_list_panes(_line("a")))
+
+    first = cache.get(("primary", None), loader)
+    assert cache.get(("primary", None), loader) is first
+    assert cache.get(("primary", None), loader, force=True) is not first
+    cache.invalidate("primary")
+    cache.get(("primary", None), loader)
+
+    assert loader.call_count == 3
+
+
+def test_concurrent_callers_wait_for_one_load():
+    cache = TmuxSnapshotCache(ttl_seconds=60)
+    release = threading.Event()
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        release.wait(5)
+        return parse_list_panes(_line("a"))
+
+    threads = [threading.Thread(target=cache.get, args=(("primary", None), slow_load)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+
+
+def test_reads_for_many_sessions_share_one_list_panes(tmp_path):
+    controller = TmuxController(log_dir=str(tmp_path), config={"tmux": {"snapshot_ttl_seconds": 60}})
+    controller._run_tmux = MagicMock(
+        return_value=_listing(
+            _line("claude-a", title="✳ builder"),
+            _line("claude-b", in_mode="1", history="5000"),
+        )
+    )
+
+    assert controller.session_exists("claude-a") is True
+    assert controller.session_exists("claude-b") is True
+    assert controller.get_pane_title("claude-a") == "✳ builder"
+    assert controller.get_history_limit("claude-b") == 5000
+    assert controller.list_pane_titles() == {"claude-a": "✳ builder", "claude-b": ""}
+
+    assert controller._run_tmux.call_count == 1
+
+
+def test_missing_session_is_confirmed_with_a_fresh_listing(tmp_path):
+    controller = TmuxController(log_dir=str(tmp_path), config={"tmux": {"snapshot_ttl_seconds": 60}})
+    controller._run_tmux = MagicMock(return_value=_listing(_line("claude-a")))
+    controller.session_exists("claude-a")
+
+    controller._run_tmux.return_value = _listing(_line("claude-a"), _line("claude-new"))
+
+    assert controller.session_exists("claude-new") is True
+    assert controller._run_tmux.call_count == 2
+
+
+def test_pane_in_mode_always_relists(tmp_path):
+    controller = TmuxController(log_dir=str(tmp_path), config={"tmux": {"snapshot_ttl_seconds": 60}})
+    controller._run_tmux = MagicMock(return_value=_listing(_line("claude-a", in_mode="1")))
+    assert controller._get_pane_in_mode("claude-a") == 1
+
+    controller._run_tmux.return_value = _listing(_line("claude-a", in_mode="0"))
+
+    assert controller._get_pane_in_mode("claude-a") == 0
+
+
+def test_list_pane_titles_distinguishes_no_server_from_failure(tmp_path):
+    controller = TmuxController(log_dir=str(tmp_path), config={"tmux": {"snapshot_ttl_seconds": 0}})
+    controller._run_tmux = MagicMock(return_value=_listing(returncode=1, stderr="no server running on /tmp/x"))
+    assert controller.list_pane_titles() == {}
+
+    controller._run_tmux.return_value = _listing(returncode=1, stderr="boom")
+    assert controller.list_pane_titles() is None
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+
+from src.response_relay import (
+    ClaudeAssistantOutput,
+    InboundTurn,
+    _assistant_message_id,
+    _extract_visible_assistant_text,
+    _parse_datetime,
+    collect_claude_assistant_outputs_after_turn,
+)
+from src.transcript_index import (
+    TranscriptIndex,
+    hash_transcript_text,
+    iter_lines_reverse,
+    read_transcript_tail,
+)
+
+
+def _line(entry: dict) -> str:
+    return json.dumps(entry) + "\n"
+
+
+def _user(text: str, **extra) -> dict:
+    return {"type": "user", "message": {"role": "user", "content": text}, **extra}
+
+
+def _assistant(text: str, timestamp: str | None = None) -> dict:
+    entry = {"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}
+    if timestamp:
+        entry["timestamp"] = timestamp
+    return entry
+
+
+def _count_parses(monkeypatch) -> list[bytes]:
+    parsed: list[bytes] = []
+    original = TranscriptIndex._parse_line
+
+    def counting(raw_line: bytes):
+        parsed.append(raw_line)
+        return original(raw_line)
+
+    monkeypatch.setattr(TranscriptIndex, "_parse_line", staticmethod(counting))
+    return parsed
+
+
+def test_append_only_resume_parses_only_new_lines(tmp_path, monkeypatch):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(
+        _line(_user("hello", cwd="/work", timestamp="2026-01-01T00:00:00Z"))
+        + _line({"type": "custom-title", "customTitle": "first"})
+        + _line(_assistant("one"))
+    )
+    index = TranscriptIndex()
+    parsed = _count_parses(monkeypatch)
+
+    snapshot = index.snapshot(str(transcript))
+    assert snapshot.title == "first"
+    assert snapshot.first_user_cwd == "/work"
+    assert snapshot.last_assistant_message == "one"
+    assert len(parsed) == 3
+
+    with transcript.open("a") as f:
+        f.write(_line(_assistant("two")))
+    snapshot = index.snapshot(str(transcript))
+
+    assert snapshot.last_assistant_message == "two"
+    assert snapshot.title == "first"
+    assert len(parsed) == 4
+    # An unchanged file costs no parsing at all.
+    index.snapshot(str(transcript))
+    assert len(parsed) == 4
+
+
+def test_partial_trailing_line_is_finished_by_later_append(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    complete = _line(_assistant("done"))
+    partial = _line(_assistant("streaming answer"))
+    transcript.write_text(complete + partial[:20])
+    index = TranscriptIndex()
+
+    assert index.snapshot(str(transcript)).last_assistant_message == "done"
+
+    with transcript.open("a") as f:
+        f.write(partial[20:])
+    snapshot = index.snapshot(str(transcript))
+
+    assert snapshot.last_assistant_message == "streaming answer"
+    assert snapshot.size == len((complete + partial).encode())
+
+
+def test_unterminated_final_line_is_reported_without_being_committed(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("one")) + json.dumps(_assistant("two")))
+    index = TranscriptIndex()
+
+    assert index.snapshot(str(transcript)).last_assistant_message == "two"
+    with transcript.open("a") as f:
+        f.write("\n" + _line(_assistant("three")))
+    assert index.snapshot(str(transcript)).last_assistant_message == "three"
+
+
+def test_same_size_rewrite_rescans(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line({"type": "custom-title", "customTitle": "aaaa"}))
+    index = TranscriptIndex()
+    assert index.snapshot(str(transcript)).title == "aaaa"
+
+    stat = transcript.stat()
+    transcript.write_text(_line({"type": "custom-title", "customTitle": "bbbb"}))
+    os.utime(transcript, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert index.snapshot(str(transcript)).title == "bbbb"
+
+
+def test_growing_rewrite_is_detected_by_boundary_probe(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("original")))
+    index = TranscriptIndex()
+    assert index.snapshot(str(transcript)).last_assistant_message == "original"
+
+    transcript.write_text(_line(_assistant("replaced")) + _line(_user("later")))
+    snapshot = index.snapshot(str(transcript))
+
+    assert snapshot.last_assistant_message == "replaced"
+
+
+def test_truncation_rescans_from_start(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("one")) + _line(_assistant("two")))
+    index = TranscriptIndex()
+    assert index.snapshot(str(transcript)).last_assistant_message == "two"
+
+    transcript.write_text(_line(_user("fresh")))
+    snapshot = index.snapshot(str(transcript))
+
+    assert snapshot.has_assistant is False
+    assert snapshot.last_assistant_message is None
+
+
+def test_inode_replacement_rescans(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line({"type": "agent-name", "agentName": "old"}))
+    index = TranscriptIndex()
+    assert index.snapshot(str(transcript)).title == "old"
+
+    replacement = tmp_path / "replacement.jsonl"
+    replacement.write_text(
+        _line({"type": "agent-name", "agentName": "new"}) + _line(_assistant("after replace"))
+    )
+    os.replace(replacement, transcript)
+    snapshot = index.snapshot(str(transcript))
+
+    assert snapshot.title == "new"
+    assert snapshot.last_assistant_message == "after replace"
+
+
+def test_empty_newest_assistant_reports_none(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("older")) + _line(_assistant("   ")))
+    snapshot = TranscriptIndex().snapshot(str(transcript))
+
+    assert snapshot.last_assistant_message is None
+    assert snapshot.last_nonempty_assistant_message == "older"
+
+
+def test_user_text_end_offset_returns_newest_match(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    first = _line(_user("repeat"))
+    middle = _line(_assistant("reply"))
+    second = _line(_user("repeat"))
+    transcript.write_text(first + middle + second + _line(_assistant("reply two")))
+    index = TranscriptIndex()
+
+    offset = index.user_text_end_offset(str(transcript), hash_transcript_text("repeat"))
+
+    assert offset == len((first + middle + second).encode())
+    assert index.user_text_end_offset(str(transcript), hash_transcript_text("missing")) is None
+
+
+def test_lru_evicts_oldest_transcript(tmp_path):
+    index = TranscriptIndex(max_entries=2)
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_text(_line(_assistant(name)))
+        index.snapshot(str(path))
+
+    assert index.stats()["entries"] == 2
+    assert str(tmp_path / "a.jsonl") not in index._states
+
+
+def _full_scan_outputs(transcript_path, turn) -> list[ClaudeAssistantOutput]:
+    """Reference implementation: the pre-index whole-file scan."""
+    data = transcript_path.read_bytes()
+    outputs = []
+    line_start = 0
+    for line_number, raw_line in enumerate(data.splitlines(), start=1):
+        absolute_offset = line_start
+        line_start += len(raw_line) + 1
+        if not raw_line.strip():
+            continue
+        try:
+            entry = json.loads(raw_line.decode("utf-8"))
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(entry, dict) or entry.get("type") != "assistant":
+            continue
+        completed_at = _parse_datetime(str(entry.get("timestamp")) if entry.get("timestamp") else None)
+        if completed_at is None or completed_at < turn.delivered_at:
+            continue
+        text = _extract_visible_assistant_text(entry)
+        if not text:
+            continue
+        outputs.append(
+            ClaudeAssistantOutput(
+                assistant_message_id=_assistant_message_id(entry, absolute_offset, text),
+                text=text,
+                completed_at=completed_at,
+                line_start_offset=absolute_offset,
+                line_number=line_number,
+            )
+        )
+    return outputs
+
+
+def test_collector_without_offset_matches_full_scan(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(
+        _line(_user("old prompt"))
+        + _line(_assistant("before", "2026-01-01T00:00:00Z"))
+        + "\n"
+        + "not json\n"
+        + _line(_user("new prompt"))
+        + _line(_assistant("after one", "2026-01-01T00:05:00Z"))
+        + _line(_assistant("late but earlier stamp", "2026-01-01T00:01:00Z"))
+        + _line(_assistant("after two", "2026-01-01T00:06:00+00:00"))
+    )
+    turn = InboundTurn(
+        inbound_id="in-1",
+        session_id="sess",
+        source="telegram",
+        provider="claude",
+        delivered_at=datetime(2026, 1, 1, 0, 2, tzinfo=timezone.utc),
+        transcript_path=str(transcript),
+        transcript_offset=None,
+    )
+
+    outputs = collect_claude_assistant_outputs_after_turn(str(transcript), turn)
+
+    assert outputs == _full_scan_outputs(transcript, turn)
+    assert [output.text for output in outputs] == ["after one", "after two"]
+
+
+def test_reverse_reader_stitches_lines_across_blocks(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    lines = [_line(_assistant("x" * size)) for size in (5, 40, 3, 90)]
+    transcript.write_text("".join(lines) + '{"partial')
+
+    yielded = list(iter_lines_reverse(transcript, block_size=7))
+
+    assert [raw for _, raw in yielded] == [b'{"partial'] + [
+        line.rstrip("\n").encode() for line in reversed(lines)
+    ]
+    data = transcript.read_bytes()
+    for offset, raw in yielded:
+        assert data[offset:offset + len(raw)] == raw
+
+
+def test_tail_reads_only_back_to_last_assistant(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(
+        _line({"type": "custom-title", "customTitle": "old"})
+        + _line(_assistant("earlier"))
+        + _line(_assistant("latest"))
+        + _line(_user("follow-up"))
+    )
+
+    tail = read_transcript_tail(transcript, block_size=16)
+
+    assert tail.assistant_found is True
+    assert tail.last_assistant_message == "latest"
+    # The title sits before the newest assistant, so it was never read.
+    assert tail.title_found is False
+    assert tail.native_title is None
+
+
+def test_tail_reports_title_after_last_assistant(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(
+        _line(_assistant("answer")) + _line({"type": "agent-name", "agentName": "worker"})
+    )
+
+    tail = read_transcript_tail(transcript)
+
+    assert tail.title_found is True
+    assert tail.native_title == "worker"
+    assert tail.last_assistant_message == "answer"
+
+
+def test_tail_empty_newest_assistant(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("older")) + _line(_assistant("  ")))
+
+    assert read_transcript_tail(transcript).last_assistant_message is None
+    assert (
+        read_transcript_tail(transcript, skip_empty_assistant=True).last_assistant_message
+        == "older"
+    )
+
+
+def test_peek_only_refreshes_indexed_transcripts(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text(_line(_assistant("one")))
+    index = TranscriptIndex()
+
+    assert index.peek(str(transcript)) is None
+    index.snapshot(str(transcript))
+    with transcript.open("a") as f:
+        f.write(_line(_assistant("two")))
+    assert index.peek(str(transcript)).last_assistant_message == "two"
@@ -9,6 +9,7 @@ from src.cli import watch_tui
 from src.cli.watch_tui import (
     DetailFetchWorker,
     DetailSnapshot,
+    SessionEventWorker,
     _TERMINAL_RESET_SEQUENCE,
     _attach_tmux,
     _codex_projection_enabled,
@@ -25,6 +26,7 @@ from src.cli.watch_tui import (
     _resolve_tmux_attach_target,
     _session_line,
     _tmux_attach_command,
+    apply_session_deltas,
     build_restore_rows,
     build_watch_rows,
     can_attach_session,
@@ -1116,3 +1118,114 @@ def test_can_attach_session_supports_tmux_backed_codex_only():
     assert can_attach_session(_session("c1", "codex", "/tmp", provider="codex"))
     assert can_attach_session(_session("f1", "fork", "/tmp", provider="codex-fork"))
     assert not can_attach_session(_session("a1", "app", "/tmp", provider="codex-app"))
+
+
+def _delta(session_id: str, change: str = "updated", kinds=None, **fields):
+    return {"session_id": session_id, "change": change, "kinds": kinds or [], "fields": fields}
+
+
+def test_apply_session_deltas_patches_fields_in_new_dicts():
+    original = _session("s1", "agent", "/tmp/repo")
+    other = _session("s2", "other", "/tmp/repo")
+
+    patched, changed, needs_refresh = apply_session_deltas(
+        [original, other],
+        [_delta("s1", kinds=["activity", "renamed"], activity_state="thinking", friendly_name="builder")],
+    )
+
+    assert changed == {"s1"}
+    assert needs_refresh is False
+    assert patched[0] is not original
+    assert patched[0]["friendly_name"] == "builder"
+    assert patched[0]["activity_state"] == "thinking"
+    assert patched[1] is other
+
+
+def test_apply_session_deltas_relists_for_creates_and_kills_and_drops_removed():
+    sessions = [_session("s1", "agent", "/tmp/repo"), _session("s2", "other", "/tmp/repo")]
+
+    patched, changed, needs_refresh = apply_session_deltas(
+        sessions,
+        [
+            _delta("s3", change="created", kinds=["created"]),
+            _delta("s1", kinds=["status", "killed"], status="stopped"),
+            _delta("s2", change="removed", kinds=["removed"]),
+        ],
+    )
+
+    assert needs_refresh is True
+    assert changed == {"s2"}
+    assert [s["id"] for s in patched] == ["s1"]
+
+
+def test_build_rows_reuses_cached_rows_for_unchanged_sessions():
+    sessions = [_session("s1", "agent-1", "/tmp/repo"), _session("s2", "agent-2", "/tmp/repo")]
+    row_cache: dict = {}
+    first, _, _ = build_watch_rows(sessions, row_cache=row_cache, clock=100)
+
+    sessions, _, _ = apply_session_deltas(sessions, [_delta("s2", friendly_name="renamed")])
+    second, selectable, _ = build_watch_rows(sessions, row_cache=row_cache, clock=100)
+
+    first_by_id = {row.session_id: row for row in first if row.kind == "session"}
+    second_by_id = {row.session_id: row for row in second if row.kind == "session"}
+    assert second_by_id["s1"] is first_by_id["s1"]
+    assert second_by_id["s2"] is not first_by_id["s2"]
+    assert second_by_id["s2"].columns["Session"].endswith("renamed")
+    assert selectable == ["s1", "s2"]
+
+    build_watch_rows(sessions[:1], row_cache=row_cache, clock=100)
+    assert set(row_cache) == {"s1"}
+
+
+class _StreamClient:
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.cursors = []
+
+    def stream_events(self, last_event_id=None):
+        self.cursors.append(last_event_id)
+        if not self.streams:
+            raise OSError("connection refused")
+        yield from self.streams.pop(0)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_session_event_worker_queues_deltas_and_resumes_from_last_id():
+    client = _StreamClient(
+        [
+            {"event": "hello", "id": None, "data": {"session_event_id": "e-0"}},
+            {"event": "session_delta", "id": "e-1", "data": _delta("s1", friendly_name="x")},
+        ],
+    )
+    worker = SessionEventWorker(client, retry_seconds=0.01)
+    try:
+        assert _wait_for(lambda: len(client.cursors) >= 2)
+    finally:
+        worker.stop()
+
+    deltas, resync = worker.drain()
+    assert resync is True  # first connect re-lists to align with the cursor
+    assert deltas == [_delta("s1", friendly_name="x")]
+    assert client.cursors[:2] == [None, "e-1"]
+    assert worker.connected is False
+    assert worker.drain() == ([], False)
+
+
+def test_session_event_worker_stays_on_polling_without_session_deltas():
+    client = _StreamClient([{"event": "hello", "id": None, "data": {"event_stream": True}}])
+    worker = SessionEventWorker(client, retry_seconds=0.01)
+    try:
+        assert _wait_for(lambda: not worker._thread.is_alive())
+    finally:
+        worker.stop()
+
+    assert client.cursors == [None]
+    assert worker.connected is False